@@ -0,0 +1,97 @@
+"""Array-backed state for first-order target components.
+
+A bank stores the target, value, and time constant of many
+``FirstOrderTargetComponent`` objects in contiguous float64 arrays and advances
+them with one vectorized step. Bound components remain thin views onto their
+slot, so ``current_value()`` and ``set_target()`` keep working unchanged.
+The value array may be supplied by the caller, typically a slice of a
+``ValueStore``, in which case the bank advances it in place.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from core.simulator import (
+    FirstOrderTargetComponent,
+    IntegrationMode,
+    first_order_alpha,
+    first_order_mean,
+)
+
+
+class FirstOrderBank:
+    """Vectorized first-order response for a fixed set of components."""
+
+    def __init__(
+        self,
+        components: Sequence[FirstOrderTargetComponent],
+        integration: IntegrationMode = IntegrationMode.EULER,
+        *,
+        value: np.ndarray | None = None,
+    ) -> None:
+        self.components = tuple(components)
+        self.integration = IntegrationMode(integration)
+        size = len(self.components)
+        self.target = np.empty(size, dtype=np.float64)
+        if value is not None and value.shape != (size,):
+            raise ValueError("Value array must have one slot per component.")
+        self.value = np.empty(size, dtype=np.float64) if value is None else value
+        self.start = np.empty(size, dtype=np.float64)
+        self.tau = np.empty(size, dtype=np.float64)
+        self._alpha = np.empty(size, dtype=np.float64)
+        self._delta = np.empty(size, dtype=np.float64)
+        self._alpha_dt: float | None = None
+        for index, component in enumerate(self.components):
+            self.target[index] = component.target
+            self.value[index] = component.current_value()
+            self.tau[index] = component.tau
+            component.integration = self.integration
+            component.bind(self, index)
+        self.start[:] = self.value
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def step(self, dt: float) -> None:
+        """Advance every bound component by ``dt`` seconds."""
+        if not self.components:
+            return
+        dt = max(float(dt), 0.0)
+        if dt != self._alpha_dt:
+            if self.integration is IntegrationMode.EXACT:
+                np.divide(-dt, self.tau, out=self._alpha)
+                np.expm1(self._alpha, out=self._alpha)
+                np.negative(self._alpha, out=self._alpha)
+            else:
+                np.divide(dt, self.tau, out=self._alpha)
+                np.minimum(self._alpha, 1.0, out=self._alpha)
+            self._alpha_dt = dt
+        np.copyto(self.start, self.value)
+        np.subtract(self.target, self.value, out=self._delta)
+        self._delta *= self._alpha
+        self.value += self._delta
+
+    def step_one(self, index: int, dt: float) -> None:
+        """Advance a single slot, for callers that update one component directly."""
+        dt = max(float(dt), 0.0)
+        alpha = first_order_alpha(dt, float(self.tau[index]), self.integration)
+        self.start[index] = self.value[index]
+        self.value[index] += (self.target[index] - self.value[index]) * alpha
+
+    def mean_over(self, index: int, start: float, stop: float) -> float:
+        """Exact average of one slot between two offsets into the last step."""
+        return first_order_mean(
+            float(self.start[index]),
+            float(self.target[index]),
+            float(self.tau[index]),
+            start,
+            stop,
+        )
+
+    def release(self) -> None:
+        """Copy state back into the components and detach them from the bank."""
+        for component in self.components:
+            component.unbind()
@@ -13,7 +13,7 @@ from domain.models import ConfiguredModel
 # We include a superset of columns so the template is stable and re-usable across types.
 MODEL_FIELDNAMES = [
     # core
-    "name", "type", "tag", "active", "fidelity",
+    "name", "type", "tag", "active", "fidelity", "update_period_ms",
     # inputs (linkages)
     "inputs.inlet_flow", "inputs.outlet_flow", "inputs.control", "inputs.flow_path",
     # common params
@@ -79,6 +79,7 @@ def _model_to_rows(models: Iterable[ConfiguredModel]) -> Iterable[Dict[str, str]
             "tag": m.tag,
             "active": str(bool(m.active)),
             "fidelity": str(m.fidelity),
+            "update_period_ms": str(m.update_period_ms),
         }
         # Inputs
         row["inputs.inlet_flow"]  = m.inputs.get("inlet_flow", "")
@@ -102,6 +103,7 @@ def _row_to_model(row: Dict[str, str]) -> ConfiguredModel:
     tag = row.get("tag", "").strip()
     active = _parse_bool(row.get("active", "True"))
     fidelity = _parse_int_or_str(row.get("fidelity", "0"))
+    update_period = _parse_float(row.get("update_period_ms") or "0")
 
     # Inputs
     inputs = {}
@@ -126,6 +128,7 @@ def _row_to_model(row: Dict[str, str]) -> ConfiguredModel:
         tag=tag,
         active=active,
         fidelity=fidelity,
+        update_period_ms=max(int(update_period or 0), 0),
         inputs=inputs,
         params=params,
     )
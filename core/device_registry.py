@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from domain.models import DeviceRecord
-from domain.plantpax_definitions import DeviceCategory, definition_for
+from domain.plantpax_definitions import DeviceCategory, MemberClass, PlantPaxDeviceDefinition, definition_for
+from core.symbols import SymbolTable
 
 
 @dataclass(slots=True)
@@ -19,13 +20,52 @@ class AnalogState:
     eu_max: float | None = None
 
 
+def _as_bool(raw: Any) -> bool:
+    return bool(raw) if raw is not None else False
+
+
+def _as_float(raw: Any) -> float | None:
+    try:
+        return None if raw is None else float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class _ReadBinding:
+    tag: str
+    state: ValveState | AnalogState
+    member: str
+    convert: Callable[[Any], Any]
+    valve_id: int = -1
+
+
 class DeviceRegistry:
-    """Runtime view of persisted devices and their latest PLC state."""
+    """Runtime view of persisted devices and their latest PLC state.
 
-    def __init__(self, devices: Iterable[DeviceRecord] = ()) -> None:
+    ``rebuild()`` compiles a read plan: the deduplicated tag tuple to scan and a
+    flat list of bindings from tag to state attribute. ``apply_values`` walks the
+    bindings, so a tag missing from a read result resets its state as before.
+
+    The plan is split by ``MemberClass``: ``SCAN`` members (values, valve status)
+    are read every tick, ``CONFIG`` members (EU ranges) only on connect and on a
+    slow cadence chosen by the caller.
+
+    Valves are keyed by their id in ``symbols``. Transitions are collected into
+    a changed set of ids that consumers drain with ``take_changed_valves()``;
+    ``generation`` increments on every ``rebuild()`` so they know when to start
+    over from a full evaluation.
+    """
+
+    def __init__(self, devices: Iterable[DeviceRecord] = (), *, symbols: SymbolTable | None = None) -> None:
+        self.symbols = symbols if symbols is not None else SymbolTable()
         self._devices: dict[str, DeviceRecord] = {}
-        self._valves: dict[str, ValveState] = {}
+        self._valves: dict[int, ValveState] = {}
         self._analogs: dict[str, AnalogState] = {}
+        self._read_tags: dict[MemberClass, tuple[str, ...]] = {}
+        self._bindings: dict[MemberClass, tuple[_ReadBinding, ...]] = {}
+        self._changed_valves: set[int] = set()
+        self.generation = 0
         self.rebuild(devices)
 
     def rebuild(self, devices: Iterable[DeviceRecord]) -> None:
@@ -36,52 +76,100 @@ class DeviceRegistry:
             key = device.name.casefold()
             self._devices[key] = device
             if device.category == DeviceCategory.VALVE.value:
-                self._valves[key] = ValveState()
+                self._valves[self.symbols.intern(device.name)] = ValveState()
             elif device.category in {
                 DeviceCategory.PROCESS_VARIABLE.value,
                 DeviceCategory.CONTROL_VARIABLE.value,
                 DeviceCategory.PUMP.value,
             }:
                 self._analogs[key] = AnalogState()
+        self._compile_read_plan()
+        self._changed_valves.clear()
+        self.generation += 1
 
-    def required_read_tags(self) -> list[str]:
-        tags: list[str] = []
-        for device in self._devices.values():
-            definition = definition_for(device.data_type)
-            if definition is None:
-                continue
-            tags.extend(definition.tag(device.controller_path, member) for member in definition.read_members)
-        return list(dict.fromkeys(tags))
+    def _compile_read_plan(self) -> None:
+        tags: dict[MemberClass, list[str]] = {member_class: [] for member_class in MemberClass}
+        bindings: dict[MemberClass, list[_ReadBinding]] = {member_class: [] for member_class in MemberClass}
+
+        def bind(
+            definition: PlantPaxDeviceDefinition,
+            device: DeviceRecord,
+            state: ValveState | AnalogState,
+            member: str,
+            convert: Callable[[Any], Any],
+            valve_id: int = -1,
+        ) -> None:
+            tag = definition.tag(device.controller_path, member)
+            bindings[definition.member_class(member)].append(_ReadBinding(tag, state, member, convert, valve_id))
 
-    def apply_values(self, values: dict[str, Any]) -> None:
         for key, device in self._devices.items():
             definition = definition_for(device.data_type)
             if definition is None:
                 continue
-            if key in self._valves:
-                tag = definition.tag(device.controller_path, "is_open")
-                self._valves[key].is_open = bool(values.get(tag, False))
+            for member in definition.read_members:
+                tags[definition.member_class(member)].append(definition.tag(device.controller_path, member))
+            valve_id = self.symbols.id_of(device.name)
+            if valve_id is not None and valve_id in self._valves:
+                if "is_open" in definition.read_members:
+                    bind(definition, device, self._valves[valve_id], "is_open", _as_bool, valve_id)
                 continue
             state = self._analogs.get(key)
             if state is None:
                 continue
             for member in ("value", "eu_min", "eu_max"):
-                if member not in definition.read_members:
-                    continue
-                raw = values.get(definition.tag(device.controller_path, member))
-                try:
-                    setattr(state, member, None if raw is None else float(raw))
-                except (TypeError, ValueError):
-                    setattr(state, member, None)
+                if member in definition.read_members:
+                    bind(definition, device, state, member, _as_float)
+        self._read_tags = {member_class: tuple(dict.fromkeys(items)) for member_class, items in tags.items()}
+        self._bindings = {member_class: tuple(items) for member_class, items in bindings.items()}
+
+    @property
+    def read_tags(self) -> tuple[str, ...]:
+        """Per-scan tags, compiled at ``rebuild()``."""
+        return self._read_tags[MemberClass.SCAN]
+
+    @property
+    def config_tags(self) -> tuple[str, ...]:
+        """Slow-changing configuration tags such as EU ranges."""
+        return self._read_tags[MemberClass.CONFIG]
+
+    def required_read_tags(self) -> list[str]:
+        return list(dict.fromkeys([*self.read_tags, *self.config_tags]))
+
+    def apply_values(self, values: dict[str, Any], member_class: MemberClass | None = None) -> None:
+        """Apply a read result to the members of ``member_class`` (all members by default)."""
+        classes = MemberClass if member_class is None else (member_class,)
+        get = values.get
+        changed = self._changed_valves
+        for item in classes:
+            for binding in self._bindings[item]:
+                value = binding.convert(get(binding.tag))
+                if binding.valve_id >= 0 and binding.state.is_open != value:
+                    changed.add(binding.valve_id)
+                setattr(binding.state, binding.member, value)
+
+    def take_changed_valves(self) -> set[int]:
+        """Return and clear the symbol ids of valves that changed state."""
+        changed, self._changed_valves = self._changed_valves, set()
+        return changed
+
+    def eu_range(self, name: str) -> tuple[float | None, float | None]:
+        state = self._analogs.get(name.casefold())
+        return (None, None) if state is None else (state.eu_min, state.eu_max)
 
     def set_valve_open(self, name: str, is_open: bool) -> None:
         """Offline/test helper for setting a valve state without a PLC."""
-        state = self._valves.get(name.casefold())
-        if state is not None:
+        symbol = self.symbols.id_of(name)
+        state = self._valves.get(symbol) if symbol is not None else None
+        if state is not None and state.is_open != bool(is_open):
             state.is_open = bool(is_open)
+            self._changed_valves.add(symbol)
 
     def is_valve_open(self, name: str) -> bool:
-        state = self._valves.get(name.casefold())
+        symbol = self.symbols.id_of(name)
+        return symbol is not None and self.is_valve_open_id(symbol)
+
+    def is_valve_open_id(self, symbol: int) -> bool:
+        state = self._valves.get(symbol)
         return bool(state and state.is_open)
 
     def value(self, name: str) -> float | None:
@@ -0,0 +1,183 @@
+"""Headless simulation runs without Qt: faster than real time or on a plain thread."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+from core.device_registry import DeviceRegistry
+from core.flow_path_runtime import FlowPathRuntime
+from core.scheduling import CatchUpPolicy, TickScheduler
+from core.sim_component_factory import ReadValue, SimulationBuild, build_simulation
+from core.simulator import IntegrationMode
+from domain.models import ConfiguredModel, DeviceRecord, FlowPath
+from persistence.project_store import ProjectStore
+
+
+@dataclass(slots=True)
+class RunResult:
+    """Recorded trajectories: ``values[i, j]`` is signal ``names[j]`` at ``times[i]``."""
+
+    times: np.ndarray
+    names: tuple[str, ...]
+    values: np.ndarray
+
+    def trajectory(self, name: str) -> np.ndarray:
+        return self.values[:, self.names.index(name)]
+
+    def final_values(self) -> dict[str, float]:
+        if not len(self.times):
+            return {}
+        return {name: float(value) for name, value in zip(self.names, self.values[-1])}
+
+
+def run(
+    project: ProjectStore | Iterable[ConfiguredModel],
+    duration: float,
+    dt: float,
+    *,
+    integration: IntegrationMode = IntegrationMode.EULER,
+    read_value: ReadValue | None = None,
+    valve_states: Mapping[str, bool] | None = None,
+    record_every: int = 1,
+) -> RunResult:
+    """Step a project for ``duration`` simulated seconds as fast as possible.
+
+    ``project`` is a ``ProjectStore`` (models, devices and flow paths) or a plain
+    model list. ``dt`` is the base tick; models with an ``update_period_ms`` run
+    in their rate group. There is no PLC: external values come from
+    ``read_value`` and valves from ``valve_states``. Invalid models raise
+    ``ValueError``.
+    """
+    if dt <= 0.0:
+        raise ValueError("Time step must be greater than zero.")
+    if duration < 0.0:
+        raise ValueError("Duration cannot be negative.")
+    record_every = max(int(record_every), 1)
+
+    build, paths = _prepare(project, dt, integration, valve_states)
+    steps = int(round(duration / dt))
+    orchestrator = build.orchestrator
+    store = orchestrator.values
+    names = store.names
+    samples = steps // record_every + 1
+    times = np.empty(samples, dtype=np.float64)
+    values = np.empty((samples, len(names)), dtype=np.float64)
+
+    def record(row: int, step: int) -> None:
+        times[row] = step * dt
+        values[row] = store.values
+
+    record(0, 0)
+    for step in range(1, steps + 1):
+        orchestrator.update(dt, read_value=read_value, path_flags=paths.open_flags)
+        if step % record_every == 0:
+            record(step // record_every, step)
+
+    return RunResult(times=times, names=names, values=values)
+
+
+class BackgroundRunner:
+    """Run a project in real time on a plain thread and publish value snapshots.
+
+    This is the headless counterpart of a threaded ``SimulationManager``: no Qt
+    event loop is needed. ``on_values`` is called from the runner thread after
+    every step; ``snapshot()`` can be polled from any thread instead.
+    """
+
+    def __init__(
+        self,
+        project: ProjectStore | Iterable[ConfiguredModel],
+        interval: float,
+        *,
+        integration: IntegrationMode = IntegrationMode.EULER,
+        read_value: ReadValue | None = None,
+        valve_states: Mapping[str, bool] | None = None,
+        on_values: Callable[[dict[str, float]], None] | None = None,
+        catch_up_policy: CatchUpPolicy = CatchUpPolicy.BURST,
+    ) -> None:
+        if interval <= 0.0:
+            raise ValueError("Interval must be greater than zero.")
+        self.interval = float(interval)
+        self.scheduler = TickScheduler(self.interval, policy=catch_up_policy)
+        self._build, self._paths = _prepare(project, self.interval, integration, valve_states)
+        self._read_value = read_value
+        self._on_values = on_values
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._snapshot: dict[str, float] = self._values()
+        self.steps = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="pySIMIO headless runtime", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._snapshot)
+
+    def _loop(self) -> None:
+        orchestrator = self._build.orchestrator
+        assert orchestrator is not None
+        self.scheduler.reset()
+        while not self._stop.wait(self.scheduler.time_until_due()):
+            steps = self.scheduler.poll()
+            if not steps:
+                continue
+            for dt in steps:
+                orchestrator.update(dt, read_value=self._read_value, path_flags=self._paths.open_flags)
+            self.steps += len(steps)
+            values = self._values()
+            with self._lock:
+                self._snapshot = values
+            if self._on_values is not None:
+                self._on_values(values)
+
+    def _values(self) -> dict[str, float]:
+        return self._build.orchestrator.values.snapshot()
+
+
+def _prepare(
+    project: ProjectStore | Iterable[ConfiguredModel],
+    dt: float,
+    integration: IntegrationMode,
+    valve_states: Mapping[str, bool] | None,
+) -> tuple[SimulationBuild, FlowPathRuntime]:
+    models, devices, flow_paths = _project_parts(project)
+    build = build_simulation(models, integration=integration, base_period=dt)
+    if not build.is_valid or build.orchestrator is None:
+        details = "; ".join(f"{name}: {', '.join(messages)}" for name, messages in build.errors.items())
+        raise ValueError(f"Simulation build failed: {details}")
+
+    symbols = build.orchestrator.symbols
+    registry = DeviceRegistry(devices, symbols=symbols)
+    for name, is_open in (valve_states or {}).items():
+        registry.set_valve_open(name, is_open)
+    paths = FlowPathRuntime(flow_paths, symbols=symbols)
+    paths.evaluate(registry)
+    return build, paths
+
+
+def _project_parts(
+    project: ProjectStore | Iterable[ConfiguredModel],
+) -> tuple[list[ConfiguredModel], list[DeviceRecord], list[FlowPath]]:
+    if isinstance(project, ProjectStore):
+        return project.get_models(), project.get_devices(), project.get_flow_paths()
+    return list(project), [], []
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from typing import Iterable
 
 from core.device_registry import DeviceRegistry
+from core.symbols import SymbolTable
 from domain.models import FlowPath
 
 
@@ -16,36 +17,112 @@ class FlowPathState:
 
 
 class FlowPathRuntime:
-    """Evaluate each path as open only when every listed valve is open."""
+    """Evaluate each path as open only when every listed valve is open.
 
-    def __init__(self, paths: Iterable[FlowPath] = ()) -> None:
-        self._paths: dict[str, FlowPath] = {}
-        self._states: dict[str, FlowPathState] = {}
+    Path and valve names are interned in ``symbols``, which must be the table of
+    the ``DeviceRegistry`` passed to ``evaluate`` (a different one is adopted on
+    the next full pass). ``rebuild()`` assigns each referenced valve a bit and
+    each path the mask of its valves, plus an inverted valve-to-paths index.
+    ``evaluate()`` then applies only the valves the registry reports as changed
+    and re-derives the states of the paths that contain them; a registry rebuild
+    forces a full pass. ``open_flags`` is indexed by path symbol id for callers
+    that resolved path names at build time.
+    """
+
+    def __init__(self, paths: Iterable[FlowPath] = (), *, symbols: SymbolTable | None = None) -> None:
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self._paths: dict[int, FlowPath] = {}
+        self._states: dict[int, FlowPathState] = {}
+        self._segments: dict[int, tuple[int, ...]] = {}
+        self._valve_bits: dict[int, int] = {}
+        self._masks: dict[int, int] = {}
+        self._paths_by_valve: dict[int, tuple[int, ...]] = {}
+        self._open_bits = 0
+        self._generation: int | None = None
+        self.open_flags: list[bool] = []
         self.rebuild(paths)
 
     def rebuild(self, paths: Iterable[FlowPath]) -> None:
-        self._paths = {path.name.casefold(): path for path in paths}
+        symbols = self.symbols
+        self._paths = {symbols.intern(path.name): path for path in paths}
         self._states.clear()
+        self._segments = {}
+        self._valve_bits = {}
+        self._masks = {}
+        by_valve: dict[int, list[int]] = {}
+        for path_id, path in self._paths.items():
+            segments = tuple(symbols.intern(segment) for segment in path.segments)
+            mask = 0
+            for valve in segments:
+                bit = self._valve_bits.setdefault(valve, len(self._valve_bits))
+                mask |= 1 << bit
+                members = by_valve.setdefault(valve, [])
+                if not members or members[-1] != path_id:
+                    members.append(path_id)
+            self._segments[path_id] = segments
+            self._masks[path_id] = mask
+        self._paths_by_valve = {valve: tuple(ids) for valve, ids in by_valve.items()}
+        self._open_bits = 0
+        self._generation = None
+        self.open_flags = [False] * len(symbols)
 
     def evaluate(self, devices: DeviceRegistry) -> dict[str, FlowPathState]:
-        states: dict[str, FlowPathState] = {}
-        for key, path in self._paths.items():
-            opened = tuple(name for name in path.segments if devices.is_valve_open(name))
-            closed = tuple(name for name in path.segments if not devices.is_valve_open(name))
-            states[key] = FlowPathState(
-                name=path.name,
-                is_open=bool(path.segments) and not closed,
-                open_valves=opened,
-                closed_valves=closed,
-            )
-        self._states = states
-        return dict(states)
+        """Bring path states up to date and return the re-evaluated ones by casefolded name."""
+        if devices.symbols is not self.symbols:
+            self.symbols = devices.symbols
+            self.rebuild(list(self._paths.values()))
+        if len(self.open_flags) < len(self.symbols):
+            self.open_flags.extend([False] * (len(self.symbols) - len(self.open_flags)))
+        changed = devices.take_changed_valves()
+        if self._generation != devices.generation:
+            self._generation = devices.generation
+            self._open_bits = 0
+            for valve, bit in self._valve_bits.items():
+                if devices.is_valve_open_id(valve):
+                    self._open_bits |= 1 << bit
+            affected: Iterable[int] = self._paths
+        else:
+            ids: set[int] = set()
+            for valve in changed:
+                bit = self._valve_bits.get(valve)
+                if bit is None:
+                    continue
+                if devices.is_valve_open_id(valve):
+                    self._open_bits |= 1 << bit
+                else:
+                    self._open_bits &= ~(1 << bit)
+                ids.update(self._paths_by_valve[valve])
+            affected = ids
+
+        updated: dict[str, FlowPathState] = {}
+        for path_id in affected:
+            state = self._states[path_id] = self._state_for(path_id)
+            self.open_flags[path_id] = state.is_open
+            updated[state.name.casefold()] = state
+        return updated
+
+    def _state_for(self, path_id: int) -> FlowPathState:
+        path = self._paths[path_id]
+        mask = self._masks[path_id]
+        open_bits = self._open_bits
+        bits = [self._valve_bits[valve] for valve in self._segments[path_id]]
+        opened = tuple(name for name, bit in zip(path.segments, bits) if open_bits >> bit & 1)
+        closed = tuple(name for name, bit in zip(path.segments, bits) if not open_bits >> bit & 1)
+        return FlowPathState(
+            name=path.name,
+            is_open=bool(mask) and (open_bits & mask) == mask,
+            open_valves=opened,
+            closed_valves=closed,
+        )
 
     def is_open(self, name: str) -> bool:
         if not name:
             return True
-        state = self._states.get(name.casefold())
-        return bool(state and state.is_open)
+        path_id = self.symbols.id_of(name)
+        return path_id is not None and self.is_open_id(path_id)
+
+    def is_open_id(self, path_id: int) -> bool:
+        return path_id < len(self.open_flags) and self.open_flags[path_id]
 
     def states(self) -> dict[str, FlowPathState]:
         return {state.name: state for state in self._states.values()}
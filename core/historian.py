@@ -0,0 +1,316 @@
+"""Fixed-memory history of every component value.
+
+The runtime records one row of values per tick. Each signal keeps a ring
+buffer of raw samples plus a pyramid of min/max levels, where every bucket of
+level ``k`` summarizes ``factor ** k`` raw samples in a ring of the same
+capacity. Memory is ``capacity * signals * (2 * levels - 1)`` floats however
+long the simulation runs, and each level reaches ``factor`` times further back
+than the one below it. With the defaults that is 7 float64 per signal per
+capacity row, about 112 KiB per signal or 573 MB for 5,000 signals; a
+``max_bytes`` budget lowers the capacity as signals are added instead.
+
+A query picks the finest level that covers the requested span without
+exceeding the point budget, then folds it into at most ``columns`` min/max
+buckets, so its cost depends on the plot width rather than on the span.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+DEFAULT_HISTORY_CAPACITY = 2048
+DEFAULT_DECIMATION = 8
+DEFAULT_LEVELS = 4
+
+
+@dataclass(slots=True, frozen=True)
+class TrendSeries:
+    """Min/max envelope of one signal over a time range.
+
+    Raw samples (``level == 0``) have equal ``minimum`` and ``maximum``.
+    """
+
+    name: str
+    times: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    level: int = 0
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+class _Ring:
+    """Timestamped rows of per-signal min/max in a fixed-size circular buffer."""
+
+    def __init__(self, capacity: int, signals: int, *, raw: bool) -> None:
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.high = np.full((capacity, signals), np.nan, dtype=np.float64)
+        # Raw samples are their own minimum, so the raw ring stores one array.
+        self.low = self.high if raw else np.full((capacity, signals), np.nan, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def append(self, timestamp: float, low: np.ndarray, high: np.ndarray) -> None:
+        head = self.head
+        self.times[head] = timestamp
+        self.high[head] = high
+        if self.low is not self.high:
+            self.low[head] = low
+        self.head = (head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    @property
+    def oldest(self) -> float | None:
+        if not self.count:
+            return None
+        return float(self.times[self.head if self.count == self.capacity else 0])
+
+    def segments(self) -> tuple[slice, ...]:
+        """Chronological slices of the filled rows."""
+        if self.count < self.capacity:
+            return (slice(0, self.count),)
+        return (slice(self.head, self.capacity), slice(0, self.head))
+
+    def window(self, start: float, stop: float) -> list[slice]:
+        """Slices of rows with ``start <= time <= stop``, oldest first."""
+        selected: list[slice] = []
+        for segment in self.segments():
+            times = self.times[segment]
+            first = int(np.searchsorted(times, start, side="left"))
+            last = int(np.searchsorted(times, stop, side="right"))
+            if first < last:
+                offset = segment.start
+                selected.append(slice(offset + first, offset + last))
+        return selected
+
+    def gather(self, start: float, stop: float, columns: list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copies of times, lows, and highs of ``columns`` between ``start`` and ``stop``."""
+        window = self.window(start, stop)
+        if not window:
+            empty = np.empty((0, len(columns)))
+            return np.empty(0), empty, empty
+        times = np.concatenate([self.times[part] for part in window])
+        high = np.concatenate([self.high[part][:, columns] for part in window])
+        low = high if self.low is self.high else np.concatenate([self.low[part][:, columns] for part in window])
+        return times, low, high
+
+    def remap(self, columns: list[int | None], capacity: int) -> None:
+        """Reorder signal columns into ``capacity`` rows, keeping the newest; ``None`` entries start empty."""
+        rows = np.concatenate([np.arange(part.start, part.stop) for part in self.segments()])[-capacity:]
+        times = np.zeros(capacity, dtype=np.float64)
+        times[: len(rows)] = self.times[rows]
+        raw = self.low is self.high
+        self.high = _remapped_rows(self.high, rows, columns, capacity)
+        self.low = self.high if raw else _remapped_rows(self.low, rows, columns, capacity)
+        self.times = times
+        self.capacity = capacity
+        self.count = len(rows)
+        self.head = self.count % capacity
+
+
+class Historian:
+    """Per-signal raw ring buffers with min/max decimation levels.
+
+    ``record`` takes a row aligned with ``names`` (for example a
+    ``ValueStore.values`` array). Recording and queries may run on different
+    threads.
+
+    With ``max_bytes`` the rings hold the largest power of two rows, up to
+    ``capacity``, that fits the budget for the current signal count; a change
+    of signals that moves it keeps the newest rows that still fit.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        *,
+        capacity: int = DEFAULT_HISTORY_CAPACITY,
+        factor: int = DEFAULT_DECIMATION,
+        levels: int = DEFAULT_LEVELS,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.max_capacity = max(int(capacity), 2)
+        self.max_bytes = None if max_bytes is None else max(int(max_bytes), 0)
+        self.factor = max(int(factor), 2)
+        self.levels = max(int(levels), 1)
+        self._lock = threading.Lock()
+        self._names: tuple[str, ...] = tuple(names)
+        self._index = {name: column for column, name in enumerate(self._names)}
+        self.capacity = self._capacity_for(len(self._names))
+        self._reset_storage()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self._names
+
+    def __len__(self) -> int:
+        """Raw samples currently held."""
+        return self._rings[0].count
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def set_signals(self, names: Iterable[str]) -> None:
+        """Change the recorded signals, keeping the history of names that remain."""
+        names = tuple(names)
+        with self._lock:
+            if names == self._names:
+                return
+            columns = [self._index.get(name) for name in names]
+            self.capacity = self._capacity_for(len(names))
+            # Ring by ring, so a change holds at most one extra ring array, not a second history.
+            for ring in self._rings:
+                ring.remap(columns, self.capacity)
+            self._partial_low = [_remapped(row, columns) for row in self._partial_low]
+            self._partial_high = [_remapped(row, columns) for row in self._partial_high]
+            self._names = names
+            self._index = {name: column for column, name in enumerate(names)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset_storage()
+
+    def record(self, timestamp: float, values: np.ndarray) -> None:
+        """Append one row of values aligned with ``names`` at ``timestamp`` seconds.
+
+        A timestamp older than the newest sample is clamped to it, so the row is
+        kept and every ring stays sorted for binary-searched range lookups.
+        """
+        with self._lock:
+            rings = self._rings
+            if rings[0].count:
+                timestamp = max(timestamp, float(rings[0].times[rings[0].head - 1]))
+            rings[0].append(timestamp, values, values)
+            low = high = values
+            for level in range(1, self.levels):
+                if not self._partial_count[level]:
+                    self._partial_time[level] = timestamp
+                    self._partial_low[level][:] = low
+                    self._partial_high[level][:] = high
+                else:
+                    np.fmin(self._partial_low[level], low, out=self._partial_low[level])
+                    np.fmax(self._partial_high[level], high, out=self._partial_high[level])
+                self._partial_count[level] += 1
+                if self._partial_count[level] < self.factor:
+                    break
+                low, high = self._partial_low[level], self._partial_high[level]
+                rings[level].append(self._partial_time[level], low, high)
+                self._partial_count[level] = 0
+
+    def span(self) -> tuple[float, float] | None:
+        """Oldest and newest recorded timestamps."""
+        with self._lock:
+            raw = self._rings[0]
+            if not raw.count:
+                return None
+            oldest = min(ring.oldest for ring in self._rings if ring.count)
+            return oldest, float(raw.times[raw.head - 1])
+
+    def latest(self, name: str) -> float | None:
+        with self._lock:
+            raw = self._rings[0]
+            column = self._index.get(name)
+            if column is None or not raw.count:
+                return None
+            value = float(raw.high[raw.head - 1, column])
+            return None if math.isnan(value) else value
+
+    def query(
+        self,
+        names: Iterable[str],
+        start: float,
+        stop: float,
+        columns: int,
+    ) -> dict[str, TrendSeries]:
+        """Min/max envelopes of ``names`` between ``start`` and ``stop``.
+
+        Each series has at most ``columns`` points. Unknown names are skipped.
+        """
+        columns = max(int(columns), 1)
+        with self._lock:
+            wanted = [(name, self._index[name]) for name in dict.fromkeys(names) if name in self._index]
+            if not wanted or stop < start:
+                return {}
+            level = self._level_for(start, stop, columns)
+            picks = [column for _, column in wanted]
+            times, low, high = self._rings[level].gather(start, stop, picks)
+            if level and self._partial_count[level] and start <= self._partial_time[level] <= stop:
+                # The bucket still filling at this level holds the newest samples.
+                times = np.append(times, self._partial_time[level])
+                low = np.vstack([low, self._partial_low[level][picks]])
+                high = np.vstack([high, self._partial_high[level][picks]])
+        times, low, high = fold_envelope(times, low, high, start, stop, columns)
+        return {
+            name: TrendSeries(name, times, low[:, position], high[:, position], level)
+            for position, (name, _) in enumerate(wanted)
+        }
+
+    def _level_for(self, start: float, stop: float, columns: int) -> int:
+        """Finest level holding the whole span within the point budget, else the coarsest filled one."""
+        budget = columns * self.factor
+        coarsest = 0
+        for level, ring in enumerate(self._rings):
+            if not ring.count:
+                break
+            coarsest = level
+            covers = ring.count < ring.capacity or ring.oldest <= start
+            if covers and sum(part.stop - part.start for part in ring.window(start, stop)) <= budget:
+                return level
+        return coarsest
+
+    def _capacity_for(self, signals: int) -> int:
+        if self.max_bytes is None or not signals:
+            return self.max_capacity
+        rows = self.max_bytes // (signals * (2 * self.levels - 1) * np.dtype(np.float64).itemsize)
+        # Whole powers of two, so adding or renaming a few signals rarely resizes.
+        return max(2, min(self.max_capacity, 1 << max(int(rows).bit_length() - 1, 1)))
+
+    def _reset_storage(self) -> None:
+        signals = len(self._names)
+        self._rings = [_Ring(self.capacity, signals, raw=level == 0) for level in range(self.levels)]
+        self._partial_low = [np.full(signals, np.nan) for _ in range(self.levels)]
+        self._partial_high = [np.full(signals, np.nan) for _ in range(self.levels)]
+        self._partial_time = [0.0] * self.levels
+        self._partial_count = [0] * self.levels
+
+
+def _remapped(array: np.ndarray, columns: list[int | None]) -> np.ndarray:
+    """Copy of ``array`` with its last axis reordered to ``columns``; ``None`` is NaN."""
+    fresh = np.full((*array.shape[:-1], len(columns)), np.nan, dtype=np.float64)
+    for new, old in enumerate(columns):
+        if old is not None:
+            fresh[..., new] = array[..., old]
+    return fresh
+
+
+def _remapped_rows(array: np.ndarray, rows: np.ndarray, columns: list[int | None], capacity: int) -> np.ndarray:
+    """``capacity`` rows holding ``array[rows]`` with columns reordered to ``columns``, copied column by column."""
+    fresh = np.full((capacity, len(columns)), np.nan, dtype=np.float64)
+    for new, old in enumerate(columns):
+        if old is not None:
+            fresh[: len(rows), new] = array[rows, old]
+    return fresh
+
+
+def fold_envelope(
+    times: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    start: float,
+    stop: float,
+    columns: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce rows to at most ``columns`` equal-width time buckets."""
+    if len(times) <= columns:
+        return times, low, high
+    width = (stop - start) / columns if stop > start else 1.0
+    buckets = np.minimum(((times - start) / width).astype(np.int64), columns - 1)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    return times[starts], np.fmin.reduceat(low, starts, axis=0), np.fmax.reduceat(high, starts, axis=0)
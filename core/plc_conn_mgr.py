@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Mapping
 
 from pycomm3 import LogixDriver, Tag
 
@@ -69,6 +69,21 @@ class PLCConnectionManager:
             logger.exception("Exception writing %s", tag)
             return False
 
+    def write_tags(self, values: Mapping[str, Any]) -> dict[str, bool]:
+        """Write many tags in one call so pycomm3 can pack them into multi-service requests."""
+        results = {tag: False for tag in values}
+        if not self.is_connected() or not results:
+            return results
+        try:
+            written = self.driver.write(*values.items())
+            if not isinstance(written, list):
+                written = [written]
+            for tag, result in zip(results, written):
+                results[tag] = bool(result and result.error is None)
+        except Exception:
+            logger.exception("Exception during batch write")
+        return results
+
     def get_metadata(self, base_tag: str) -> dict[str, Any]:
         suffixes = ("EU", "EUMin", "EUMax")
         values = self.read_tags([f"{base_tag}.{suffix}" for suffix in suffixes])
@@ -3,58 +3,239 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+from core.scheduling import due_level, rate_level
 
 
 logger = logging.getLogger(__name__)
 WriteValue = Callable[[str, float], bool | None]
+WriteValues = Callable[[dict[str, float]], Mapping[str, bool]]
 
+# Rewrite unchanged values at least this often so the PLC sees a live simulator.
+DEFAULT_MAX_AGE_S = 10.0
 
-class PlcSimBridge:
-    """Write registered simulation values only when a PLC writer is available."""
 
-    def __init__(self, write_fn: WriteValue | None = None) -> None:
+@dataclass(slots=True, frozen=True)
+class WriteDeadband:
+    """Minimum change before a value is rewritten.
+
+    ``absolute`` is in engineering units, ``percent`` is relative to the last
+    written value; the larger threshold applies. Both zero means change-only.
+    """
+
+    absolute: float = 0.0
+    percent: float = 0.0
+
+    def exceeded(self, previous: float, value: float) -> bool:
+        delta = abs(value - previous)
+        if delta == 0.0:
+            return False
+        threshold = max(self.absolute, abs(previous) * self.percent / 100.0)
+        return delta > threshold or delta != delta
+
+
+@dataclass(slots=True)
+class WriteBatch:
+    """Values collected for one bridge tick, with the writers current at the time."""
+
+    now: float
+    write_fn: WriteValue | None = None
+    batch_write_fn: WriteValues | None = None
+    values: dict[str, float] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Output:
+    tag: str
+    getter: Callable[[], float]
+    level: int
+    deadband: WriteDeadband | None
+    last_value: float | None = None
+    written_at: float = 0.0
+
+
+class PlcSimBridge:
+    """Write registered simulation values only when a PLC writer is available.
+
+    Values are only sent when they move beyond the tag's deadband since the last
+    successful write, or when that write is older than ``max_age_s``. With a
+    ``batch_write_fn`` the whole tick is flushed in one call with per-tag
+    results; otherwise ``write_fn`` is called once per tag.
+    """
+
+    def __init__(
+        self,
+        write_fn: WriteValue | None = None,
+        *,
+        batch_write_fn: WriteValues | None = None,
+        deadband: WriteDeadband = WriteDeadband(),
+        max_age_s: float | None = DEFAULT_MAX_AGE_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._write_fn = write_fn
-        self._sources: dict[str, Callable[[], float]] = {}
+        self._batch_write_fn = batch_write_fn
+        self.deadband = deadband
+        self.max_age_s = max_age_s
+        self._clock = clock
+        self._sources: dict[str, _Output] = {}
+        self._by_level: tuple[tuple[_Output, ...], ...] = ()
+        self._tick = 0
         self._running = False
 
     @property
     def is_available(self) -> bool:
-        return callable(self._write_fn)
+        return callable(self._write_fn) or callable(self._batch_write_fn)
 
-    def set_write_fn(self, write_fn: WriteValue | None) -> None:
+    def set_write_fn(
+        self,
+        write_fn: WriteValue | None,
+        batch_write_fn: WriteValues | None = None,
+    ) -> None:
         self._write_fn = write_fn
-
-    def register_source(self, tag: str, getter: Callable[[], float]) -> None:
+        self._batch_write_fn = batch_write_fn
+        self.invalidate()
+
+    def register_source(
+        self,
+        tag: str,
+        getter: Callable[[], float],
+        *,
+        divisor: int = 1,
+        level: int | None = None,
+        deadband: WriteDeadband | None = None,
+    ) -> None:
+        """Write ``tag`` every ``divisor`` bridge ticks (a harmonic rate-group divisor).
+
+        ``level`` gives the rate-group level directly, as compiled by the
+        orchestrator, and takes precedence over ``divisor``. ``deadband``
+        overrides the bridge-wide deadband for this tag.
+        """
         normalized = tag.strip()
         if normalized:
-            self._sources[normalized] = getter
+            group = rate_level(divisor) if level is None else max(int(level), 0)
+            self._sources[normalized] = _Output(normalized, getter, group, deadband)
+            self._by_level = ()
 
     def clear_sources(self) -> None:
         self._sources.clear()
+        self._by_level = ()
+        self._tick = 0
+
+    def invalidate(self) -> None:
+        """Forget last-written values so every source is written on its next tick."""
+        for output in self._sources.values():
+            output.last_value = None
 
     def start(self) -> None:
+        self.invalidate()
         self._running = True
 
     def stop(self) -> None:
         self._running = False
 
-    def tick(self) -> dict[str, bool]:
-        """Write one batch and return per-tag success without raising into the runtime."""
-        results: dict[str, bool] = {}
-        if not self._running or not self.is_available:
-            return results
+    def tick(self, level: int | None = None) -> dict[str, bool]:
+        """Write one batch and return per-tag success without raising into the runtime.
+
+        ``level`` is the highest rate-group level the caller just computed (the
+        orchestrator's due level), so slow groups are written in phase with the
+        steps that produce them. Without it the bridge counts its own ticks.
+        Tags held back by their deadband are omitted from the result.
+        """
+        batch = self.collect(level)
+        if batch is None:
+            return {}
+        results = self.write(batch)
+        self.commit(batch, results)
+        return results
 
-        assert self._write_fn is not None
-        for tag, getter in tuple(self._sources.items()):
+    def collect(self, level: int | None = None) -> WriteBatch | None:
+        """Pick the values due this tick; ``None`` when there is nothing to write.
+
+        ``collect``, ``write``, and ``commit`` split ``tick`` so a caller can do
+        the blocking ``write`` without holding its own lock.
+        """
+        if not self._running or not self.is_available:
+            return None
+        if not self._by_level and self._sources:
+            self._by_level = self._group_sources()
+        if not self._by_level:
+            return None
+        if level is None:
+            level = due_level(self._tick, len(self._by_level) - 1)
+            self._tick += 1
+        elif level < 0:
+            return None
+        due = self._by_level[min(level, len(self._by_level) - 1)]
+        batch = WriteBatch(now=self._clock(), write_fn=self._write_fn, batch_write_fn=self._batch_write_fn)
+        max_age = self.max_age_s
+        for output in due:
             try:
-                value = float(getter())
-                results[tag] = bool(self._write_fn(tag, value))
+                value = float(output.getter())
             except Exception:
-                logger.exception("PLC bridge write failed for %s", tag)
-                results[tag] = False
+                logger.exception("PLC bridge value read failed for %s", output.tag)
+                batch.failed.append(output.tag)
+                continue
+            previous = output.last_value
+            if (
+                previous is not None
+                and (max_age is None or batch.now - output.written_at < max_age)
+                and not (output.deadband or self.deadband).exceeded(previous, value)
+            ):
+                continue
+            batch.values[output.tag] = value
+        return batch
+
+    def write(self, batch: WriteBatch) -> dict[str, bool]:
+        """Send a collected batch; touches no bridge state, so it is safe to run unlocked."""
+        results = {tag: False for tag in batch.failed}
+        if batch.values:
+            results.update(_flush(batch.values, batch.write_fn, batch.batch_write_fn))
         return results
 
+    def commit(self, batch: WriteBatch, results: Mapping[str, bool]) -> None:
+        """Record successful writes for the deadband and heartbeat checks."""
+        for tag, value in batch.values.items():
+            output = self._sources.get(tag)
+            if output is not None and results.get(tag):
+                output.last_value = value
+                output.written_at = batch.now
+
+    def _group_sources(self) -> tuple[tuple[_Output, ...], ...]:
+        max_level = max(output.level for output in self._sources.values())
+        return tuple(
+            tuple(output for output in self._sources.values() if output.level <= level)
+            for level in range(max_level + 1)
+        )
+
+
+def _flush(
+    pending: dict[str, float],
+    write_fn: WriteValue | None,
+    batch_write_fn: WriteValues | None,
+) -> dict[str, bool]:
+    if callable(batch_write_fn):
+        try:
+            written = batch_write_fn(pending)
+        except Exception:
+            logger.exception("PLC bridge batch write failed")
+            written = {}
+        return {tag: bool(written.get(tag, False)) for tag in pending}
+
+    results: dict[str, bool] = {}
+    if not callable(write_fn):
+        return {tag: False for tag in pending}
+    for tag, value in pending.items():
+        try:
+            results[tag] = bool(write_fn(tag, value))
+        except Exception:
+            logger.exception("PLC bridge write failed for %s", tag)
+            results[tag] = False
+    return results
+
 
 def validate_plc_tags(plc, tags: list[str]) -> dict[str, bool]:
     results: dict[str, bool] = {}
@@ -0,0 +1,165 @@
+"""Tick scheduling: wall-clock pacing and harmonic rate groups.
+
+``TickScheduler`` turns timer callbacks into simulation steps based on
+``time.monotonic()``, so late timers do not make simulated time drift.
+
+Every model declares an update period. Periods are snapped to a power-of-two
+multiple of the base tick so rate groups are harmonic: a group with divisor
+``2**n`` is due exactly when the base tick counter is divisible by ``2**n``,
+and every slower group's ticks coincide with the faster ones. On any tick the
+due set is therefore "all groups up to some level", which lets callers keep one
+pre-ordered list per level instead of testing each item.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from enum import Enum
+from typing import Callable
+
+
+def harmonic_divisor(period_s: float, base_s: float) -> int:
+    """Largest power-of-two tick multiple that does not exceed ``period_s``."""
+    if base_s <= 0.0 or period_s <= base_s:
+        return 1
+    ratio = int(period_s / base_s + 1e-9)
+    return 1 << (ratio.bit_length() - 1)
+
+
+def rate_level(divisor: int) -> int:
+    """Rate-group level for a harmonic divisor (1 -> 0, 2 -> 1, 4 -> 2, ...)."""
+    return max(int(divisor), 1).bit_length() - 1
+
+
+def due_level(tick: int, max_level: int) -> int:
+    """Highest rate-group level due on base tick ``tick``; tick 0 runs every group."""
+    if tick == 0:
+        return max_level
+    return min((tick & -tick).bit_length() - 1, max_level)
+
+
+class RateGroups:
+    """Base tick counter plus per-level elapsed time since each group last ran."""
+
+    def __init__(self, max_level: int = 0) -> None:
+        self.max_level = max(int(max_level), 0)
+        self._tick = 0
+        self._elapsed = [0.0] * (self.max_level + 1)
+        self._last = [0.0] * (self.max_level + 1)
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick
+
+    def advance(self, dt: float) -> tuple[int, list[float]]:
+        """Count one base tick of ``dt`` seconds.
+
+        Returns the highest due level and, for every due level, the time elapsed
+        since that group last ran, which is the ``dt`` the group should step by.
+        """
+        level = due_level(self._tick, self.max_level)
+        self._tick += 1
+        elapsed = self._elapsed
+        for index in range(self.max_level + 1):
+            elapsed[index] += dt
+        due = elapsed[: level + 1]
+        for index in range(level + 1):
+            elapsed[index] = 0.0
+        self._last[: level + 1] = due
+        return level, due
+
+    def lag(self, level: int) -> tuple[float, float]:
+        """``(last step, time since)`` of a group: how long its last step was and how long ago it ended."""
+        level = min(max(level, 0), self.max_level)
+        return self._last[level], self._elapsed[level]
+
+    def reset(self) -> None:
+        self._tick = 0
+        self._elapsed = [0.0] * (self.max_level + 1)
+        self._last = [0.0] * (self.max_level + 1)
+
+
+class CatchUpPolicy(str, Enum):
+    """What a fixed-step scheduler does when it finds more than one step due.
+
+    ``BURST`` runs the missed steps back-to-back (up to ``max_catch_up``), so
+    simulated time keeps pace with wall time. ``SKIP`` runs one step and drops
+    the missed whole intervals but stays on the original tick grid. ``SLOW_DOWN``
+    runs one step and re-anchors the schedule on the current time, so simulated
+    time stretches under load instead of jumping.
+    """
+
+    BURST = "burst"
+    SKIP = "skip"
+    SLOW_DOWN = "slow_down"
+
+
+class TickScheduler:
+    """Convert timer callbacks into simulation step sizes from a monotonic clock.
+
+    With ``fixed_step`` every step is exactly ``interval`` seconds and elapsed
+    wall time decides how many steps are due; otherwise each poll yields one step
+    of the real elapsed time, capped at ``max_catch_up`` intervals.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        fixed_step: bool = True,
+        policy: CatchUpPolicy = CatchUpPolicy.BURST,
+        max_catch_up: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval <= 0.0:
+            raise ValueError("Interval must be greater than zero.")
+        self.interval = float(interval)
+        self.fixed_step = bool(fixed_step)
+        self.policy = CatchUpPolicy(policy)
+        self.max_catch_up = max(int(max_catch_up), 1)
+        self._clock = clock
+        self.overruns = 0
+        self.skipped_steps = 0
+        self._last = clock()
+        self._backlog = 0.0
+
+    def reset(self) -> None:
+        """Restart pacing from now, e.g. when the runtime starts."""
+        self._last = self._clock()
+        self._backlog = 0.0
+
+    def time_until_due(self) -> float:
+        """Seconds until the next full interval has elapsed, for sleeping loops."""
+        pending = self._backlog + self._clock() - self._last
+        return max(self.interval - pending, 0.0)
+
+    def poll(self) -> list[float]:
+        """Return the step sizes to run now (possibly none) and account for them."""
+        now = self._clock()
+        elapsed = max(now - self._last, 0.0)
+        self._last = now
+
+        if not self.fixed_step:
+            if elapsed >= 1.5 * self.interval:
+                self.overruns += 1
+            return [min(elapsed, self.max_catch_up * self.interval)] if elapsed > 0.0 else []
+
+        self._backlog += elapsed
+        # Round to the nearest interval so timer jitter around the deadline
+        # neither drops a step nor doubles one; the remainder carries over.
+        due = math.floor(self._backlog / self.interval + 0.5)
+        if due <= 0:
+            return []
+        if due > 1:
+            self.overruns += 1
+        if self.policy is CatchUpPolicy.BURST:
+            steps = min(due, self.max_catch_up)
+        else:
+            steps = 1
+        self.skipped_steps += due - steps
+        if self.policy is CatchUpPolicy.SLOW_DOWN:
+            self._backlog = 0.0
+        else:
+            self._backlog -= due * self.interval
+        return [self.interval] * steps
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Sequence
 
 from domain.models import ConfiguredModel
+from core.component_bank import FirstOrderBank
+from core.scheduling import RateGroups, harmonic_divisor, rate_level
 from core.simulation_validation import validate_model
+from core.symbols import SymbolTable
+from core.value_store import ValueStore
 from core.simulator import (
+    FirstOrderTargetComponent,
     FlowComponent,
+    IntegrationMode,
     LevelComponent,
     PressureComponent,
     Sensor,
@@ -18,6 +25,14 @@ from core.simulator import (
 
 ReadValue = Callable[[str], float | None]
 IsPathOpen = Callable[[str], bool]
+# Per-tick inputs indexed by symbol id: external tag values and flow path open flags.
+ExternalValues = Sequence[float | None]
+PathFlags = Sequence[bool]
+# Per inlet and outlet: offset into the source's last step, or None to read its held value.
+SourceShifts = tuple[tuple[float | None, ...], tuple[float | None, ...]]
+
+# Upper bound on level sub-steps per tick when a tank reaches a clamp in EXACT mode.
+MAX_LEVEL_SUBSTEPS = 64
 
 
 @dataclass(slots=True)
@@ -25,6 +40,7 @@ class SimulationBuild:
     components: dict[str, SimComponent] = field(default_factory=dict)
     orchestrator: "Orchestrator | None" = None
     errors: dict[str, list[str]] = field(default_factory=dict)
+    fingerprints: dict[str, str] = field(default_factory=dict)
 
     @property
     def is_valid(self) -> bool:
@@ -38,6 +54,19 @@ def _number(value, default: float) -> float:
         return float(default)
 
 
+def _shifted_mean(
+    sources: tuple[_Source, ...],
+    shifts: tuple[float | None, ...],
+    external: ExternalValues,
+    start: float,
+    stop: float,
+) -> float:
+    return sum(
+        source.read(external) if shift is None else source.mean(external, start + shift, stop + shift)
+        for source, shift in zip(sources, shifts)
+    )
+
+
 def _map_range(
     value: float,
     src_min: float,
@@ -98,7 +127,11 @@ def _normalized_control(value: float, minimum: float, maximum: float) -> float:
     return min(max((value - minimum) / (maximum - minimum), 0.0), 1.0)
 
 
-def build_sim_component(model: ConfiguredModel) -> SimComponent | None:
+def build_sim_component(
+    model: ConfiguredModel,
+    *,
+    integration: IntegrationMode = IntegrationMode.EULER,
+) -> SimComponent | None:
     model_type = (model.type or "None").strip().lower()
     params = model.params or {}
 
@@ -115,18 +148,21 @@ def build_sim_component(model: ConfiguredModel) -> SimComponent | None:
         return FlowComponent(
             model.name,
             tau=_number(params.get("tau"), 1.0),
+            integration=integration,
             initial=_number(params.get("initial"), 0.0),
         )
     if model_type == "pressure":
         return PressureComponent(
             model.name,
             tau=_number(params.get("tau"), 2.0),
+            integration=integration,
             initial=_number(params.get("initial"), 0.0),
         )
     if model_type == "temperature":
         return TemperatureComponent(
             model.name,
             tau=_number(params.get("tau"), 5.0),
+            integration=integration,
             initial=_number(params.get("initial"), 25.0),
         )
     if model_type == "level":
@@ -157,38 +193,166 @@ def build_sim_component(model: ConfiguredModel) -> SimComponent | None:
     raise TypeError(f"Unsupported model type: {model.type}")
 
 
-def build_simulation(models: Iterable[ConfiguredModel]) -> SimulationBuild:
+def seed_component(component: SimComponent, previous: SimComponent) -> None:
+    """Carry the live state of a replaced component of the same kind into its successor."""
+    if type(component) is not type(previous):
+        return
+    if isinstance(component, FirstOrderTargetComponent):
+        component.seed(previous.current_value(), previous.target)
+    elif isinstance(component, LevelComponent):
+        component.fill_fraction = previous.fill_fraction
+    elif isinstance(component, Sensor):
+        component.write(previous.current_value())
+
+
+def build_simulation(
+    models: Iterable[ConfiguredModel],
+    *,
+    integration: IntegrationMode = IntegrationMode.EULER,
+    base_period: float | None = None,
+    previous: SimulationBuild | None = None,
+    seed_state: bool = True,
+    symbols: SymbolTable | None = None,
+    model_fingerprints: Sequence[str] | None = None,
+) -> SimulationBuild:
+    """Build components and their orchestrator.
+
+    With ``previous``, models whose configuration is unchanged keep their live
+    component objects and compiled wiring; edited models get a new component,
+    seeded from the old one when ``seed_state`` is set, and only steps that read
+    a replaced component are rewired. ``previous`` must not be used afterwards.
+
+    ``symbols`` is the table external tags and flow paths are interned in. It
+    defaults to the previous build's table, which keeps compiled steps reusable.
+    ``model_fingerprints``, aligned with ``models``, saves re-hashing them.
+    """
     errors: dict[str, list[str]] = {}
     components: dict[str, SimComponent] = {}
+    fingerprints: dict[str, str] = {}
     valid_models: list[ConfiguredModel] = []
 
-    for model in models:
-        model_errors = validate_model(model)
-        if model_errors:
-            errors[model.name or "<unnamed>"] = model_errors
-            continue
-        component = build_sim_component(model)
+    old_orchestrator = previous.orchestrator if previous is not None else None
+    if old_orchestrator is not None:
+        old_orchestrator.release()
+        if old_orchestrator.integration is not IntegrationMode(integration):
+            previous = old_orchestrator = None
+    if symbols is None and old_orchestrator is not None:
+        symbols = old_orchestrator.symbols
+    old_components = previous.components if previous is not None else {}
+    old_fingerprints = previous.fingerprints if previous is not None else {}
+
+    model_list = list(models)
+    if model_fingerprints is None:
+        model_fingerprints = [model.fingerprint() for model in model_list]
+
+    for model, fingerprint in zip(model_list, model_fingerprints):
+        old = old_components.get(model.name)
+        if old is not None and old_fingerprints.get(model.name) == fingerprint:
+            # Unchanged since it last built, so it is still valid.
+            component: SimComponent | None = old
+        else:
+            model_errors = validate_model(model)
+            if model_errors:
+                errors[model.name or "<unnamed>"] = model_errors
+                continue
+            component = build_sim_component(model, integration=integration)
+            if component is not None and old is not None and seed_state:
+                seed_component(component, old)
         if component is not None:
             components[model.name] = component
+            fingerprints[model.name] = fingerprint
             valid_models.append(model)
 
     return SimulationBuild(
         components=components,
-        orchestrator=Orchestrator(valid_models, components),
+        orchestrator=Orchestrator(
+            valid_models,
+            components,
+            integration=integration,
+            base_period=base_period,
+            fingerprints=fingerprints,
+            previous=old_orchestrator,
+            symbols=symbols,
+        ),
         errors=errors,
+        fingerprints=fingerprints,
     )
 
 
 class Orchestrator:
-    """Single owner of component input wiring and deterministic update order."""
+    """Single owner of component input wiring and deterministic update order.
+
+    Model dictionaries are compiled once into slotted step records with parsed
+    numbers and pre-resolved sources, so ``update`` only performs arithmetic.
+    Flow, pressure, and temperature components share a ``FirstOrderBank``
+    per rate group and advance in a single vectorized step.
+
+    With a ``base_period`` (seconds per ``update`` call) each model runs in the
+    harmonic rate group matching its ``update_period_ms`` and is stepped by the
+    time elapsed since it last ran; without one every model runs every call.
+
+    With ``IntegrationMode.EXACT`` first-order components use the analytic step,
+    levels integrate the exact step-average of first-order inflows, and a level
+    that reaches its 0/capacity clamp is sub-stepped so large ticks stay accurate.
+
+    Given the ``previous`` orchestrator, a model's compiled step is reused when
+    its fingerprint, component, and every component it reads are unchanged.
+
+    Every component value is mirrored in ``values``, a ``ValueStore`` whose bank
+    slices are the banks' own value arrays; the remaining slots are refreshed at
+    the end of each ``update``.
+
+    External tags and flow paths are interned in ``symbols`` at compile time;
+    ``update`` takes their values and open flags as sequences indexed by symbol
+    id, so the tick does no string lookups. The ``read_value``/``is_path_open``
+    callables are still accepted and are queried once per referenced name into
+    lists sized to the highest referenced id when the orchestrator is compiled.
+    """
 
     def __init__(
         self,
         models: list[ConfiguredModel],
         components: dict[str, SimComponent],
+        *,
+        integration: IntegrationMode = IntegrationMode.EULER,
+        base_period: float | None = None,
+        fingerprints: dict[str, str] | None = None,
+        previous: Orchestrator | None = None,
+        symbols: SymbolTable | None = None,
     ) -> None:
         self.models = models
+        self.symbols = symbols if symbols is not None else SymbolTable()
         self.components = components
+        self.integration = IntegrationMode(integration)
+        self.base_period = base_period
+        self._rates = RateGroups()
+        self.banks: tuple[FirstOrderBank, ...] = ()
+        self._plans: tuple[_RatePlan, ...] = ()
+        self.values = ValueStore()
+        self._synced: tuple[tuple[int, Callable[[], float]], ...] = ()
+        self._external: dict[int, str] = {}
+        self._paths: dict[int, str] = {}
+        self._compiled: dict[str, _CompiledModel] = {}
+        self._deps: list[str] = []
+        self._externals: list[str] = []
+        self._path_names: list[str] = []
+        self._model_rates: dict[str, int] = {}
+        self._external_buffer: list[float | None] = []
+        self._open_flags: list[bool] = []
+        self._flag_buffer: list[bool] = []
+        self.rewired: tuple[str, ...] = ()
+        self.due_level = -1
+        self._compile(fingerprints or {}, previous)
+
+    @property
+    def external_tags(self) -> tuple[str, ...]:
+        """Every non-component source ``update`` may ask ``read_value`` for, in first-use order."""
+        return tuple(self._external.values())
+
+    @property
+    def external_refs(self) -> tuple[tuple[int, str], ...]:
+        """``(symbol id, tag)`` for every entry of ``external_tags``."""
+        return tuple(self._external.items())
 
     def update(
         self,
@@ -196,119 +360,276 @@ class Orchestrator:
         *,
         read_value: ReadValue | None = None,
         is_path_open: IsPathOpen | None = None,
+        external_values: ExternalValues | None = None,
+        path_flags: PathFlags | None = None,
     ) -> None:
-        reader = read_value or (lambda _name: None)
-        path_open = is_path_open or (lambda _name: True)
+        """Advance one tick.
+
+        ``external_values`` and ``path_flags`` are indexed by symbol id and take
+        precedence over ``read_value`` and ``is_path_open``. Without either, tags
+        read as missing and every flow path is open.
+        """
+        external = external_values if external_values is not None else self._read_externals(read_value)
+        flags = path_flags if path_flags is not None else self._path_flags(is_path_open)
+        level, elapsed = self._rates.advance(dt)
+        self.due_level = level
+        plan = self._plans[level]
+
+        for step in plan.targets:
+            step.wire(external, flags)
+        for rate, bank in enumerate(plan.banks):
+            bank.step(elapsed[rate])
+        for component, rate in plan.direct:
+            component.update(elapsed[rate])
+        if self.integration is IntegrationMode.EXACT:
+            for step in plan.levels:
+                step.advance_exact(elapsed[step.rate], external, self._rates)
+        else:
+            for step in plan.levels:
+                step.component.set_flows(step.inflow(external), step.outflow(external))
+                step.component.update(elapsed[step.rate])
+        values = self.values.values
+        for slot, getter in self._synced:
+            values[slot] = getter()
+
+    def _read_externals(self, read_value: ReadValue | None) -> list[float | None]:
+        values = self._external_buffer
+        if read_value is not None:
+            for symbol, tag in self._external.items():
+                values[symbol] = read_value(tag)
+        return values
+
+    def _path_flags(self, is_path_open: IsPathOpen | None) -> list[bool]:
+        if is_path_open is None:
+            return self._open_flags
+        flags = self._flag_buffer
+        for symbol, name in self._paths.items():
+            flags[symbol] = is_path_open(name)
+        return flags
+
+    def rate_of(self, name: str) -> int:
+        """Rate-group level a model was compiled into; 0 (every tick) if unknown."""
+        compiled = self._compiled.get(name)
+        return compiled.rate if compiled is not None else 0
+
+    def release(self) -> None:
+        """Hand bank state back to the components; the orchestrator is unusable afterwards."""
+        for bank in self.banks:
+            bank.release()
+        self.banks = ()
+        self._plans = ()
+
+    def _divisor(self, model: ConfiguredModel) -> int:
+        if not self.base_period:
+            return 1
+        return harmonic_divisor(max(model.update_period_ms, 0) / 1000.0, self.base_period)
+
+    def _compile(self, fingerprints: dict[str, str], previous: Orchestrator | None) -> None:
+        targets: list[tuple[int, _TargetStep | _TemperatureStep]] = []
+        levels: list[_LevelStep] = []
+        direct: list[tuple[SimComponent, int]] = []
+        first_order: list[tuple[FirstOrderTargetComponent, int]] = []
+        rewired: list[str] = []
+        self._model_rates = {model.name: rate_level(self._divisor(model)) for model in self.models}
 
         for model in self.models:
             component = self.components[model.name]
-            model_type = model.type.lower()
-            if model_type in {"flow", "pressure", "temperature"}:
-                self._wire_target_model(model, component, reader, path_open)
-            elif model_type == "sensor":
-                self._wire_sensor(model, component)
-
-        for model in self.models:
-            if model.type.lower() != "level":
-                self.components[model.name].update(dt)
-
-        for model in self.models:
+            fingerprint = fingerprints.get(model.name, "")
+            compiled = self._reusable(previous, model.name, fingerprint, component)
+            if compiled is None:
+                compiled = self._compile_model(model, component, fingerprint)
+                rewired.append(model.name)
+            self._compiled[model.name] = compiled
+            for name in compiled.externals:
+                self._external.setdefault(self.symbols.intern(name), name)
+            for name in compiled.paths:
+                self._paths.setdefault(self.symbols.intern(name), name)
+            rate = compiled.rate
             if model.type.lower() == "level":
-                component = self.components[model.name]
-                self._wire_level(model, component, reader)
-                component.update(dt)
-
-    def _resolve(self, name: str, reader: ReadValue) -> float:
-        component = self.components.get(name)
-        if component is not None:
-            return component.current_value()
-        value = reader(name)
-        return 0.0 if value is None else float(value)
+                if compiled.level is not None:
+                    levels.append(compiled.level)
+                continue
+            if compiled.target is not None:
+                targets.append((rate, compiled.target))
+            if isinstance(component, FirstOrderTargetComponent):
+                first_order.append((component, rate))
+            else:
+                direct.append((component, rate))
+        self.rewired = tuple(rewired)
+        self._external_buffer = [None] * (max(self._external, default=-1) + 1)
+        self._open_flags = [True] * (max(self._paths, default=-1) + 1)
+        self._flag_buffer = [False] * len(self._open_flags)
+
+        rates = [rate for rate, _ in targets] + [step.rate for step in levels] + [rate for _, rate in direct]
+        max_level = max(rates, default=0)
+        self._rates = RateGroups(max_level)
+        grouped = [[component for component, rate in first_order if rate == level] for level in range(max_level + 1)]
+        banked = {id(component) for component, _ in first_order}
+        unbanked = [component for component in self.components.values() if id(component) not in banked]
+        names = {id(component): name for name, component in self.components.items()}
+        self.values = ValueStore(names[id(component)] for group in grouped + [unbanked] for component in group)
+        banks: list[FirstOrderBank] = []
+        start = 0
+        for group in grouped:
+            view = self.values.view(start, start + len(group))
+            banks.append(FirstOrderBank(group, self.integration, value=view))
+            start += len(group)
+        self.banks = tuple(banks)
+        self._synced = tuple((start + offset, component.current_value) for offset, component in enumerate(unbanked))
+        for slot, getter in self._synced:
+            self.values.values[slot] = getter()
+        self._plans = tuple(
+            _RatePlan(
+                targets=tuple(step for rate, step in targets if rate <= level),
+                banks=self.banks[: level + 1],
+                direct=tuple(item for item in direct if item[1] <= level),
+                levels=tuple(step for step in levels if step.rate <= level),
+            )
+            for level in range(max_level + 1)
+        )
 
-    def _wire_target_model(
+    def _reusable(
         self,
-        model: ConfiguredModel,
+        previous: Orchestrator | None,
+        name: str,
+        fingerprint: str,
         component: SimComponent,
-        reader: ReadValue,
-        is_path_open: IsPathOpen,
-    ) -> None:
+    ) -> _CompiledModel | None:
+        if (
+            previous is None
+            or not fingerprint
+            or previous.integration is not self.integration
+            or previous.base_period != self.base_period
+            or previous.symbols is not self.symbols
+        ):
+            return None
+        compiled = previous._compiled.get(name)
+        if compiled is None or compiled.fingerprint != fingerprint or compiled.component is not component:
+            return None
+        for dependency in compiled.deps:
+            if previous.components.get(dependency) is not self.components.get(dependency):
+                return None
+        return compiled
+
+    def _compile_model(self, model: ConfiguredModel, component: SimComponent, fingerprint: str) -> _CompiledModel:
+        self._deps = []
+        self._externals = []
+        self._path_names = []
+        rate = self._model_rates.get(model.name, 0)
+        model_type = model.type.lower()
+        target: _TargetStep | _TemperatureStep | None = None
+        level: _LevelStep | None = None
+        if model_type == "level":
+            if isinstance(component, LevelComponent):
+                level = self._compile_level(model, component, rate)
+        elif model_type == "temperature":
+            target = self._compile_temperature(model, component)
+        elif model_type in {"flow", "pressure"}:
+            target = self._compile_target(model, component)
+        elif model_type == "sensor" and isinstance(component, Sensor):
+            source_name = str((model.inputs or {}).get("source") or "").strip()
+            source = self.components.get(source_name)
+            self._deps.append(source_name)
+            component.set_source(source.current_value if source else None)
+        return _CompiledModel(
+            fingerprint=fingerprint,
+            component=component,
+            rate=rate,
+            target=target,
+            level=level,
+            deps=tuple(self._deps),
+            externals=tuple(self._externals),
+            paths=tuple(self._path_names),
+        )
+
+    def _source(self, name: str) -> _Source:
+        self._deps.append(name)
+        component = self.components.get(name)
+        if isinstance(component, FirstOrderTargetComponent):
+            return _Source(
+                getter=component.current_value,
+                averager=component.mean_over,
+                tau=component.tau,
+                rate=self._model_rates.get(name, 0),
+            )
+        if component is not None:
+            return _Source(getter=component.current_value)
+        return self._external_source(name)
+
+    def _external_source(self, name: str, scale: float = 1.0) -> _Source:
+        if not name:
+            return _Source()
+        self._deps.append(name)
+        self._externals.append(name)
+        return _Source(symbol=self.symbols.intern(name), scale=scale)
+
+    def _path(self, name: str) -> int:
+        """Symbol id of a flow path, or -1 when the step is not gated."""
+        if not name:
+            return -1
+        self._path_names.append(name)
+        return self.symbols.intern(name)
+
+    def _compile_target(self, model: ConfiguredModel, component: SimComponent) -> _TargetStep:
         params = model.params or {}
         inputs = model.inputs or {}
-        if model.type.lower() == "temperature":
-            heating_name = str(inputs.get("heating_cv") or inputs.get("control") or "").strip()
-            cooling_name = str(inputs.get("cooling_cv") or "").strip()
-            heating_path = str(inputs.get("heating_flow_path") or "").strip()
-            cooling_path = str(inputs.get("cooling_flow_path") or "").strip()
-            heating = self._resolve(heating_name, reader) if heating_name and is_path_open(heating_path) else 0.0
-            cooling = self._resolve(cooling_name, reader) if cooling_name and is_path_open(cooling_path) else 0.0
-            heat_fraction = _normalized_control(
-                heating,
-                _number(params.get("heating_cv_min", params.get("cv_min")), 0.0),
-                _number(params.get("heating_cv_max", params.get("cv_max")), 100.0),
-            )
-            cool_fraction = _normalized_control(
-                cooling,
-                _number(params.get("cooling_cv_min"), 0.0),
-                _number(params.get("cooling_cv_max"), 100.0),
-            )
-            target = (
-                _number(params.get("ambient"), 25.0)
-                + heat_fraction * _number(params.get("heating_gain", params.get("k")), 0.0)
-                - cool_fraction * _number(params.get("cooling_gain"), 0.0)
-            )
-            target = min(max(target, _number(params.get("pv_min"), -273.15)), _number(params.get("pv_max"), 1000.0))
+        if model.type.lower() == "pressure":
+            out_min = _number(params.get("p_min"), 0.0)
+            out_max = _number(params.get("p_max"), 200.0)
         else:
-            control = str(inputs.get("control") or "").strip()
-            cv = self._resolve(control, reader)
-            cv_min = _number(params.get("cv_min"), 0.0)
-            cv_max = _number(params.get("cv_max"), 100.0)
-            reverse = str(params.get("cv_relationship") or "direct").lower() == "reverse"
-            if model.type.lower() == "pressure":
-                out_min = _number(params.get("p_min"), 0.0)
-                out_max = _number(params.get("p_max"), 200.0)
-            else:
-                out_min = _number(params.get("pv_min"), 0.0)
-                out_max = _number(params.get("pv_max"), 1000.0)
-            target = _map_range(cv, cv_min, cv_max, out_min, out_max, reverse)
-            target *= _number(params.get("k"), 1.0)
-            flow_path = str(inputs.get("flow_path") or "").strip()
-            if flow_path and not is_path_open(flow_path):
-                target = _number(params.get("closed_path_value"), 0.0)
-        setter = getattr(component, "set_target", None)
-        if callable(setter):
-            setter(target)
-
-    def _wire_sensor(
-        self,
-        model: ConfiguredModel,
-        component: SimComponent,
-    ) -> None:
-        if not isinstance(component, Sensor):
-            return
-        source_name = str((model.inputs or {}).get("source") or "").strip()
-        source = self.components.get(source_name)
-        component.set_source(source.current_value if source else None)
+            out_min = _number(params.get("pv_min"), 0.0)
+            out_max = _number(params.get("pv_max"), 1000.0)
+        return _TargetStep(
+            set_target=_target_setter(component),
+            control=self._source(str(inputs.get("control") or "").strip()),
+            cv_min=_number(params.get("cv_min"), 0.0),
+            cv_max=_number(params.get("cv_max"), 100.0),
+            out_min=out_min,
+            out_max=out_max,
+            reverse=str(params.get("cv_relationship") or "direct").lower() == "reverse",
+            gain=_number(params.get("k"), 1.0),
+            flow_path=self._path(str(inputs.get("flow_path") or "").strip()),
+            closed_value=_number(params.get("closed_path_value"), 0.0),
+        )
 
-    def _wire_level(
-        self,
-        model: ConfiguredModel,
-        component: SimComponent,
-        reader: ReadValue,
-    ) -> None:
-        if not isinstance(component, LevelComponent):
-            return
-        inputs = model.inputs or {}
+    def _compile_temperature(self, model: ConfiguredModel, component: SimComponent) -> _TemperatureStep:
         params = model.params or {}
-        qin = self._sum_flow_sources(
-            inputs.get("inlet_paths"), params.get("inlet_sources"), reader
+        inputs = model.inputs or {}
+        heating_name = str(inputs.get("heating_cv") or inputs.get("control") or "").strip()
+        cooling_name = str(inputs.get("cooling_cv") or "").strip()
+        return _TemperatureStep(
+            set_target=_target_setter(component),
+            heating=self._source(heating_name) if heating_name else None,
+            cooling=self._source(cooling_name) if cooling_name else None,
+            heating_path=self._path(str(inputs.get("heating_flow_path") or "").strip()),
+            cooling_path=self._path(str(inputs.get("cooling_flow_path") or "").strip()),
+            heating_cv_min=_number(params.get("heating_cv_min", params.get("cv_min")), 0.0),
+            heating_cv_max=_number(params.get("heating_cv_max", params.get("cv_max")), 100.0),
+            cooling_cv_min=_number(params.get("cooling_cv_min"), 0.0),
+            cooling_cv_max=_number(params.get("cooling_cv_max"), 100.0),
+            ambient=_number(params.get("ambient"), 25.0),
+            heating_gain=_number(params.get("heating_gain", params.get("k")), 0.0),
+            cooling_gain=_number(params.get("cooling_gain"), 0.0),
+            pv_min=_number(params.get("pv_min"), -273.15),
+            pv_max=_number(params.get("pv_max"), 1000.0),
         )
-        qout = self._sum_flow_sources(
-            inputs.get("outlet_paths"), params.get("outlet_sources"), reader
+
+    def _compile_level(self, model: ConfiguredModel, component: LevelComponent, rate: int) -> _LevelStep:
+        inputs = model.inputs or {}
+        params = model.params or {}
+        inlets = self._compile_flow_sources(inputs.get("inlet_paths"), params.get("inlet_sources"))
+        outlets = self._compile_flow_sources(inputs.get("outlet_paths"), params.get("outlet_sources"))
+        taus = [source.tau for source in inlets + outlets if source.tau > 0.0]
+        return _LevelStep(
+            component=component,
+            inlets=inlets,
+            outlets=outlets,
+            rate=rate,
+            fastest_tau=min(taus) if taus else 0.0,
         )
-        component.set_flows(qin, qout)
 
-    def _sum_flow_sources(self, paths, sources, reader: ReadValue) -> float:
-        total = 0.0
+    def _compile_flow_sources(self, paths, sources) -> tuple[_Source, ...]:
+        compiled: list[_Source] = []
         paths = paths or []
         sources = sources or []
 
@@ -318,15 +639,232 @@ class Orchestrator:
             unit = str(source.get("unit") or "m3/s")
 
             if mode == "static":
-                total += _flow_to_m3s(_number(source.get("value"), 0.0), unit)
+                compiled.append(_Source(constant=_flow_to_m3s(_number(source.get("value"), 0.0), unit)))
             elif mode == "tag":
-                value = reader(str(source.get("tag") or ""))
-                total += _flow_to_m3s(0.0 if value is None else float(value), unit)
+                compiled.append(self._external_source(str(source.get("tag") or ""), _flow_to_m3s(1.0, unit)))
             else:
                 name = str(
                     (item or {}).get("name")
                     if isinstance(item, dict)
                     else item or ""
                 )
-                total += self._resolve(name, reader)
-        return total
+                compiled.append(self._source(name))
+        return tuple(compiled)
+
+
+def _target_setter(component: SimComponent) -> Callable[[float], None]:
+    setter = getattr(component, "set_target", None)
+    return setter if callable(setter) else _discard_target
+
+
+def _discard_target(_target: float) -> None:
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class _Source:
+    """Pre-resolved input: a component getter, an external tag symbol, or a constant."""
+
+    symbol: int = -1
+    getter: Callable[[], float] | None = None
+    scale: float = 1.0
+    constant: float = 0.0
+    averager: Callable[[float, float], float] | None = None
+    tau: float = 0.0
+    rate: int = 0
+
+    def read(self, external: ExternalValues) -> float:
+        if self.getter is not None:
+            return self.getter()
+        if self.symbol < 0:
+            return self.constant
+        value = external[self.symbol]
+        return 0.0 if value is None else float(value) * self.scale
+
+    def mean(self, external: ExternalValues, start: float, stop: float) -> float:
+        if self.averager is not None:
+            return self.averager(start, stop)
+        return self.read(external)
+
+
+@dataclass(slots=True)
+class _TargetStep:
+    set_target: Callable[[float], None]
+    control: _Source
+    cv_min: float
+    cv_max: float
+    out_min: float
+    out_max: float
+    reverse: bool
+    gain: float
+    flow_path: int
+    closed_value: float
+
+    def wire(self, external: ExternalValues, path_flags: PathFlags) -> None:
+        if self.flow_path >= 0 and not path_flags[self.flow_path]:
+            self.set_target(self.closed_value)
+            return
+        cv = self.control.read(external)
+        target = _map_range(cv, self.cv_min, self.cv_max, self.out_min, self.out_max, self.reverse)
+        self.set_target(target * self.gain)
+
+
+@dataclass(slots=True)
+class _TemperatureStep:
+    set_target: Callable[[float], None]
+    heating: _Source | None
+    cooling: _Source | None
+    heating_path: int
+    cooling_path: int
+    heating_cv_min: float
+    heating_cv_max: float
+    cooling_cv_min: float
+    cooling_cv_max: float
+    ambient: float
+    heating_gain: float
+    cooling_gain: float
+    pv_min: float
+    pv_max: float
+
+    def wire(self, external: ExternalValues, path_flags: PathFlags) -> None:
+        heating = (
+            self.heating.read(external)
+            if self.heating is not None and (self.heating_path < 0 or path_flags[self.heating_path])
+            else 0.0
+        )
+        cooling = (
+            self.cooling.read(external)
+            if self.cooling is not None and (self.cooling_path < 0 or path_flags[self.cooling_path])
+            else 0.0
+        )
+        target = (
+            self.ambient
+            + _normalized_control(heating, self.heating_cv_min, self.heating_cv_max) * self.heating_gain
+            - _normalized_control(cooling, self.cooling_cv_min, self.cooling_cv_max) * self.cooling_gain
+        )
+        self.set_target(min(max(target, self.pv_min), self.pv_max))
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledModel:
+    """One model's compiled wiring plus what it was compiled against."""
+
+    fingerprint: str
+    component: SimComponent
+    rate: int
+    target: _TargetStep | _TemperatureStep | None
+    level: _LevelStep | None
+    deps: tuple[str, ...]
+    externals: tuple[str, ...]
+    paths: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class _RatePlan:
+    """Work due when rate groups up to one level run, each list in model order."""
+
+    targets: tuple[_TargetStep | _TemperatureStep, ...]
+    banks: tuple[FirstOrderBank, ...]
+    direct: tuple[tuple[SimComponent, int], ...]
+    levels: tuple[_LevelStep, ...]
+
+
+@dataclass(slots=True)
+class _LevelStep:
+    component: LevelComponent
+    inlets: tuple[_Source, ...]
+    outlets: tuple[_Source, ...]
+    rate: int = 0
+    fastest_tau: float = 0.0
+
+    def inflow(self, external: ExternalValues) -> float:
+        return sum(source.read(external) for source in self.inlets)
+
+    def outflow(self, external: ExternalValues) -> float:
+        return sum(source.read(external) for source in self.outlets)
+
+    def net_mean(
+        self,
+        external: ExternalValues,
+        start: float,
+        stop: float,
+        shifts: SourceShifts | None = None,
+    ) -> tuple[float, float]:
+        """Mean inflow and outflow between two offsets into this step.
+
+        ``shifts`` (from ``_shifts``) moves each source's window onto this step
+        when the source last ran in a different rate group; ``None`` marks a
+        source that is read at its held value instead.
+        """
+        if shifts is None:
+            return (
+                sum(source.mean(external, start, stop) for source in self.inlets),
+                sum(source.mean(external, start, stop) for source in self.outlets),
+            )
+        return (
+            _shifted_mean(self.inlets, shifts[0], external, start, stop),
+            _shifted_mean(self.outlets, shifts[1], external, start, stop),
+        )
+
+    def advance_exact(self, dt: float, external: ExternalValues, rates: RateGroups | None = None) -> None:
+        dt = max(float(dt), 0.0)
+        component = self.component
+        shifts = self._shifts(dt, rates)
+        qin, qout = self.net_mean(external, 0.0, dt, shifts)
+        substeps = self._substeps(dt) if self._near_limit(qin - qout, dt, external, shifts) else 1
+        if substeps == 1:
+            component.set_flows(qin, qout)
+            component.update(dt)
+            return
+        width = dt / substeps
+        for index in range(substeps):
+            component.set_flows(*self.net_mean(external, index * width, (index + 1) * width, shifts))
+            component.update(width)
+
+    def _shifts(self, dt: float, rates: RateGroups | None) -> SourceShifts | None:
+        """Per-source offsets from this step's window into each source's last step.
+
+        A source in this level's rate group stepped over the same window. One in
+        a slower group stepped ``last`` seconds ending ``since`` seconds ago, and
+        its exact response is extrapolated forward onto this step. One in a
+        faster group only covers the end of this step, so its held value is used.
+        """
+        sources = self.inlets + self.outlets
+        if rates is None or all(source.averager is None or source.rate == self.rate for source in sources):
+            return None
+
+        def shift(source: _Source) -> float | None:
+            if source.averager is None or source.rate == self.rate:
+                return 0.0
+            if source.rate < self.rate:
+                return None
+            last, since = rates.lag(source.rate)
+            return last + since - dt
+
+        return tuple(shift(source) for source in self.inlets), tuple(shift(source) for source in self.outlets)
+
+    def _near_limit(
+        self,
+        net_mean: float,
+        dt: float,
+        external: ExternalValues,
+        shifts: SourceShifts | None = None,
+    ) -> bool:
+        if self.component.reaches_limit(net_mean, dt):
+            return True
+        if self.fastest_tau <= 0.0:
+            return False
+        # The mean can stay in range while the trajectory dips into a clamp, so
+        # also project the flows at the start and end of the step.
+        for offset in (0.0, dt):
+            qin, qout = self.net_mean(external, offset, offset, shifts)
+            if self.component.reaches_limit(qin - qout, dt):
+                return True
+        return False
+
+    def _substeps(self, dt: float) -> int:
+        # Only first-order sources vary within a step; with constant flows the
+        # clamped single step is already exact.
+        if self.fastest_tau <= 0.0 or dt <= 0.0:
+            return 1
+        return min(MAX_LEVEL_SUBSTEPS, max(2, math.ceil(16.0 * dt / self.fastest_tau)))
@@ -3,22 +3,38 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Any, Callable, Iterable
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+import numpy as np
+from PyQt6.QtCore import QObject, QThread, QTimer, Qt, pyqtSignal, pyqtSlot
 
 from domain.models import ConfiguredModel, PlantPaxModule
+from domain.plantpax_definitions import MemberClass
+from persistence.history_archive import HistoryArchive
 from persistence.project_store import ProjectStore
-from core.plc_sim_bridge import PlcSimBridge
+from core.plc_sim_bridge import DEFAULT_MAX_AGE_S, PlcSimBridge, WriteDeadband
 from core.device_registry import DeviceRegistry
 from core.flow_path_runtime import FlowPathRuntime
+from core.historian import DEFAULT_HISTORY_CAPACITY, Historian
+from core.scheduling import CatchUpPolicy, TickScheduler
 from core.sim_component_factory import SimulationBuild, build_simulation
+from core.simulator import IntegrationMode
 from core.simulation_validation import SimulationValidator, ValidationReport
+from core.symbols import SymbolTable
+from core.telemetry import PhaseStats, TickPhase, TickTelemetry
+from core.value_store import ValueStore
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_REFRESH_S = 60.0
+DEFAULT_SNAPSHOT_INTERVAL_S = 5.0
+
 
 class RuntimeState(str, Enum):
     STOPPED = "Stopped"
@@ -27,13 +43,84 @@ class RuntimeState(str, Enum):
     FAULTED = "Faulted"
 
 
+class _TickWorker(QObject):
+    """Owns the tick timer inside the runtime thread and runs due steps there."""
+
+    def __init__(self, on_timeout: Callable[[], None]) -> None:
+        super().__init__()
+        self._on_timeout_fn = on_timeout
+        self._timer: QTimer | None = None
+
+    @pyqtSlot(int)
+    def start_timer(self, interval_ms: int) -> None:
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._on_timeout)
+        self._timer.start(interval_ms)
+
+    @pyqtSlot()
+    def stop_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+
+    def _on_timeout(self) -> None:
+        self._on_timeout_fn()
+
+
+@dataclass(slots=True, frozen=True)
+class _ScanRequest:
+    """One batched PLC read, captured under the lock and performed outside it."""
+
+    reader: Callable[[list[str]], dict[str, Any]]
+    tags: list[str]
+    refresh_config: bool
+
+    def read(self) -> dict[str, Any]:
+        return self.reader(self.tags) or {}
+
+
 class SimulationManager(QObject):
-    """Own component building, validation, scheduling, PLC I/O, and runtime state."""
+    """Own component building, validation, scheduling, PLC I/O, and runtime state.
+
+    With ``threaded=True`` ticks, including blocking PLC reads and writes, run on
+    a worker ``QThread``; signals carry value snapshots back to the GUI thread
+    through queued connections. Public methods may be called from either thread;
+    the tick holds the runtime lock only between its PLC read and write, so a
+    slow PLC never blocks them.
+
+    Timer callbacks are paced by a monotonic ``TickScheduler``: a late timer runs
+    the steps that are actually due (per ``catch_up_policy``) or, without
+    ``fixed_step``, one step of the real elapsed time.
+
+    Each tick's phases (PLC scan, flow paths, orchestrator update, bridge write,
+    publish) are timed into rolling histograms; ``tick_timed`` carries the
+    per-tick ``TickTiming`` and ``tick_statistics()`` returns p50/p95/max.
+
+    ``values_delta`` carries, each tick, only the values that moved more than
+    ``delta_epsilon`` since they were last published. ``values_changed`` carries
+    a full snapshot after builds and every ``snapshot_interval_s`` for resync
+    (every tick when it is 0).
+
+    Every tick's values are also recorded into ``historian``, a fixed-memory
+    ring buffer with min/max decimation levels for trend queries. It holds
+    ``history_capacity * 7`` floats per signal at the default four levels
+    (about 112 KiB per signal at 2048, or 573 MB for 5,000 signals);
+    ``history_max_bytes`` caps that by shrinking the capacity as signals are
+    added. With an
+    ``archive_dir`` they are also appended to a memory-mapped ``HistoryArchive``
+    whose own thread does the disk writes; ``archive_max_bytes`` caps its size
+    by deleting the oldest chunks and is unlimited by default.
+    """
 
     values_changed = pyqtSignal(dict)
+    values_delta = pyqtSignal(dict)
     state_changed = pyqtSignal(object)
     validation_changed = pyqtSignal(object)
     faulted = pyqtSignal(str)
+    tick_timed = pyqtSignal(object)
+    _worker_start = pyqtSignal(int)
+    _worker_stop = pyqtSignal()
 
     def __init__(
         self,
@@ -41,24 +128,76 @@ class SimulationManager(QObject):
         plc: Any | None = None,
         *,
         interval_ms: int = 200,
+        integration: IntegrationMode = IntegrationMode.EULER,
+        write_deadband: WriteDeadband = WriteDeadband(),
+        write_max_age_s: float | None = DEFAULT_MAX_AGE_S,
+        threaded: bool = False,
+        fixed_step: bool = True,
+        catch_up_policy: CatchUpPolicy = CatchUpPolicy.BURST,
+        max_catch_up_steps: int = 5,
+        telemetry_window: int = 256,
+        config_refresh_s: float = DEFAULT_CONFIG_REFRESH_S,
+        delta_epsilon: float = 0.0,
+        snapshot_interval_s: float = DEFAULT_SNAPSHOT_INTERVAL_S,
+        history_capacity: int = DEFAULT_HISTORY_CAPACITY,
+        history_max_bytes: int | None = None,
+        archive_dir: str | Path | None = None,
+        archive_max_bytes: int | None = None,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self.store = store
         self._plc = plc
         self._interval_ms = max(int(interval_ms), 1)
+        self._integration = IntegrationMode(integration)
         self._state = RuntimeState.STOPPED
         self._build = SimulationBuild()
+        self._scan_tags: tuple[str, ...] = ()
+        self._config_tags: tuple[str, ...] = ()
+        self._config_refresh_s = float(config_refresh_s)
+        self._config_read_at: float | None = None
+        self._plc_connected = False
+        self._delta_epsilon = max(float(delta_epsilon), 0.0)
+        self._snapshot_interval_s = max(float(snapshot_interval_s), 0.0)
+        self._snapshot_at = 0.0
+        self._published = np.empty(0, dtype=np.float64)
+        self._scan_values: dict[str, Any] = {}
+        self._historian = Historian(capacity=history_capacity, max_bytes=history_max_bytes)
+        # History is stamped on the monotonic clock, shifted once to wall time, so clock steps cannot reorder it.
+        self._wall_offset = time.time() - time.monotonic()
+        self._archive = HistoryArchive(archive_dir, max_bytes=archive_max_bytes) if archive_dir is not None else None
+        if self._archive is not None:
+            self._archive.start()
+        # One table across incremental rebuilds keeps symbol ids stable; ``reset()`` starts a new one.
+        self._symbols = SymbolTable()
+        self._external_refs: tuple[tuple[int, str], ...] = ()
+        self._external_values: list[float | None] = []
         self._validator = SimulationValidator()
         self._validation = ValidationReport()
 
+        self._lock = threading.RLock()
+        self._tick_lock = threading.Lock()
+        self._generation = 0
+        self._latest: tuple[tuple[str, ...], np.ndarray] = ((), np.empty(0, dtype=np.float64))
+        self._scheduler = TickScheduler(
+            self._interval_ms / 1000.0,
+            fixed_step=fixed_step,
+            policy=catch_up_policy,
+            max_catch_up=max_catch_up_steps,
+        )
+        self._telemetry = TickTelemetry(self._interval_ms / 1000.0, window=telemetry_window)
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.setInterval(self._interval_ms)
-        self._timer.timeout.connect(self.tick)
-
-        self._bridge = PlcSimBridge()
-        self._devices = DeviceRegistry(self.store.get_devices())
-        self._flow_paths = FlowPathRuntime(self.store.get_flow_paths())
+        self._timer.timeout.connect(self._on_timer)
+        self._thread: QThread | None = None
+        self._worker: _TickWorker | None = None
+        if threaded:
+            self._start_worker_thread()
+
+        self._bridge = PlcSimBridge(deadband=write_deadband, max_age_s=write_max_age_s)
+        self._devices = DeviceRegistry(self.store.get_devices(), symbols=self._symbols)
+        self._flow_paths = FlowPathRuntime(self.store.get_flow_paths(), symbols=self._symbols)
         self._configure_plc_bridge()
         self.build()
 
@@ -70,10 +209,53 @@ class SimulationManager(QObject):
     def components(self) -> dict:
         return self._build.components
 
+    @property
+    def value_store(self) -> ValueStore | None:
+        """Array of every component value for the current build, refreshed each tick."""
+        orchestrator = self._build.orchestrator
+        return orchestrator.values if orchestrator is not None else None
+
+    @property
+    def historian(self) -> Historian:
+        """Recorded history of every component value; safe to query from any thread."""
+        return self._historian
+
+    @property
+    def archive(self) -> HistoryArchive | None:
+        return self._archive
+
     @property
     def validation_report(self) -> ValidationReport:
         return self._validation
 
+    @property
+    def is_threaded(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def overrun_count(self) -> int:
+        """Timer callbacks that found more than one interval elapsed."""
+        return self._scheduler.overruns
+
+    @property
+    def skipped_steps(self) -> int:
+        """Fixed steps dropped by the catch-up policy instead of being run."""
+        return self._scheduler.skipped_steps
+
+    @property
+    def telemetry(self) -> TickTelemetry:
+        return self._telemetry
+
+    @property
+    def tick_overrun(self) -> bool:
+        """Whether the most recent tick took longer than ``interval_ms``."""
+        last = self._telemetry.last
+        return bool(last and last.overrun)
+
+    def tick_statistics(self) -> dict[str, PhaseStats]:
+        """Rolling per-phase duration statistics in seconds, keyed by ``TickPhase`` value."""
+        with self._lock:
+            return self._telemetry.stats()
 
     @property
     def device_registry(self) -> DeviceRegistry:
@@ -93,112 +275,229 @@ class SimulationManager(QObject):
         return bool(checker()) if callable(checker) else False
 
     def set_plc(self, plc: Any | None) -> None:
-        was_running = self.state is RuntimeState.RUNNING
-        self._bridge.stop()
-        self._plc = plc
-        self._configure_plc_bridge()
-        self._register_outputs()
-        if was_running:
-            self._bridge.start()
-
-    def build(self, models: Iterable[ConfiguredModel] | None = None) -> ValidationReport:
-        """Rebuild runtime objects from persistent configuration."""
-        was_running = self.state is RuntimeState.RUNNING
-        self._timer.stop()
-        self._bridge.stop()
-
-        model_list = list(models) if models is not None else self.store.get_models()
-        self._validation = self._validator.validate(model_list)
-        self.validation_changed.emit(self._validation)
-
-        try:
-            self._build = build_simulation(model_list)
-            self._devices.rebuild(self.store.get_devices())
-            self._flow_paths.rebuild(self.store.get_flow_paths())
-            self._flow_paths.evaluate(self._devices)
+        with self._lock:
+            was_running = self.state is RuntimeState.RUNNING
+            self._bridge.stop()
+            self._generation += 1
+            self._plc = plc
+            self._config_read_at = None
+            self._configure_plc_bridge()
             self._register_outputs()
-        except Exception as exc:
-            logger.exception("Simulation build failed")
-            self._build = SimulationBuild()
-            self._set_state(RuntimeState.FAULTED)
-            self.faulted.emit(str(exc))
-            return self._validation
-
-        if self._validation.is_valid:
-            self._set_state(RuntimeState.READY)
             if was_running:
-                self.start()
-        else:
-            self._set_state(RuntimeState.FAULTED)
+                self._bridge.start()
 
-        self.values_changed.emit(self.current_values())
-        return self._validation
+    def build(
+        self,
+        models: Iterable[ConfiguredModel] | None = None,
+        *,
+        incremental: bool = True,
+    ) -> ValidationReport:
+        """Rebuild runtime objects from persistent configuration.
+
+        Incremental builds keep the live state of unchanged models and seed edited
+        ones from their previous values; ``reset()`` builds from scratch.
+        """
+        with self._lock:
+            was_running = self.state is RuntimeState.RUNNING
+            self._stop_timer()
+            self._bridge.stop()
+            self._generation += 1
+
+            if models is None:
+                model_list = self.store.get_models()
+                fingerprints = self.store.model_fingerprints()
+            else:
+                model_list = list(models)
+                fingerprints = [model.fingerprint() for model in model_list]
+            self._validation = self._validator.validate(model_list, fingerprints)
+            self.validation_changed.emit(self._validation)
+
+            if not incremental:
+                # Start ids over from the live names so renamed and deleted ones stop taking slots.
+                self._symbols = SymbolTable()
+                self._devices.symbols = self._flow_paths.symbols = self._symbols
+
+            try:
+                self._build = build_simulation(
+                    model_list,
+                    integration=self._integration,
+                    base_period=self._interval_ms / 1000.0,
+                    previous=self._build if incremental else None,
+                    symbols=self._symbols,
+                    model_fingerprints=fingerprints,
+                )
+                self._devices.rebuild(self.store.get_devices())
+                self._flow_paths.rebuild(self.store.get_flow_paths())
+                self._flow_paths.evaluate(self._devices)
+                self._register_outputs()
+                self._collect_scan_tags()
+                self._historian.set_signals(self.value_store.names)
+                if self._archive is not None:
+                    self._archive.set_signals(self.value_store.names)
+            except Exception as exc:
+                logger.exception("Simulation build failed")
+                self._build = SimulationBuild()
+                self._scan_tags = ()
+                self._config_tags = ()
+                self._external_refs = ()
+                self._set_state(RuntimeState.FAULTED)
+                self.faulted.emit(str(exc))
+                return self._validation
+
+            if self._validation.is_valid:
+                self._set_state(RuntimeState.READY)
+                if was_running:
+                    self.start()
+            else:
+                self._set_state(RuntimeState.FAULTED)
+
+            self.publish_snapshot()
+            return self._validation
 
     def start(self) -> bool:
         """Start simulation scheduling. A PLC connection is not required."""
-        if self.state is RuntimeState.RUNNING:
-            return True
+        with self._lock:
+            if self.state is RuntimeState.RUNNING:
+                return True
+            self._telemetry.reset()
 
-        if self.state in {RuntimeState.STOPPED, RuntimeState.FAULTED}:
-            self.build()
+            if self.state in {RuntimeState.STOPPED, RuntimeState.FAULTED}:
+                self.build()
 
-        if not self._validation.is_valid or self._build.orchestrator is None:
-            self._set_state(RuntimeState.FAULTED)
-            return False
+            if not self._validation.is_valid or self._build.orchestrator is None:
+                self._set_state(RuntimeState.FAULTED)
+                return False
 
-        self._bridge.start()
-        self._timer.start()
-        self._set_state(RuntimeState.RUNNING)
-        return True
+            self._bridge.start()
+            self._start_timer()
+            self._set_state(RuntimeState.RUNNING)
+            return True
 
     def stop(self) -> None:
-        self._timer.stop()
-        self._bridge.stop()
-        if self._build.orchestrator is not None and self._validation.is_valid:
-            self._set_state(RuntimeState.READY)
-        else:
-            self._set_state(RuntimeState.STOPPED)
+        with self._lock:
+            self._stop_timer()
+            self._bridge.stop()
+            if self._build.orchestrator is not None and self._validation.is_valid:
+                self._set_state(RuntimeState.READY)
+            else:
+                self._set_state(RuntimeState.STOPPED)
 
     def reset(self) -> ValidationReport:
         self.stop()
-        return self.build()
-
-    def tick(self) -> None:
-        """Advance one deterministic runtime step."""
-        if self.state is not RuntimeState.RUNNING:
-            return
-        orchestrator = self._build.orchestrator
-        if orchestrator is None:
-            self._fail("Simulation orchestrator is not available.")
-            return
+        return self.build(incremental=False)
+
+    def tick(self, dt: float | None = None) -> None:
+        """Advance one deterministic runtime step of ``dt`` seconds (default: the interval)."""
+        self._run_steps((self._interval_ms / 1000.0 if dt is None else float(dt),))
+
+    def _on_timer(self) -> None:
+        steps = self._scheduler.poll()
+        if steps:
+            self._run_steps(steps)
+
+    def _run_steps(self, steps: Iterable[float]) -> None:
+        """Scan the PLC once, advance the orchestrator by each step, then write and publish once.
+
+        The blocking PLC read and write run outside ``_lock``, so GUI calls that
+        take it never wait on the PLC; ``_tick_lock`` keeps ticks from overlapping.
+        """
+        with self._tick_lock:
+            with self._lock:
+                if self.state is not RuntimeState.RUNNING:
+                    return
+                if self._build.orchestrator is None:
+                    self._fail("Simulation orchestrator is not available.")
+                    return
+                generation = self._generation
+                self._telemetry.begin()
+                scan = self._scan_request()
 
-        try:
-            self._refresh_device_states()
-            self._flow_paths.evaluate(self._devices)
-            orchestrator.update(
-                self._interval_ms / 1000.0,
-                read_value=self._read_external_value,
-                is_path_open=self._flow_paths.is_open,
-            )
-            self._bridge.tick()
+            try:
+                values = scan.read() if scan is not None else {}
+            except Exception as exc:
+                logger.exception("PLC scan failed")
+                with self._lock:
+                    self._fail(str(exc))
+                return
+
+            with self._lock:
+                if self.state is not RuntimeState.RUNNING or generation != self._generation:
+                    # Rebuilt or stopped while the PLC was being read; this scan no longer applies.
+                    return
+                telemetry = self._telemetry
+                orchestrator = self._build.orchestrator
+                try:
+                    self._apply_scan(scan, values)
+                    telemetry.mark(TickPhase.SCAN)
+                    self._flow_paths.evaluate(self._devices)
+                    telemetry.mark(TickPhase.FLOW_PATHS)
+                    due = -1
+                    for dt in steps:
+                        orchestrator.update(
+                            dt,
+                            external_values=self._external_values,
+                            path_flags=self._flow_paths.open_flags,
+                        )
+                        due = max(due, orchestrator.due_level)
+                    telemetry.mark(TickPhase.UPDATE)
+                    # Write the rate groups that just ran, in phase with the orchestrator.
+                    batch = self._bridge.collect(due)
+                    now = time.monotonic() + self._wall_offset
+                    self._historian.record(now, orchestrator.values.values)
+                    if self._archive is not None:
+                        self._archive.append(now, orchestrator.values.values)
+                    self._publish_values()
+                    telemetry.mark(TickPhase.PUBLISH)
+                except Exception as exc:
+                    logger.exception("Simulation tick failed")
+                    self._fail(str(exc))
+                    return
+
+            results = self._bridge.write(batch) if batch is not None else {}
+
+            with self._lock:
+                if batch is not None and generation == self._generation:
+                    self._bridge.commit(batch, results)
+                telemetry.mark(TickPhase.WRITE)
+                timing = telemetry.finish()
+            if timing.overrun:
+                logger.debug("Tick overran %d ms budget: %.1f ms", self._interval_ms, timing.total * 1000.0)
+            self.tick_timed.emit(timing)
+
+    def refresh_device_config(self) -> None:
+        """Re-read configuration members (EU ranges) with the next PLC scan."""
+        with self._lock:
+            self._config_read_at = None
+
+    def publish_snapshot(self) -> None:
+        """Emit every current value on ``values_changed`` and restart delta tracking from it."""
+        with self._lock:
+            store = self.value_store
+            self._published = store.values.copy() if store is not None else np.empty(0, dtype=np.float64)
+            self._snapshot_at = time.monotonic()
+            self._keep_latest()
             self.values_changed.emit(self.current_values())
-        except Exception as exc:
-            logger.exception("Simulation tick failed")
-            self._fail(str(exc))
+
+    def _publish_values(self) -> None:
+        store = self.value_store
+        self._keep_latest()
+        if store is not None and len(store) == len(self._published):
+            delta = store.changed_since(self._published, self._delta_epsilon)
+            if delta:
+                self.values_delta.emit(delta)
+        if time.monotonic() - self._snapshot_at >= self._snapshot_interval_s:
+            self.publish_snapshot()
 
     def current_values(self) -> dict[str, float]:
-        values: dict[str, float] = {}
-        for name, component in self._build.components.items():
-            try:
-                values[name] = float(component.current_value())
-            except Exception:
-                logger.exception("Unable to read value for %s", name)
-        return values
+        """Values as of the last published tick; never waits on a running tick."""
+        names, values = self._latest
+        return dict(zip(names, values.tolist()))
 
     def validate(self) -> ValidationReport:
-        self._validation = self._validator.validate(self.store.get_models())
-        self.validation_changed.emit(self._validation)
-        return self._validation
+        with self._lock:
+            self._validation = self._validator.validate(self.store.get_models(), self.store.model_fingerprints())
+            self.validation_changed.emit(self._validation)
+            return self._validation
 
     def synchronize_discovery(self, modules: Iterable[PlantPaxModule]) -> dict[str, list[str]]:
         """Persist discovered modules and rebuild; usable with mocked/offline module lists."""
@@ -207,54 +506,135 @@ class SimulationManager(QObject):
         return result
 
     def close(self) -> None:
+        """Stop ticking, wait out any tick still doing PLC I/O, then close the PLC and archive."""
         self.stop()
-        closer = getattr(self._plc, "close", None)
-        if callable(closer):
-            closer()
-        self._plc = None
-        self._configure_plc_bridge()
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+            self._thread = None
+            self._worker = None
+        # A tick started from another thread reads and writes the PLC outside ``_lock``.
+        with self._tick_lock, self._lock:
+            closer = getattr(self._plc, "close", None)
+            if callable(closer):
+                closer()
+            self._plc = None
+            self._configure_plc_bridge()
+        if self._archive is not None:
+            self._archive.close()
+
+    def _start_worker_thread(self) -> None:
+        self._thread = QThread()
+        self._thread.setObjectName("pySIMIO runtime")
+        self._worker = _TickWorker(self._on_timer)
+        self._worker.moveToThread(self._thread)
+        self._worker_start.connect(self._worker.start_timer)
+        self._worker_stop.connect(self._worker.stop_timer)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+
+    def _start_timer(self) -> None:
+        self._scheduler.reset()
+        if self._worker is not None:
+            self._worker_start.emit(self._interval_ms)
+        else:
+            self._timer.start()
 
+    def _stop_timer(self) -> None:
+        if self._worker is not None:
+            self._worker_stop.emit()
+        else:
+            self._timer.stop()
 
-    def _refresh_device_states(self) -> None:
-        if not self.is_plc_connected:
-            return
+
+    def _collect_scan_tags(self) -> None:
+        orchestrator = self._build.orchestrator
+        self._external_refs = orchestrator.external_refs if orchestrator is not None else ()
+        self._external_values = [None] * (max((symbol for symbol, _ in self._external_refs), default=-1) + 1)
+        external = [tag for _, tag in self._external_refs]
+        self._scan_tags = tuple(dict.fromkeys([*self._devices.read_tags, *external]))
+        scanned = set(self._scan_tags)
+        self._config_tags = tuple(tag for tag in self._devices.config_tags if tag not in scanned)
+        self._config_read_at = None
+
+    def _config_due(self) -> bool:
+        if not self._config_tags:
+            return False
+        if self._config_read_at is None:
+            return True
+        return time.monotonic() - self._config_read_at >= self._config_refresh_s
+
+    def _scan_request(self) -> _ScanRequest | None:
+        """Tags to read in one batched request this tick, or ``None`` without a PLC reader.
+
+        Configuration members ride along in the same request when they are due.
+        """
+        connected = self.is_plc_connected
+        if connected and not self._plc_connected:
+            # A (re)connected PLC may have new configuration; read it with this scan.
+            self._config_read_at = None
+        self._plc_connected = connected
+        if not connected:
+            return None
         reader = getattr(self._plc, "read_tags", None)
         if not callable(reader):
-            return
-        tags = self._devices.required_read_tags()
-        if tags:
-            self._devices.apply_values(reader(tags))
+            return None
+        refresh_config = self._config_due()
+        tags = [*self._scan_tags, *self._config_tags] if refresh_config else list(self._scan_tags)
+        if not tags:
+            return None
+        return _ScanRequest(reader, tags, refresh_config)
+
+    def _apply_scan(self, scan: _ScanRequest | None, values: dict[str, Any]) -> None:
+        self._scan_values = values or {}
+        if scan is not None:
+            self._devices.apply_values(self._scan_values, MemberClass.SCAN)
+            if scan.refresh_config and any(tag in self._scan_values for tag in self._config_tags):
+                # A failed or empty read leaves the refresh due for the next scan.
+                self._devices.apply_values(self._scan_values, MemberClass.CONFIG)
+                self._config_read_at = time.monotonic()
+        self._load_external_values()
 
     def _configure_plc_bridge(self) -> None:
         write_fn: Callable[[str, float], bool | None] | None = None
+        batch_write_fn: Callable[[dict[str, float]], dict[str, bool]] | None = None
         if self.is_plc_connected:
             candidate = getattr(self._plc, "write_tag", None)
             if callable(candidate):
                 write_fn = candidate
-        self._bridge.set_write_fn(write_fn)
+            candidate = getattr(self._plc, "write_tags", None)
+            if callable(candidate):
+                batch_write_fn = candidate
+        self._bridge.set_write_fn(write_fn, batch_write_fn)
 
     def _register_outputs(self) -> None:
         self._bridge.clear_sources()
         models_by_name = {item.name: item for item in self.store.get_models()}
+        store = self.value_store
         for name, component in self._build.components.items():
             model = models_by_name.get(name)
             if model and model.active and model.tag:
-                self._bridge.register_source(model.tag, component.current_value)
-
-    def _read_external_value(self, name: str) -> float | None:
-        if not name or not self.is_plc_connected:
-            return None
-        reader = getattr(self._plc, "read_tag", None)
-        if not callable(reader):
-            return None
-        value = reader(name)
-        try:
-            return None if value is None else float(value)
-        except (TypeError, ValueError):
-            return None
+                getter = store.getter(name) if store is not None and name in store else component.current_value
+                self._bridge.register_source(model.tag, getter, level=self._build.orchestrator.rate_of(name))
+
+    def _keep_latest(self) -> None:
+        store = self.value_store
+        # Swapped in as one tuple so readers on other threads see a consistent pair.
+        self._latest = (store.names, store.values.copy()) if store is not None else ((), np.empty(0, dtype=np.float64))
+
+    def _load_external_values(self) -> None:
+        """Copy scanned external inputs into the slots the orchestrator reads by symbol id."""
+        scan = self._scan_values
+        values = self._external_values
+        for symbol, tag in self._external_refs:
+            value = scan.get(tag)
+            try:
+                values[symbol] = None if value is None else float(value)
+            except (TypeError, ValueError):
+                values[symbol] = None
 
     def _fail(self, message: str) -> None:
-        self._timer.stop()
+        self._stop_timer()
         self._bridge.stop()
         self._set_state(RuntimeState.FAULTED)
         self.faulted.emit(message)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from domain.models import ConfiguredModel
 
@@ -24,6 +24,7 @@ class ValidationIssue:
 @dataclass(slots=True)
 class ValidationReport:
     issues: list[ValidationIssue] = field(default_factory=list)
+    _by_model: dict[str, list[str]] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def errors(self) -> list[ValidationIssue]:
@@ -38,10 +39,16 @@ class ValidationReport:
         return not self.errors
 
     def by_model(self) -> dict[str, list[str]]:
-        grouped: dict[str, list[str]] = {}
-        for issue in self.errors:
-            grouped.setdefault(issue.model_name, []).append(issue.message)
-        return grouped
+        """Error messages grouped by model name; built once, treat as read-only."""
+        if self._by_model is None:
+            grouped: dict[str, list[str]] = {}
+            for issue in self.errors:
+                grouped.setdefault(issue.model_name, []).append(issue.message)
+            self._by_model = grouped
+        return self._by_model
+
+    def errors_for(self, model_name: str) -> list[str]:
+        return self.by_model().get(model_name, [])
 
     def format_for_dialog(self) -> str:
         if not self.issues:
@@ -91,54 +98,99 @@ def _length_to_m(value, unit: str) -> float:
 
 
 class SimulationValidator:
-    """Validate model configuration independently of component construction."""
+    """Validate model configuration independently of component construction.
+
+    Per-model results are cached by the model's content hash. Cross-reference
+    warnings are reused too unless the model changed or a name it refers to was
+    added or removed, so a validate after one edit only re-checks that model and
+    its referrers.
+    """
 
     SUPPORTED_TYPES = {"flow", "pressure", "level", "temperature", "sensor"}
 
-    def validate(self, models: Iterable[ConfiguredModel]) -> ValidationReport:
+    def __init__(self) -> None:
+        self._local: dict[str, tuple[ValidationIssue, ...]] = {}
+        self._references: dict[str, tuple[ValidationIssue, ...]] = {}
+        self._known_names: frozenset[str] = frozenset()
+
+    def validate(
+        self,
+        models: Iterable[ConfiguredModel],
+        fingerprints: Sequence[str] | None = None,
+    ) -> ValidationReport:
+        """Validate ``models``; ``fingerprints``, aligned with them, saves re-hashing."""
         model_list = list(models)
-        report = ValidationReport()
+        if fingerprints is None:
+            fingerprints = [model.fingerprint() for model in model_list]
+        issues: list[ValidationIssue] = []
         names: dict[str, int] = {}
 
-        for model in model_list:
+        local: dict[str, tuple[ValidationIssue, ...]] = {}
+        for model, fingerprint in zip(model_list, fingerprints):
             key = model.name.strip().casefold()
             if key:
                 names[key] = names.get(key, 0) + 1
-            report.issues.extend(self.validate_model(model))
+            cached = local.get(fingerprint) or self._local.get(fingerprint)
+            if cached is None:
+                cached = tuple(self.validate_model(model))
+            local[fingerprint] = cached
+            issues.extend(cached)
+        self._local = local
 
         for model in model_list:
             key = model.name.strip().casefold()
             if key and names.get(key, 0) > 1:
-                report.issues.append(
+                issues.append(
                     ValidationIssue(model.name, "Model names must be unique.")
                 )
 
-        known_names = {model.name.strip() for model in model_list if model.name.strip()}
-        for model in model_list:
-            model_type = (model.type or "None").strip().lower()
-            if model_type in {"flow", "pressure", "temperature"}:
-                control = str((model.inputs or {}).get("control") or "").strip()
-                if control and control not in known_names and not model.tag:
-                    report.issues.append(
-                        ValidationIssue(
-                            model.name or "<unnamed>",
-                            f"Control source '{control}' is not another configured model. "
-                            "It will require a PLC/external value at runtime.",
-                            ValidationSeverity.WARNING,
-                        )
+        known_names = frozenset(model.name.strip() for model in model_list if model.name.strip())
+        renamed = known_names ^ self._known_names
+        references: dict[str, tuple[ValidationIssue, ...]] = {}
+        for model, fingerprint in zip(model_list, fingerprints):
+            cached = references.get(fingerprint) or self._references.get(fingerprint)
+            if cached is None or not renamed.isdisjoint(self._referenced_names(model)):
+                cached = tuple(self._reference_issues(model, known_names))
+            references[fingerprint] = cached
+            issues.extend(cached)
+        self._references = references
+        self._known_names = known_names
+
+        return ValidationReport(issues)
+
+    @staticmethod
+    def _referenced_names(model: ConfiguredModel) -> tuple[str, ...]:
+        inputs = model.inputs or {}
+        return (
+            str(inputs.get("control") or "").strip(),
+            str(inputs.get("source") or "").strip(),
+        )
+
+    @staticmethod
+    def _reference_issues(model: ConfiguredModel, known_names: frozenset[str]) -> list[ValidationIssue]:
+        model_type = (model.type or "None").strip().lower()
+        if model_type in {"flow", "pressure", "temperature"}:
+            control = str((model.inputs or {}).get("control") or "").strip()
+            if control and control not in known_names and not model.tag:
+                return [
+                    ValidationIssue(
+                        model.name or "<unnamed>",
+                        f"Control source '{control}' is not another configured model. "
+                        "It will require a PLC/external value at runtime.",
+                        ValidationSeverity.WARNING,
                     )
-            elif model_type == "sensor":
-                source = str((model.inputs or {}).get("source") or "").strip()
-                if source and source not in known_names:
-                    report.issues.append(
-                        ValidationIssue(
-                            model.name or "<unnamed>",
-                            f"Sensor source '{source}' does not match a configured model.",
-                            ValidationSeverity.WARNING,
-                        )
+                ]
+        elif model_type == "sensor":
+            source = str((model.inputs or {}).get("source") or "").strip()
+            if source and source not in known_names:
+                return [
+                    ValidationIssue(
+                        model.name or "<unnamed>",
+                        f"Sensor source '{source}' does not match a configured model.",
+                        ValidationSeverity.WARNING,
                     )
-
-        return report
+                ]
+        return []
 
     def validate_model(self, model: ConfiguredModel) -> list[ValidationIssue]:
         name = model.name.strip() or "<unnamed>"
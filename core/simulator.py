@@ -11,8 +11,46 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import deque
+from enum import Enum
+import math
 import random
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from core.component_bank import FirstOrderBank
+
+
+class IntegrationMode(str, Enum):
+    """Discretization used for first-order responses.
+
+    ``EULER`` keeps the historical ``alpha = min(1, dt / tau)`` step. ``EXACT``
+    uses the analytic step ``1 - exp(-dt / tau)``, which is independent of the
+    tick size, and lets level integrators use step-averaged inflows.
+    """
+
+    EULER = "euler"
+    EXACT = "exact"
+
+
+def first_order_alpha(dt: float, tau: float, integration: IntegrationMode) -> float:
+    if integration is IntegrationMode.EXACT:
+        return -math.expm1(-dt / tau)
+    return min(1.0, dt / tau)
+
+
+def first_order_mean(
+    start_value: float,
+    target: float,
+    tau: float,
+    start: float,
+    stop: float,
+) -> float:
+    """Average of an exact first-order response over ``[start, stop]`` seconds into a step."""
+    offset = start_value - target
+    if stop <= start:
+        return target + offset * math.exp(-start / tau)
+    decay = math.exp(-start / tau) - math.exp(-stop / tau)
+    return target + offset * tau * decay / (stop - start)
 
 
 class SimComponent(ABC):
@@ -31,25 +69,88 @@ class SimComponent(ABC):
 
 
 class FirstOrderTargetComponent(SimComponent):
-    """Base for components that move toward a supplied target."""
+    """Base for components that move toward a supplied target.
 
-    def __init__(self, name: str, *, tau: float, initial: float) -> None:
+    The component may be bound to a ``FirstOrderBank``; its state then lives in
+    the bank's arrays and the bank advances it together with its peers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        tau: float,
+        initial: float,
+        integration: IntegrationMode = IntegrationMode.EULER,
+    ) -> None:
         super().__init__(name)
         self.tau = max(float(tau), 1e-6)
+        self.integration = IntegrationMode(integration)
         self._target = float(initial)
         self._value = float(initial)
+        self._step_start = float(initial)
+        self._bank: FirstOrderBank | None = None
+        self._index = 0
+
+    @property
+    def target(self) -> float:
+        if self._bank is not None:
+            return float(self._bank.target[self._index])
+        return self._target
+
+    @property
+    def is_banked(self) -> bool:
+        return self._bank is not None
+
+    def bind(self, bank: FirstOrderBank, index: int) -> None:
+        self._bank = bank
+        self._index = int(index)
+
+    def unbind(self) -> None:
+        if self._bank is None:
+            return
+        self._target = float(self._bank.target[self._index])
+        self._value = float(self._bank.value[self._index])
+        self._step_start = float(self._bank.start[self._index])
+        self._bank = None
+        self._index = 0
+
+    def seed(self, value: float, target: float | None = None) -> None:
+        """Start an unbound component from a carried-over value (and target)."""
+        self._value = self._step_start = float(value)
+        self._target = float(value if target is None else target)
 
     def set_target(self, target: float) -> None:
-        self._target = float(target)
+        if self._bank is not None:
+            self._bank.target[self._index] = target
+        else:
+            self._target = float(target)
 
     def update(self, dt: float) -> None:
+        if self._bank is not None:
+            self._bank.step_one(self._index, dt)
+            return
         dt = max(float(dt), 0.0)
-        alpha = min(1.0, dt / self.tau)
-        self._value += (self._target - self._value) * alpha
+        self._step_start = self._value
+        self._value += (self._target - self._value) * first_order_alpha(dt, self.tau, self.integration)
 
     def current_value(self) -> float:
+        if self._bank is not None:
+            return float(self._bank.value[self._index])
         return float(self._value)
 
+    def mean_over(self, start: float, stop: float) -> float:
+        """Average value between two offsets into the last step.
+
+        Only meaningful for ``EXACT`` integration; Euler components report their
+        end-of-step value, matching how levels have always integrated them.
+        """
+        if self.integration is not IntegrationMode.EXACT:
+            return self.current_value()
+        if self._bank is not None:
+            return self._bank.mean_over(self._index, start, stop)
+        return first_order_mean(self._step_start, self._target, self.tau, start, stop)
+
 
 class Sensor(SimComponent):
     """Holding or mirrored sensor with optional noise and sample lag."""
@@ -143,6 +244,14 @@ class LevelComponent(SimComponent):
         self._qin_m3s = 0.0
         self._qout_m3s = 0.0
 
+    @property
+    def fill_fraction(self) -> float:
+        return self._volume_m3 / self.capacity_m3
+
+    @fill_fraction.setter
+    def fill_fraction(self, fraction: float) -> None:
+        self._volume_m3 = self.capacity_m3 * min(max(float(fraction), 0.0), 1.0)
+
     def set_flows(self, q_in_m3s: float, q_out_m3s: float) -> None:
         self._qin_m3s = float(q_in_m3s or 0.0)
         self._qout_m3s = float(q_out_m3s or 0.0)
@@ -152,6 +261,11 @@ class LevelComponent(SimComponent):
         self._volume_m3 += (self._qin_m3s - self._qout_m3s) * self.gain * dt
         self._volume_m3 = min(max(self._volume_m3, 0.0), self.capacity_m3)
 
+    def reaches_limit(self, net_flow_m3s: float, dt: float) -> bool:
+        """Return whether a step at ``net_flow_m3s`` would touch the 0 or capacity clamp."""
+        projected = self._volume_m3 + float(net_flow_m3s) * self.gain * max(float(dt), 0.0)
+        return not 0.0 < projected < self.capacity_m3
+
     def current_value(self) -> float:
         height_m = self._volume_m3 / self.area_m2
         if self.level_unit == "percent":
@@ -0,0 +1,47 @@
+"""Interned names for runtime lookups.
+
+Model, device, flow path, and tag names are matched case-insensitively. A
+``SymbolTable`` casefolds each name once and hands out a dense integer id, so
+runtime modules resolve references to ids when they are built and the tick
+loop indexes lists and arrays instead of hashing and casefolding strings.
+
+Ids are append-only for the lifetime of a table; a table shared across
+rebuilds keeps every id stable.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+class SymbolTable:
+    """Casefolded name to dense integer id."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.casefold() in self._ids
+
+    def intern(self, name: str) -> int:
+        """Id for ``name``, assigning the next one on first use."""
+        key = name.casefold()
+        symbol = self._ids.get(key)
+        if symbol is None:
+            symbol = self._ids[key] = len(self._names)
+            self._names.append(name)
+        return symbol
+
+    def id_of(self, name: str) -> int | None:
+        """Id for an already interned ``name`` without adding it."""
+        return self._ids.get(name.casefold())
+
+    def name_of(self, symbol: int) -> str:
+        """Spelling the symbol was first interned with."""
+        return self._names[symbol]
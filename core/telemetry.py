@@ -0,0 +1,127 @@
+"""Per-tick phase timing for the simulation runtime.
+
+``TickTelemetry`` is driven by the runtime with ``begin()``, one ``mark()`` per
+finished phase, and ``finish()``. Each phase keeps a rolling window of
+durations so p50/p95/max reflect recent behavior rather than the whole session.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+
+class TickPhase(str, Enum):
+    SCAN = "scan"
+    FLOW_PATHS = "flow_paths"
+    UPDATE = "update"
+    WRITE = "write"
+    PUBLISH = "publish"
+    TOTAL = "total"
+
+
+@dataclass(slots=True, frozen=True)
+class PhaseStats:
+    """Rolling duration statistics for one phase, in seconds."""
+
+    count: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class TickTiming:
+    """Phase durations of a single tick, in seconds."""
+
+    phases: dict[str, float]
+    total: float
+    overrun: bool
+
+
+class RollingHistogram:
+    """Fixed-size window of samples with nearest-rank percentiles."""
+
+    def __init__(self, window: int = 256) -> None:
+        self._samples: deque[float] = deque(maxlen=max(int(window), 1))
+
+    def add(self, value: float) -> None:
+        self._samples.append(float(value))
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def stats(self) -> PhaseStats:
+        if not self._samples:
+            return PhaseStats()
+        ordered = sorted(self._samples)
+        return PhaseStats(
+            count=len(ordered),
+            p50=_percentile(ordered, 0.50),
+            p95=_percentile(ordered, 0.95),
+            max=ordered[-1],
+            last=self._samples[-1],
+        )
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    rank = max(int(fraction * len(ordered) + 0.999999) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class TickTelemetry:
+    """Collect per-phase tick durations and flag ticks that exceed ``budget_s``."""
+
+    def __init__(
+        self,
+        budget_s: float,
+        *,
+        window: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.budget_s = float(budget_s)
+        self._window = window
+        self._clock = clock
+        self._histograms = {phase.value: RollingHistogram(window) for phase in TickPhase}
+        self._started = 0.0
+        self._last_mark = 0.0
+        self._current: dict[str, float] = {}
+        self.overruns = 0
+        self.ticks = 0
+        self.last: TickTiming | None = None
+
+    def begin(self) -> None:
+        self._started = self._last_mark = self._clock()
+        self._current = {}
+
+    def mark(self, phase: TickPhase) -> None:
+        """Record the time since the previous mark (or ``begin``) as ``phase``."""
+        now = self._clock()
+        self._current[phase.value] = self._current.get(phase.value, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def finish(self) -> TickTiming:
+        total = self._last_mark - self._started
+        overrun = total > self.budget_s
+        for name, duration in self._current.items():
+            self._histograms[name].add(duration)
+        self._histograms[TickPhase.TOTAL.value].add(total)
+        self.ticks += 1
+        if overrun:
+            self.overruns += 1
+        self.last = TickTiming(dict(self._current), total, overrun)
+        return self.last
+
+    def stats(self) -> dict[str, PhaseStats]:
+        return {name: histogram.stats() for name, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        for histogram in self._histograms.values():
+            histogram.clear()
+        self.overruns = 0
+        self.ticks = 0
+        self.last = None
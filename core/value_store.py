@@ -0,0 +1,59 @@
+"""Struct-of-arrays store for the primary value of every component in a build.
+
+Each component gets an integer slot for the lifetime of one build. The
+orchestrator lays slots out so every ``FirstOrderBank`` owns a contiguous slice
+and advances its values in place; other components are copied in after each
+update. Readers use ``values`` (or ``view()`` slices) directly, so snapshots,
+deltas, and recording are array operations rather than per-name calls.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+import numpy as np
+
+
+class ValueStore:
+    """One float64 array of component values with a name-to-slot index."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: tuple[str, ...] = tuple(names)
+        self.index: dict[str, int] = {name: slot for slot, name in enumerate(self.names)}
+        self.values = np.zeros(len(self.names), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def slot(self, name: str) -> int:
+        return self.index[name]
+
+    def get(self, name: str) -> float | None:
+        slot = self.index.get(name)
+        return None if slot is None else float(self.values[slot])
+
+    def view(self, start: int, stop: int) -> np.ndarray:
+        """Writable zero-copy slice of slots ``start:stop``."""
+        return self.values[start:stop]
+
+    def getter(self, name: str) -> Callable[[], float]:
+        """Zero-argument reader for one slot, for APIs that take value callbacks."""
+        values = self.values
+        slot = self.index[name]
+        return lambda: float(values[slot])
+
+    def snapshot(self) -> dict[str, float]:
+        return dict(zip(self.names, self.values.tolist()))
+
+    def changed_since(self, published: np.ndarray, epsilon: float = 0.0) -> dict[str, float]:
+        """Values that moved more than ``epsilon`` from ``published``, which is updated in place."""
+        values = self.values
+        moved = np.flatnonzero(~(np.abs(values - published) <= epsilon))
+        if not moved.size:
+            return {}
+        published[moved] = values[moved]
+        names = self.names
+        return {names[slot]: value for slot, value in zip(moved.tolist(), values[moved].tolist())}
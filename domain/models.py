@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field, replace
 from typing import Any, Mapping
 
 
+def _period_ms(value: Any) -> int:
+    try:
+        return max(int(float(value or 0)), 0)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
 @dataclass(slots=True)
 class ConfiguredModel:
     """Persistent configuration for one simulated process variable."""
@@ -13,6 +22,7 @@ class ConfiguredModel:
     tag: str = ""
     active: bool = False
     fidelity: int | str = 0
+    update_period_ms: int = 0
     inputs: dict[str, Any] = field(default_factory=dict)
     params: dict[str, Any] = field(default_factory=dict)
     source: str = "manual"
@@ -27,6 +37,7 @@ class ConfiguredModel:
             tag=str(data.get("tag", "")),
             active=bool(data.get("active", False)),
             fidelity=data.get("fidelity", 0),
+            update_period_ms=_period_ms(data.get("update_period_ms")),
             inputs=dict(data.get("inputs") or {}),
             params=dict(data.get("params") or {}),
             source=str(data.get("source", "manual") or "manual"),
@@ -37,6 +48,27 @@ class ConfiguredModel:
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    def copy(self) -> "ConfiguredModel":
+        """Copy with its own ``inputs``/``params`` dicts; nested lists are shared and replaced on edit, not mutated."""
+        return ConfiguredModel(
+            name=self.name,
+            type=self.type,
+            tag=self.tag,
+            active=self.active,
+            fidelity=self.fidelity,
+            update_period_ms=self.update_period_ms,
+            inputs=dict(self.inputs),
+            params=dict(self.params),
+            source=self.source,
+            discovered_data_type=self.discovered_data_type,
+            discovered_path=self.discovered_path,
+        )
+
+    def fingerprint(self) -> str:
+        """Content hash of the configuration, used to detect edits between builds."""
+        payload = json.dumps(self.to_dict(), sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 @dataclass(slots=True)
 class DeviceRecord:
@@ -61,6 +93,14 @@ class DeviceRecord:
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    def copy(self) -> "DeviceRecord":
+        return replace(self)
+
+    @property
+    def identity(self) -> str:
+        """Casefolded controller path (or name) that identifies the device across syncs."""
+        return self.controller_path.casefold() or self.name.casefold()
+
 
 @dataclass(slots=True)
 class FlowPath:
@@ -81,6 +121,9 @@ class FlowPath:
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    def copy(self) -> "FlowPath":
+        return replace(self, segments=list(self.segments))
+
 
 @dataclass(slots=True, frozen=True)
 class PlantPaxModule:
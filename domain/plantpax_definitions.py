@@ -12,12 +12,23 @@ class DeviceCategory(str, Enum):
     OTHER = "other"
 
 
+class MemberClass(str, Enum):
+    """How often a read member is refreshed: every scan, or on connect and a slow cadence."""
+
+    SCAN = "scan"
+    CONFIG = "config"
+
+
 @dataclass(frozen=True, slots=True)
 class PlantPaxDeviceDefinition:
     data_type: str
     category: DeviceCategory
     read_members: dict[str, str] = field(default_factory=dict)
     write_members: dict[str, str] = field(default_factory=dict)
+    config_members: frozenset[str] = frozenset({"eu_min", "eu_max"})
+
+    def member_class(self, member: str) -> MemberClass:
+        return MemberClass.CONFIG if member in self.config_members else MemberClass.SCAN
 
     def tag(self, base_tag: str, member: str) -> str:
         suffix = self.read_members.get(member) or self.write_members.get(member)
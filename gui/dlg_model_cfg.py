@@ -93,6 +93,8 @@ class ModelConfigWizard(QDialog):
         self.name_edit = QLineEdit()
         self.tag_edit = QLineEdit()
         self.active_chk = QCheckBox("Active")
+        self.period_edit = QLineEdit()
+        self.period_edit.setPlaceholderText("every tick")
         self.type_combo = QComboBox()
         self.type_combo.addItems(MODEL_TYPES)
         self.type_combo.currentTextChanged.connect(self._on_type_changed)
@@ -100,6 +102,7 @@ class ModelConfigWizard(QDialog):
         meta_form.addRow("Name", self.name_edit)
         meta_form.addRow("PLC Tag", self.tag_edit)
         meta_form.addRow("Type", self.type_combo)
+        meta_form.addRow("Update Period (ms)", self.period_edit)
         meta_form.addRow("", self.active_chk)
 
         root.addWidget(meta_grp)
@@ -641,6 +644,7 @@ class ModelConfigWizard(QDialog):
         self.name_edit.setText(self.pv.name or "")
         self.tag_edit.setText(self.pv.tag or "")
         self.active_chk.setChecked(bool(self.pv.active))
+        self.period_edit.setText(str(self.pv.update_period_ms) if self.pv.update_period_ms else "")
         self.type_combo.setCurrentText(self.pv.type or "None")
         self._apply_type_visibility(self.pv.type or "None")
 
@@ -790,9 +794,17 @@ class ModelConfigWizard(QDialog):
             QMessageBox.warning(self, "Missing Name", "Please provide a model name.")
             return
 
+        period_text = self.period_edit.text().strip()
+        try:
+            period = int(float(period_text)) if period_text else 0
+        except (ValueError, OverflowError):
+            QMessageBox.warning(self, "Invalid Update Period", "Update period must be a number of milliseconds.")
+            return
+
         self.pv.name = name
         self.pv.tag = self.tag_edit.text().strip()
         self.pv.active = self.active_chk.isChecked()
+        self.pv.update_period_ms = max(period, 0)
         self.pv.type = self.type_combo.currentText()
 
         t = self.pv.type
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PyQt6.QtCore import QSettings, Qt
+from PyQt6.QtCore import QSettings, QSortFilterProxyModel, Qt
 from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import (
     QAbstractItemView,
+    QComboBox,
     QFileDialog,
     QHeaderView,
     QLabel,
+    QListWidget,
+    QListWidgetItem,
     QMainWindow,
     QMenu,
     QMessageBox,
+    QSplitter,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QTabWidget,
@@ -26,10 +31,14 @@ from core.csv_io import export_flowpaths_csv, export_models_csv, import_flowpath
 from core.simulation_manager import RuntimeState, SimulationManager
 from domain.models import ConfiguredModel, FlowPath
 from gui.dlg_model_cfg import ModelConfigWizard
+from gui.pv_table_model import DEFAULT_DISPLAY_INTERVAL_MS, ProcessVariableTableModel
+from gui.trend_widget import DEFAULT_TREND_SPAN_S, TrendPlot
 from persistence.project_store import PROJECT_EXTENSION, ProjectStore
 
 PROJECT_FILTER = f"pySIMIO Project (*{PROJECT_EXTENSION})"
 MAX_RECENT_PROJECTS = 8
+DEFAULT_HISTORY_MEMORY_MB = 256
+TREND_SPANS = (("1 min", 60.0), ("5 min", 300.0), ("30 min", 1800.0), ("2 h", 7200.0), ("8 h", 28800.0), ("24 h", 86400.0))
 
 
 class MainWindow(QMainWindow):
@@ -38,10 +47,20 @@ class MainWindow(QMainWindow):
         self.store = store
         self.models = self.store.get_models()
         self._settings = QSettings()
-        self._last_values: dict[str, float] = {}
 
-        self.runtime = SimulationManager(store, plc, parent=self)
+        # Moves under half of the last displayed digit wait for the periodic snapshot.
+        self.runtime = SimulationManager(
+            store,
+            plc,
+            threaded=True,
+            delta_epsilon=5e-4,
+            archive_dir=self._settings.value("history_archive_dir") or None,
+            archive_max_bytes=self._archive_max_bytes(),
+            history_max_bytes=self._history_max_bytes(),
+            parent=self,
+        )
         self.runtime.values_changed.connect(self._refresh_values)
+        self.runtime.values_delta.connect(self._refresh_values)
         self.runtime.state_changed.connect(self._on_runtime_state_changed)
         self.runtime.faulted.connect(self._on_runtime_fault)
 
@@ -49,6 +68,7 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.tabs)
         self._build_process_tab()
         self._build_flowpaths_tab()
+        self._build_trends_tab()
         self._build_menu()
         self._build_project_toolbar()
         self._build_status_bar()
@@ -233,8 +253,12 @@ class MainWindow(QMainWindow):
         self.scan_action = toolbar.addAction("Read from PLC", self.on_read_from_plc)
         layout.addWidget(toolbar)
 
-        self.process_table = QTableWidget(0, 7, tab)
-        self.process_table.setHorizontalHeaderLabels(["Name", "PLC Tag", "Model Type", "Active", "Current Value", "Source", "Status"])
+        display_interval_ms = int(self._settings.value("display_interval_ms", DEFAULT_DISPLAY_INTERVAL_MS))
+        self.pv_model = ProcessVariableTableModel(self, display_interval_ms=display_interval_ms)
+        self.pv_proxy = QSortFilterProxyModel(self)
+        self.pv_proxy.setSourceModel(self.pv_model)
+        self.process_table = QTableView(tab)
+        self.process_table.setModel(self.pv_proxy)
         self._configure_table(self.process_table)
         self.process_table.doubleClicked.connect(self.on_configure_model)
         header = self.process_table.horizontalHeader()
@@ -247,27 +271,10 @@ class MainWindow(QMainWindow):
 
     def _refresh_pv_table(self) -> None:
         selected = self._selected_model_name()
-        self.process_table.setSortingEnabled(False)
-        self.process_table.setRowCount(0)
-        for model in self.models:
-            row = self.process_table.rowCount()
-            self.process_table.insertRow(row)
-            values = [
-                model.name,
-                model.tag or "—",
-                model.type,
-                "Yes" if model.active else "No",
-                self._format_value(self._last_values.get(model.name)),
-                model.source or "manual",
-                self._model_status(model),
-            ]
-            for column, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                if column in {3, 4, 6}:
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.process_table.setItem(row, column, item)
-        self.process_table.setSortingEnabled(True)
-        self._restore_row_selection(self.process_table, selected)
+        self.pv_model.set_models(self.models, self._model_status)
+        row = self.pv_model.row_for(selected) if selected else None
+        if row is not None:
+            self.process_table.selectRow(self.pv_proxy.mapFromSource(self.pv_model.index(row, 0)).row())
 
     def on_remove_model(self) -> None:
         model = self._get_selected_model(show_message=True)
@@ -333,6 +340,58 @@ class MainWindow(QMainWindow):
         if QMessageBox.question(self, "Remove Flow Path", f"Remove '{flowpath.name}' from this project?") is QMessageBox.StandardButton.Yes:
             self._on_flowpath_remove(flowpath.name)
 
+    # Trends ------------------------------------------------------------
+    def _build_trends_tab(self) -> None:
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        toolbar = QToolBar("Trend Actions", tab)
+        toolbar.setMovable(False)
+        toolbar.addWidget(QLabel("Span: ", toolbar))
+        self.trend_span = QComboBox(toolbar)
+        for label, seconds in TREND_SPANS:
+            self.trend_span.addItem(label, seconds)
+        self.trend_span.setCurrentIndex(next(index for index, (_, seconds) in enumerate(TREND_SPANS) if seconds == DEFAULT_TREND_SPAN_S))
+        self.trend_span.currentIndexChanged.connect(lambda _index: self.trend_plot.set_span(self.trend_span.currentData()))
+        toolbar.addWidget(self.trend_span)
+        toolbar.addAction("Clear", self._on_clear_trends)
+        layout.addWidget(toolbar)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal, tab)
+        self.trend_list = QListWidget(splitter)
+        self.trend_list.itemChanged.connect(self._on_trend_selection_changed)
+        display_interval_ms = int(self._settings.value("display_interval_ms", DEFAULT_DISPLAY_INTERVAL_MS))
+        self.trend_plot = TrendPlot(self.runtime.historian, splitter, interval_ms=display_interval_ms)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([200, 800])
+        layout.addWidget(splitter)
+        self.tabs.addTab(tab, "Trends")
+
+    def _refresh_trend_list(self) -> None:
+        checked = set(self.trend_plot.signals)
+        self.trend_list.blockSignals(True)
+        self.trend_list.clear()
+        for model in self.models:
+            item = QListWidgetItem(model.name, self.trend_list)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if model.name in checked else Qt.CheckState.Unchecked)
+        self.trend_list.blockSignals(False)
+        self._on_trend_selection_changed()
+
+    def _on_trend_selection_changed(self, _item: QListWidgetItem | None = None) -> None:
+        names = [
+            self.trend_list.item(row).text()
+            for row in range(self.trend_list.count())
+            if self.trend_list.item(row).checkState() is Qt.CheckState.Checked
+        ]
+        self.trend_plot.set_signals(names)
+
+    def _on_clear_trends(self) -> None:
+        self.trend_list.blockSignals(True)
+        for row in range(self.trend_list.count()):
+            self.trend_list.item(row).setCheckState(Qt.CheckState.Unchecked)
+        self.trend_list.blockSignals(False)
+        self._on_trend_selection_changed()
+
     # Model/flow-path operations ---------------------------------------
     def on_add_model(self) -> None:
         self._open_model_dialog(None)
@@ -471,26 +530,24 @@ class MainWindow(QMainWindow):
         self.models = self.store.get_models()
         self.runtime.build()
         self._refresh_pv_table()
+        self._refresh_trend_list()
         self._update_window_title()
 
     def _refresh_all(self) -> None:
         self.models = self.store.get_models()
         self._refresh_pv_table()
+        self._refresh_trend_list()
         self._refresh_flowpaths_table()
-        self._refresh_values(self.runtime.current_values())
+        self.pv_model.update_values(self.runtime.current_values())
+        self.pv_model.flush()
         self._refresh_connection_status()
         self._update_window_title()
 
     def _refresh_values(self, values: dict[str, float]) -> None:
-        self._last_values = dict(values)
-        for row in range(self.process_table.rowCount()):
-            name_item = self.process_table.item(row, 0)
-            value_item = self.process_table.item(row, 4)
-            if name_item is not None and value_item is not None:
-                value_item.setText(self._format_value(values.get(name_item.text())))
+        self.pv_model.update_values(values)
 
     @staticmethod
-    def _configure_table(table: QTableWidget) -> None:
+    def _configure_table(table: QTableView) -> None:
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -499,9 +556,10 @@ class MainWindow(QMainWindow):
         table.verticalHeader().setVisible(False)
 
     def _selected_model_name(self) -> str | None:
-        row = self.process_table.currentRow()
-        item = self.process_table.item(row, 0) if row >= 0 else None
-        return item.text() if item else None
+        index = self.process_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.pv_model.model_name(self.pv_proxy.mapToSource(index).row())
 
     def _selected_flowpath_name(self) -> str | None:
         row = self.flowpaths_table.currentRow()
@@ -523,16 +581,12 @@ class MainWindow(QMainWindow):
                 return
 
     def _model_status(self, model: ConfiguredModel) -> str:
-        if self.runtime.validation_report.by_model().get(model.name):
+        if self.runtime.validation_report.errors_for(model.name):
             return "Error"
         if model.type in {"", "None"}:
             return "Unconfigured"
         return "Ready"
 
-    @staticmethod
-    def _format_value(value: float | None) -> str:
-        return "—" if value is None else f"{value:.3f}"
-
     def _update_window_title(self) -> None:
         dirty = " *" if self.store.is_dirty else ""
         self.setWindowTitle(f"{self.store.display_name}{dirty} — pySIMIO")
@@ -551,6 +605,24 @@ class MainWindow(QMainWindow):
     def _on_runtime_fault(self, message: str) -> None:
         QMessageBox.critical(self, "Simulation Fault", message)
 
+    def _history_max_bytes(self) -> int:
+        """In-memory trend history budget from ``history_memory_mb``, shared by every signal."""
+        try:
+            megabytes = float(self._settings.value("history_memory_mb", DEFAULT_HISTORY_MEMORY_MB))
+        except (TypeError, ValueError):
+            megabytes = DEFAULT_HISTORY_MEMORY_MB
+        if not 0 < megabytes < float("inf"):
+            megabytes = DEFAULT_HISTORY_MEMORY_MB
+        return int(megabytes * (1 << 20))
+
+    def _archive_max_bytes(self) -> int | None:
+        """``history_archive_max_gb`` from the settings; missing, invalid, or 0 keeps all history."""
+        try:
+            gigabytes = float(self._settings.value("history_archive_max_gb", 0) or 0)
+        except (TypeError, ValueError):
+            return None
+        return int(gigabytes * (1 << 30)) if 0 < gigabytes < float("inf") else None
+
     def _recent_projects(self) -> list[str]:
         value = self._settings.value("recent_projects", [])
         if isinstance(value, str):
@@ -0,0 +1,142 @@
+"""Table model for the Process Variables tab."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Mapping
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QTimer
+
+from domain.models import ConfiguredModel
+
+DEFAULT_DISPLAY_INTERVAL_MS = 250
+
+
+def format_value(value: float | None) -> str:
+    return "—" if value is None else f"{value:.3f}"
+
+
+class ProcessVariableTableModel(QAbstractTableModel):
+    """Process variables with their latest runtime values.
+
+    Cell text is formatted once and cached. ``update_values`` only records the
+    snapshot; a single-shot timer flushes it at most once per display interval
+    and emits ``dataChanged`` for runs of rows whose formatted value changed.
+    """
+
+    COLUMNS = ("Name", "PLC Tag", "Model Type", "Active", "Current Value", "Source", "Status")
+    VALUE_COLUMN = 4
+    CENTERED_COLUMNS = frozenset({3, 4, 6})
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        display_interval_ms: int = DEFAULT_DISPLAY_INTERVAL_MS,
+    ) -> None:
+        super().__init__(parent)
+        self._rows: list[list[str]] = []
+        self._names: list[str] = []
+        self._row_by_name: dict[str, int] = {}
+        self._values: dict[str, float] = {}
+        self._pending: dict[str, float] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(max(int(display_interval_ms), 0))
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def display_interval_ms(self) -> int:
+        return self._flush_timer.interval()
+
+    def set_display_interval(self, interval_ms: int) -> None:
+        self._flush_timer.setInterval(max(int(interval_ms), 0))
+
+    def set_models(
+        self,
+        models: Iterable[ConfiguredModel],
+        status: Callable[[ConfiguredModel], str],
+    ) -> None:
+        self.beginResetModel()
+        self._rows = []
+        self._names = []
+        self._row_by_name = {}
+        for model in models:
+            self._row_by_name.setdefault(model.name, len(self._rows))
+            self._names.append(model.name)
+            self._rows.append(
+                [
+                    model.name,
+                    model.tag or "—",
+                    model.type,
+                    "Yes" if model.active else "No",
+                    format_value(self._values.get(model.name)),
+                    model.source or "manual",
+                    status(model),
+                ]
+            )
+        self.endResetModel()
+
+    def update_values(self, values: Mapping[str, float]) -> None:
+        """Queue a value snapshot; repaints are coalesced to the display interval."""
+        self._pending.update(values)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, {}
+        self._values.update(pending)
+        changed: list[int] = []
+        for name, value in pending.items():
+            row = self._row_by_name.get(name)
+            if row is None:
+                continue
+            text = format_value(value)
+            cells = self._rows[row]
+            if cells[self.VALUE_COLUMN] != text:
+                cells[self.VALUE_COLUMN] = text
+                changed.append(row)
+        changed.sort()
+        start = 0
+        for position in range(1, len(changed) + 1):
+            if position == len(changed) or changed[position] != changed[position - 1] + 1:
+                self.dataChanged.emit(
+                    self.index(changed[start], self.VALUE_COLUMN),
+                    self.index(changed[position - 1], self.VALUE_COLUMN),
+                    [Qt.ItemDataRole.DisplayRole],
+                )
+                start = position
+
+    def model_name(self, row: int) -> str | None:
+        return self._names[row] if 0 <= row < len(self._names) else None
+
+    def row_for(self, name: str) -> int | None:
+        return self._row_by_name.get(name)
+
+    def value(self, name: str) -> float | None:
+        return self._values.get(name)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() in self.CENTERED_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
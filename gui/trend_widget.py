@@ -0,0 +1,201 @@
+"""Live trend plot for the Trends tab."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Iterable, Mapping, Protocol
+
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QWidget
+
+from core.historian import TrendSeries
+
+DEFAULT_TREND_SPAN_S = 300.0
+DEFAULT_TREND_INTERVAL_MS = 250
+TREND_COLORS = (
+    "#1f77b4",
+    "#d62728",
+    "#2ca02c",
+    "#ff7f0e",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#17becf",
+    "#bcbd22",
+    "#7f7f7f",
+)
+
+
+class TrendSource(Protocol):
+    def span(self) -> tuple[float, float] | None: ...
+
+    def query(self, names: Iterable[str], start: float, stop: float, columns: int) -> dict[str, TrendSeries]: ...
+
+
+def value_range(series: Iterable[TrendSeries]) -> tuple[float, float]:
+    """Padded vertical range covering every envelope; a flat or empty range is widened."""
+    lows = [float(np.nanmin(item.minimum)) for item in series if len(item) and not np.isnan(item.minimum).all()]
+    highs = [float(np.nanmax(item.maximum)) for item in series if len(item) and not np.isnan(item.maximum).all()]
+    if not lows:
+        return 0.0, 1.0
+    low, high = min(lows), max(highs)
+    pad = (high - low) * 0.05 if high > low else max(abs(high) * 0.05, 0.5)
+    return low - pad, high + pad
+
+
+def envelope_polylines(
+    series: TrendSeries,
+    area: QRectF,
+    start: float,
+    stop: float,
+    low: float,
+    high: float,
+) -> list[QPolygonF]:
+    """Polylines tracing the min/max envelope inside ``area``, split at gaps.
+
+    Each point contributes a vertical stroke from its maximum to its minimum,
+    so a trend costs two vertices per pixel column however much it decimates.
+    """
+    if not len(series) or stop <= start or high <= low:
+        return []
+    x = area.left() + (series.times - start) * (area.width() / (stop - start))
+    scale = area.height() / (high - low)
+    top = area.bottom() - (series.maximum - low) * scale
+    bottom = area.bottom() - (series.minimum - low) * scale
+    polylines: list[QPolygonF] = []
+    current = QPolygonF()
+    for px, y_max, y_min in zip(x.tolist(), top.tolist(), bottom.tolist()):
+        if math.isnan(y_max) or math.isnan(y_min):
+            if current.size():
+                polylines.append(current)
+                current = QPolygonF()
+            continue
+        current.append(QPointF(px, y_max))
+        if y_min != y_max:
+            current.append(QPointF(px, y_min))
+    if current.size():
+        polylines.append(current)
+    return polylines
+
+
+class TrendPlot(QWidget):
+    """Plot the recent history of any number of signals.
+
+    A timer pulls one min/max query per refresh with a point per pixel column
+    of the plot area, so repaint cost follows the widget width rather than the
+    history length or tick rate. The timer only runs while the widget is
+    visible and has signals to show.
+    """
+
+    MARGIN = 8.0
+
+    def __init__(
+        self,
+        source: TrendSource | None = None,
+        parent: QWidget | None = None,
+        *,
+        span_s: float = DEFAULT_TREND_SPAN_S,
+        interval_ms: int = DEFAULT_TREND_INTERVAL_MS,
+    ) -> None:
+        super().__init__(parent)
+        self._source = source
+        self._names: tuple[str, ...] = ()
+        self._colors: dict[str, QColor] = {}
+        self._series: dict[str, TrendSeries] = {}
+        self._window = (0.0, 0.0)
+        self.span_s = max(float(span_s), 1.0)
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(int(interval_ms), 1))
+        self._timer.timeout.connect(self.refresh)
+        self.setMinimumSize(200, 120)
+
+    @property
+    def signals(self) -> tuple[str, ...]:
+        return self._names
+
+    @property
+    def series(self) -> Mapping[str, TrendSeries]:
+        return self._series
+
+    def set_source(self, source: TrendSource | None) -> None:
+        self._source = source
+        self.refresh()
+
+    def set_signals(self, names: Iterable[str]) -> None:
+        self._names = tuple(dict.fromkeys(names))
+        for name in self._names:
+            if name not in self._colors:
+                self._colors[name] = QColor(TREND_COLORS[len(self._colors) % len(TREND_COLORS)])
+        self._sync_timer()
+        self.refresh()
+
+    def set_span(self, span_s: float) -> None:
+        self.span_s = max(float(span_s), 1.0)
+        self.refresh()
+
+    def set_interval(self, interval_ms: int) -> None:
+        self._timer.setInterval(max(int(interval_ms), 1))
+
+    def refresh(self) -> None:
+        """Query the visible window and schedule a repaint."""
+        self._series = {}
+        recorded = self._source.span() if self._source is not None and self._names else None
+        # Follow the newest sample rather than the wall clock so a stopped run stays on screen.
+        stop = recorded[1] if recorded is not None else time.time()
+        start = stop - self.span_s
+        self._window = (start, stop)
+        if recorded is not None:
+            columns = max(int(self._plot_area().width()), 1)
+            self._series = self._source.query(self._names, start, stop, columns)
+        self.update()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._sync_timer()
+        self.refresh()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        area = self._plot_area()
+        painter.setPen(QPen(self.palette().mid().color(), 1.0))
+        painter.drawRect(area)
+
+        visible = [self._series[name] for name in self._names if name in self._series]
+        low, high = value_range(visible)
+        start, stop = self._window
+        painter.setPen(self.palette().text().color())
+        painter.drawText(area.adjusted(4, 2, -4, -2), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, f"{high:.3f}")
+        painter.drawText(area.adjusted(4, 2, -4, -2), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, f"{low:.3f}")
+
+        painter.setClipRect(area)
+        for item in visible:
+            painter.setPen(QPen(self._colors[item.name], 1.0))
+            for polyline in envelope_polylines(item, area, start, stop, low, high):
+                painter.drawPolyline(polyline)
+        painter.setClipping(False)
+
+        metrics = painter.fontMetrics()
+        y = area.top() + metrics.height()
+        for name in self._names:
+            painter.setPen(self._colors[name])
+            painter.drawText(QPointF(area.left() + 4.0, y), name)
+            y += metrics.height()
+        painter.end()
+
+    def _plot_area(self) -> QRectF:
+        margin = self.MARGIN
+        return QRectF(margin, margin, max(self.width() - 2 * margin, 1.0), max(self.height() - 2 * margin, 1.0))
+
+    def _sync_timer(self) -> None:
+        if self._names and self.isVisible():
+            self._timer.start()
+        else:
+            self._timer.stop()
@@ -5,7 +5,7 @@ import os
 import tempfile
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Generic, Iterable, Mapping, TypeVar
 
 from domain.models import ConfiguredModel, DeviceRecord, FlowPath, PlantPaxModule
 from core.plantpax_discovery import PlantPaxDiscoveryService
@@ -15,12 +15,77 @@ SCHEMA_VERSION = 3
 PROJECT_EXTENSION = ".pysimio"
 
 
+T = TypeVar("T")
+
+
+class _IndexedRecords(Generic[T]):
+    """Ordered typed records with a lazily built casefolded first-occurrence index.
+
+    Duplicate keys are kept (validation reports them); lookups and upserts act on
+    the first record with a given key, as the list scans they replace did.
+    """
+
+    def __init__(self, key: Callable[[T], str]) -> None:
+        self._key = key
+        self.items: list[T] = []
+        self._index: dict[str, int] | None = None
+
+    def replace(self, items: Iterable[T]) -> None:
+        self.items = list(items)
+        self._index = None
+
+    def index(self) -> dict[str, int]:
+        if self._index is None:
+            index: dict[str, int] = {}
+            for position, item in enumerate(self.items):
+                index.setdefault(self._key(item), position)
+            self._index = index
+        return self._index
+
+    def find(self, key: str) -> T | None:
+        position = self.index().get(key.casefold())
+        return None if position is None else self.items[position]
+
+    def upsert(self, item: T) -> T | None:
+        """Replace the record with the same key in place, or append; return the replaced one."""
+        index = self.index()
+        key = self._key(item)
+        position = index.get(key)
+        if position is None:
+            index[key] = len(self.items)
+            self.items.append(item)
+            return None
+        previous = self.items[position]
+        self.items[position] = item
+        return previous
+
+    def remove(self, keys: Iterable[str]) -> int:
+        drop = {key.casefold() for key in keys}
+        kept = [item for item in self.items if self._key(item) not in drop]
+        removed = len(self.items) - len(kept)
+        if removed:
+            self.replace(kept)
+        return removed
+
+
 class ProjectStore:
-    """In-memory project document with explicit, atomic file saves."""
+    """In-memory project document with explicit, atomic file saves.
+
+    Models, devices, flow paths, and discovered modules are held as typed objects
+    indexed by casefolded identity and serialized only by ``document()``/``save()``.
+    Getters return copies so callers can edit them freely before upserting.
+    """
 
     def __init__(self, path: str | Path | None = None):
         self.path: Path | None = self._normalize_path(path) if path else None
         self._document: dict[str, Any] = self.empty_document()
+        self._models: _IndexedRecords[ConfiguredModel] = _IndexedRecords(lambda item: item.name.casefold())
+        self._models_by_tag: dict[str, ConfiguredModel] | None = None
+        # Stored models are replaced rather than edited, so each hash holds until then.
+        self._model_fingerprints: dict[int, str] = {}
+        self._devices: _IndexedRecords[DeviceRecord] = _IndexedRecords(lambda item: item.identity)
+        self._flow_paths: _IndexedRecords[FlowPath] = _IndexedRecords(lambda item: item.name.casefold())
+        self._discovered_modules: list[PlantPaxModule] = []
         self._dirty = False
 
     @staticmethod
@@ -49,7 +114,7 @@ class ProjectStore:
 
     def new(self) -> dict[str, Any]:
         self.path = None
-        self._document = self.empty_document()
+        self._set_document(self.empty_document())
         self._dirty = False
         return self.document()
 
@@ -60,7 +125,7 @@ class ProjectStore:
         if not force:
             return self.document()
         if self.path is None:
-            self._document = self.empty_document()
+            self._set_document(self.empty_document())
             self._dirty = False
             return self.document()
         if not self.path.exists():
@@ -69,7 +134,7 @@ class ProjectStore:
             raw = json.loads(self.path.read_text(encoding="utf-8") or "{}")
         except (OSError, json.JSONDecodeError) as exc:
             raise ValueError(f"Unable to read project file {self.path}: {exc}") from exc
-        self._document = self._normalize(raw)
+        self._set_document(self._normalize(raw))
         self._dirty = False
         return self.document()
 
@@ -78,19 +143,19 @@ class ProjectStore:
 
     def save(self, document: Mapping[str, Any] | None = None, *, path: str | Path | None = None) -> Path:
         if document is not None:
-            self._document = self._normalize(document)
+            self._set_document(self._normalize(document))
             self._dirty = True
         if path is not None:
             self.path = self._normalize_path(path)
         if self.path is None:
             raise ValueError("A project path is required. Use Save As first.")
 
-        normalized = self._normalize(self._document)
+        serialized = self._serialize()
         self.path.parent.mkdir(parents=True, exist_ok=True)
         fd, temp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent)
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                json.dump(normalized, handle, indent=2, sort_keys=False)
+                json.dump(serialized, handle, indent=2, sort_keys=False)
                 handle.write("\n")
                 handle.flush()
                 os.fsync(handle.fileno())
@@ -101,7 +166,6 @@ class ProjectStore:
             except OSError:
                 pass
             raise
-        self._document = normalized
         self._dirty = False
         return self.path
 
@@ -109,109 +173,122 @@ class ProjectStore:
         return self.save(path=path)
 
     def document(self) -> dict[str, Any]:
-        return deepcopy(self._document)
+        return self._serialize()
 
     def get_models(self) -> list[ConfiguredModel]:
-        return [ConfiguredModel.from_dict(item) for item in self._document["models"]]
+        return [item.copy() for item in self._models.items]
+
+    def model_fingerprints(self) -> list[str]:
+        """Content hashes of ``get_models()``, in order; each is computed once per stored edit."""
+        cache = self._model_fingerprints
+        fingerprints: list[str] = []
+        for item in self._models.items:
+            fingerprint = cache.get(id(item))
+            if fingerprint is None:
+                fingerprint = cache[id(item)] = item.fingerprint()
+            fingerprints.append(fingerprint)
+        return fingerprints
+
+    def get_model(self, name: str) -> ConfiguredModel | None:
+        item = self._models.find(name)
+        return None if item is None else item.copy()
+
+    def find_model_by_tag(self, tag: str) -> ConfiguredModel | None:
+        item = self._model_tag_index().get(tag.casefold())
+        return None if item is None else item.copy()
 
     def set_models(self, models: Iterable[ConfiguredModel]) -> None:
-        self._document["models"] = [item.to_dict() for item in models]
+        self._models.replace(item.copy() for item in models)
+        self._models_by_tag = None
+        self._model_fingerprints.clear()
         self._dirty = True
 
     def upsert_model(self, model: ConfiguredModel) -> None:
-        items = self.get_models()
-        key = model.name.casefold()
-        for index, current in enumerate(items):
-            if current.name.casefold() == key:
-                items[index] = model
-                break
-        else:
-            items.append(model)
-        self.set_models(items)
+        previous = self._models.upsert(model.copy())
+        if previous is not None:
+            self._model_fingerprints.pop(id(previous), None)
+        self._models_by_tag = None
+        self._dirty = True
 
     def remove_model(self, name: str) -> bool:
-        items = self.get_models()
-        kept = [item for item in items if item.name.casefold() != name.casefold()]
-        if len(kept) == len(items):
+        if not self._models.remove((name,)):
             return False
-        self.set_models(kept)
+        self._models_by_tag = None
+        self._model_fingerprints.clear()
+        self._dirty = True
         return True
 
     def get_devices(self) -> list[DeviceRecord]:
-        return [DeviceRecord.from_dict(item) for item in self._document["devices"]]
+        return [item.copy() for item in self._devices.items]
 
     def set_devices(self, devices: Iterable[DeviceRecord]) -> None:
-        self._document["devices"] = [item.to_dict() for item in devices]
+        self._devices.replace(item.copy() for item in devices)
         self._dirty = True
 
     def upsert_device(self, device: DeviceRecord) -> None:
-        items = self.get_devices()
-        identity = device.controller_path.casefold() or device.name.casefold()
-        for index, current in enumerate(items):
-            current_identity = current.controller_path.casefold() or current.name.casefold()
-            if current_identity == identity:
-                # Preserve user ownership while refreshing discovery metadata.
-                source = current.source if current.source == "manual" else device.source
-                items[index] = DeviceRecord(
-                    name=device.name,
-                    data_type=device.data_type,
-                    category=device.category,
-                    controller_path=device.controller_path,
-                    source=source,
-                )
-                break
-        else:
-            items.append(device)
-        self.set_devices(items)
+        current = self._devices.find(device.identity)
+        # Preserve user ownership while refreshing discovery metadata.
+        source = current.source if current is not None and current.source == "manual" else device.source
+        self._devices.upsert(
+            DeviceRecord(
+                name=device.name,
+                data_type=device.data_type,
+                category=device.category,
+                controller_path=device.controller_path,
+                source=source,
+            )
+        )
+        self._dirty = True
 
     def get_flow_paths(self) -> list[FlowPath]:
-        return [FlowPath.from_dict(item) for item in self._document["flow_paths"]]
+        return [item.copy() for item in self._flow_paths.items]
 
     def set_flow_paths(self, flow_paths: Iterable[FlowPath]) -> None:
-        self._document["flow_paths"] = [item.to_dict() for item in flow_paths]
+        self._flow_paths.replace(item.copy() for item in flow_paths)
         self._dirty = True
 
     def upsert_flow_path(self, flow_path: FlowPath, *, previous_name: str | None = None) -> None:
-        items = self.get_flow_paths()
-        keys = {flow_path.name.casefold()}
+        keys = {flow_path.name}
         if previous_name:
-            keys.add(previous_name.casefold())
-        items = [item for item in items if item.name.casefold() not in keys]
-        items.append(flow_path)
-        self.set_flow_paths(items)
+            keys.add(previous_name)
+        self._flow_paths.remove(keys)
+        self._flow_paths.upsert(flow_path.copy())
+        self._dirty = True
 
     def remove_flow_path(self, name: str) -> bool:
-        items = self.get_flow_paths()
-        kept = [item for item in items if item.name.casefold() != name.casefold()]
-        if len(kept) == len(items):
+        if not self._flow_paths.remove((name,)):
             return False
-        self.set_flow_paths(kept)
+        self._dirty = True
         return True
 
     def get_discovered_modules(self) -> list[PlantPaxModule]:
-        return [PlantPaxModule.from_dict(item) for item in self._document["discovered_modules"]]
+        return list(self._discovered_modules)
 
     def set_discovered_modules(self, modules: Iterable[PlantPaxModule]) -> None:
-        self._document["discovered_modules"] = [item.to_dict() for item in modules]
+        self._discovered_modules = list(modules)
         self._dirty = True
 
     def sync_discovered_modules(self, modules: Iterable[PlantPaxModule]) -> dict[str, list[str]]:
-        incoming = list(modules)
-        existing = self.get_models()
-        by_identity: dict[str, ConfiguredModel] = {}
-        for item in existing:
-            if item.name:
-                by_identity[item.name.casefold()] = item
-            if item.tag:
-                by_identity[item.tag.casefold()] = item
+        """Merge a discovery result into models and devices in one indexed pass.
+
+        Modules matching a model by name or tag refresh its discovery metadata;
+        new ones become inactive placeholder models. Devices are replaced by
+        identity, keeping ``manual`` ownership, and discovery-owned devices that
+        are no longer present are dropped and reported as ``removed``.
+        """
+        incoming = list({module.name.casefold(): module for module in modules if module.name}.values())
+        names = self._models.index()
+        tags = self._model_tag_index()
         added: list[str] = []
         matched: list[str] = []
         for module in incoming:
             key = module.name.casefold()
-            current = by_identity.get(key)
+            position = names.get(key)
+            current = self._models.items[position] if position is not None else tags.get(key)
             if current:
                 current.discovered_data_type = module.data_type
                 current.discovered_path = module.path
+                self._model_fingerprints.pop(id(current), None)
                 matched.append(module.name)
             else:
                 created = ConfiguredModel(
@@ -223,15 +300,30 @@ class ProjectStore:
                     discovered_data_type=module.data_type,
                     discovered_path=module.path,
                 )
-                existing.append(created)
-                by_identity[key] = created
+                self._models.upsert(created)
+                tags.setdefault(key, created)
                 added.append(module.name)
-        self._document["discovered_modules"] = [item.to_dict() for item in incoming]
-        self._document["models"] = [item.to_dict() for item in existing]
-        for device in PlantPaxDiscoveryService.to_device_records(incoming):
-            self.upsert_device(device)
+
+        discovered = {record.identity: record for record in PlantPaxDiscoveryService.to_device_records(incoming)}
+        devices: list[DeviceRecord] = []
+        removed: list[str] = []
+        for current in self._devices.items:
+            record = discovered.pop(current.identity, None)
+            if record is not None:
+                # Preserve user ownership while refreshing discovery metadata.
+                if current.source == "manual":
+                    record.source = "manual"
+                devices.append(record)
+            elif current.source == "plc_discovery":
+                removed.append(current.name)
+            else:
+                devices.append(current)
+        devices.extend(discovered.values())
+        self._devices.replace(devices)
+
+        self._discovered_modules = incoming
         self._dirty = True
-        return {"added": added, "matched": matched}
+        return {"added": added, "matched": matched, "removed": removed}
 
     def get_plc_profiles(self) -> list[dict[str, Any]]:
         return deepcopy(self._document["plc_profiles"])
@@ -251,6 +343,35 @@ class ProjectStore:
         self._document["metadata"].update(dict(values))
         self._dirty = True
 
+    def _model_tag_index(self) -> dict[str, ConfiguredModel]:
+        if self._models_by_tag is None:
+            index: dict[str, ConfiguredModel] = {}
+            for item in self._models.items:
+                if item.tag:
+                    index.setdefault(item.tag.casefold(), item)
+            self._models_by_tag = index
+        return self._models_by_tag
+
+    def _set_document(self, document: dict[str, Any]) -> None:
+        self._models.replace(ConfiguredModel.from_dict(item) for item in document.pop("models"))
+        self._models_by_tag = None
+        self._model_fingerprints.clear()
+        self._devices.replace(DeviceRecord.from_dict(item) for item in document.pop("devices"))
+        self._flow_paths.replace(FlowPath.from_dict(item) for item in document.pop("flow_paths"))
+        self._discovered_modules = [PlantPaxModule.from_dict(item) for item in document.pop("discovered_modules")]
+        self._document = document
+
+    def _serialize(self) -> dict[str, Any]:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "models": [item.to_dict() for item in self._models.items],
+            "flow_paths": [item.to_dict() for item in self._flow_paths.items],
+            "devices": [item.to_dict() for item in self._devices.items],
+            "discovered_modules": [item.to_dict() for item in self._discovered_modules],
+            "plc_profiles": deepcopy(self._document["plc_profiles"]),
+            "metadata": deepcopy(self._document["metadata"]),
+        }
+
     @staticmethod
     def _normalize_path(path: str | Path) -> Path:
         result = Path(path).expanduser()
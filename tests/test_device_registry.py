@@ -33,3 +33,43 @@ def test_registry_builds_and_applies_plantpax_valve_tag() -> None:
     assert devices.required_read_tags() == ["XV101.Sts_Open"]
     devices.apply_values({"XV101.Sts_Open": True})
     assert devices.is_valve_open("XV101")
+
+
+def test_read_plan_applies_analogs_and_resets_missing_tags() -> None:
+    pid = DeviceRecord(name="PIC_1", data_type="P_PID", category="control_variable", controller_path="PIC_1")
+    devices = DeviceRegistry([_valve("XV101"), pid])
+    assert devices.read_tags == ("XV101.Sts_Open", "PIC_1.CV")
+    assert devices.config_tags == ("PIC_1.Cfg_CVEUMin", "PIC_1.Cfg_CVEUMax")
+
+    devices.apply_values({"XV101.Sts_Open": 1, "PIC_1.CV": "42.5", "PIC_1.Cfg_CVEUMax": "bad"})
+    assert devices.is_valve_open("XV101")
+    assert devices.value("PIC_1") == 42.5
+
+    devices.apply_values({})
+    assert not devices.is_valve_open("XV101")
+    assert devices.value("PIC_1") is None
+
+
+def test_flow_paths_reevaluate_only_paths_touched_by_changed_valves() -> None:
+    devices = DeviceRegistry([_valve("XV101"), _valve("XV102"), _valve("XV201")])
+    paths = FlowPathRuntime(
+        [
+            FlowPath(name="Feed", segments=["XV101", "XV102"]),
+            FlowPath(name="Drain", segments=["XV201"]),
+        ]
+    )
+    assert set(paths.evaluate(devices)) == {"feed", "drain"}
+    assert paths.evaluate(devices) == {}
+
+    devices.apply_values({"XV201.Sts_Open": True})
+    assert set(paths.evaluate(devices)) == {"drain"}
+    assert paths.is_open("Drain") and not paths.is_open("Feed")
+
+    devices.set_valve_open("xv101", True)
+    devices.set_valve_open("XV102", True)
+    assert set(paths.evaluate(devices)) == {"feed"}
+    assert paths.is_open("Feed")
+
+    devices.rebuild([_valve("XV101"), _valve("XV102"), _valve("XV201")])
+    assert set(paths.evaluate(devices)) == {"feed", "drain"}
+    assert not paths.is_open("Feed")
@@ -0,0 +1,70 @@
+"""Headless engine runs without Qt or a PLC."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from core.engine import run
+from domain.models import ConfiguredModel, DeviceRecord, FlowPath
+from persistence.project_store import ProjectStore
+
+
+def _flow_models() -> list[ConfiguredModel]:
+    return [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 50.0}),
+        ConfiguredModel(
+            name="Flow",
+            type="Flow",
+            inputs={"control": "CV", "flow_path": "Feed"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0},
+        ),
+    ]
+
+
+def test_run_records_trajectories_for_every_component() -> None:
+    result = run(_flow_models()[:1], duration=1.0, dt=0.25)
+    assert list(result.times) == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert list(result.trajectory("CV")) == [50.0] * 5
+
+
+def test_run_uses_project_flow_paths_and_valve_states(tmp_path: Path) -> None:
+    store = ProjectStore(tmp_path / "plant.pysimio")
+    store.set_models(_flow_models())
+    store.set_devices([DeviceRecord("XV101", "P_VALVE_DISCRETE", "valve", "XV101")])
+    store.set_flow_paths([FlowPath(name="Feed", segments=["XV101"])])
+
+    closed = run(store, duration=10.0, dt=0.5, record_every=4)
+    opened = run(store, duration=10.0, dt=0.5, record_every=4, valve_states={"XV101": True})
+    assert len(opened.times) == 6
+    assert closed.final_values()["Flow"] == 0.0
+    assert opened.final_values()["Flow"] > 4.99
+
+
+def test_run_rejects_invalid_models() -> None:
+    try:
+        run([ConfiguredModel(name="Bad", type="Flow")], duration=1.0, dt=0.1)
+    except ValueError as exc:
+        assert "Bad" in str(exc)
+    else:
+        raise AssertionError("Expected invalid models to fail")
+
+
+def test_engine_does_not_import_qt() -> None:
+    code = "import sys, core.engine; raise SystemExit('PyQt6' in sys.modules)"
+    root = Path(__file__).resolve().parents[1]
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+
+def test_background_runner_steps_on_its_own_thread() -> None:
+    import threading
+
+    from core.engine import BackgroundRunner
+
+    published = threading.Event()
+    runner = BackgroundRunner(_flow_models()[:1], 0.01, on_values=lambda values: published.set())
+    runner.start()
+    assert published.wait(2.0)
+    runner.stop(timeout=2.0)
+    assert not runner.is_running
+    assert runner.steps >= 1
+    assert runner.snapshot() == {"CV": 50.0}
@@ -0,0 +1,77 @@
+"""Unit tests for the in-memory historian."""
+
+import numpy as np
+
+from core.historian import Historian
+
+
+def _ramp(historian: Historian, samples: int) -> None:
+    for step in range(samples):
+        historian.record(float(step), np.array([float(step), -float(step)]))
+
+
+def test_raw_ring_is_bounded_and_recent_spans_are_raw() -> None:
+    historian = Historian(["A", "B"], capacity=16, factor=4, levels=3)
+    _ramp(historian, 1000)
+
+    assert len(historian) == 16
+    assert historian.latest("B") == -999.0
+    recent = historian.query(["A"], 990.0, 999.0, columns=100)["A"]
+    assert recent.level == 0
+    assert recent.times.tolist() == [float(step) for step in range(990, 1000)]
+    assert recent.minimum.tolist() == recent.maximum.tolist()
+
+
+def test_long_spans_use_min_max_levels_within_the_column_budget() -> None:
+    historian = Historian(["A", "B"], capacity=16, factor=4, levels=3)
+    _ramp(historian, 200)
+
+    series = historian.query(["A", "B"], 0.0, 199.0, columns=10)
+    assert series["A"].level == 2
+    assert len(series["A"]) <= 10
+    assert series["A"].minimum[0] == 0.0
+    assert series["A"].maximum[-1] == 199.0
+    assert series["B"].minimum[-1] == -199.0
+    assert np.all(series["A"].minimum <= series["A"].maximum)
+
+
+def test_signal_changes_keep_history_of_remaining_names() -> None:
+    historian = Historian(["A", "B"], capacity=16, factor=4, levels=2)
+    _ramp(historian, 8)
+    historian.set_signals(["B", "C"])
+    historian.record(8.0, np.array([-8.0, 1.0]))
+
+    assert "A" not in historian
+    assert historian.query(["B"], 0.0, 8.0, columns=100)["B"].maximum.tolist() == [-float(step) for step in range(9)]
+    assert np.isnan(historian.query(["C"], 0.0, 7.0, columns=100)["C"].maximum).all()
+    assert historian.latest("C") == 1.0
+
+
+def test_backwards_timestamps_are_clamped_not_dropped() -> None:
+    historian = Historian(["A"], capacity=16, factor=4, levels=2)
+    historian.record(100.0, np.array([1.0]))
+    historian.record(40.0, np.array([2.0]))
+
+    assert len(historian) == 2
+    assert historian.span() == (100.0, 100.0)
+    assert historian.latest("A") == 2.0
+
+
+def test_memory_budget_sizes_rings_by_signal_count_and_keeps_newest_rows() -> None:
+    # Two levels take 3 floats per signal per row: 16 rows of 2 signals fit 768 bytes.
+    historian = Historian(["A", "B"], capacity=64, factor=4, levels=2, max_bytes=768)
+    assert historian.capacity == 16
+    _ramp(historian, 40)
+
+    historian.set_signals(["B", "A", "C", "D"])
+    assert historian.capacity == 8
+    assert len(historian) == 8
+    raw = historian.query(["A", "B"], 32.0, 39.0, columns=100)
+    assert raw["A"].level == 0
+    assert raw["A"].maximum.tolist() == [float(step) for step in range(32, 40)]
+    assert raw["B"].maximum.tolist() == [-float(step) for step in range(32, 40)]
+
+    historian.set_signals(["A"])
+    assert historian.capacity == 32
+    assert len(historian) == 8
+    assert historian.latest("A") == 39.0
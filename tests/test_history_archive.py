@@ -0,0 +1,80 @@
+"""Tests for the memory-mapped history archive."""
+
+from pathlib import Path
+
+import numpy as np
+
+from persistence.history_archive import HistoryArchive
+
+
+def test_rows_are_chunked_by_size_and_signal_set_and_survive_reopen(tmp_path: Path) -> None:
+    archive = HistoryArchive(tmp_path, chunk_rows=4)
+    archive.start()
+    archive.set_signals(["A", "B"])
+    for step in range(6):
+        archive.append(float(step), np.array([float(step), 10.0 * step]))
+    archive.set_signals(["B", "C"])
+    for step in range(6, 8):
+        archive.append(float(step), np.array([10.0 * step, -1.0]))
+    assert archive.flush(timeout=5.0)
+    archive.close()
+
+    reopened = HistoryArchive(tmp_path)
+    assert [(chunk.signals, chunk.rows) for chunk in reopened.chunks()] == [
+        (("A", "B"), 4),
+        (("A", "B"), 2),
+        (("B", "C"), 2),
+    ]
+    times, values = reopened.read(["B"], 3.0, 6.0)["B"]
+    assert times.tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert values.tolist() == [30.0, 40.0, 50.0, 60.0]
+    assert set(reopened.read(["A", "C", "Missing"], 6.0, 7.0)) == {"C"}
+
+    series = reopened.query(["B"], 0.0, 8.0, columns=2)["B"]
+    assert series.minimum.tolist() == [0.0, 40.0]
+    assert series.maximum.tolist() == [30.0, 70.0]
+
+
+def test_pending_rows_are_bounded_when_the_writer_falls_behind(tmp_path: Path) -> None:
+    archive = HistoryArchive(tmp_path, max_pending_rows=3)
+    archive.set_signals(["A"])
+    for step in range(5):
+        archive.append(float(step), np.array([float(step)]))
+    assert archive.dropped == 2
+    archive.flush()
+    assert archive.read(["A"], 0.0, 10.0)["A"][0].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_rows_are_written_in_whole_runs_until_flushed(tmp_path: Path) -> None:
+    archive = HistoryArchive(tmp_path, chunk_rows=8, run_rows=4)
+    archive.start()
+    archive.set_signals(["A", "B"])
+    for step in range(6):
+        archive.append(float(step), np.array([float(step), -float(step)]))
+    assert archive.flush(timeout=5.0, runs_only=True)
+    assert [chunk.rows for chunk in archive.chunks()] == [4]
+    assert archive.read(["A"], 0.0, 8.0)["A"][0].tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    assert archive.flush(timeout=5.0)
+    assert [chunk.rows for chunk in archive.chunks()] == [6]
+    for step in range(6, 8):
+        archive.append(float(step), np.array([float(step), -float(step)]))
+    assert archive.flush(timeout=5.0, runs_only=True)
+    assert [chunk.rows for chunk in archive.chunks()] == [8]
+    assert archive.read(["B"], 0.0, 8.0)["B"][1].tolist() == [-float(step) for step in range(8)]
+    archive.close()
+
+
+def test_oldest_chunks_are_deleted_beyond_max_bytes(tmp_path: Path) -> None:
+    # Each chunk of one signal and four rows takes 64 bytes.
+    archive = HistoryArchive(tmp_path, chunk_rows=4, max_bytes=128)
+    archive.set_signals(["A"])
+    for step in range(14):
+        archive.append(float(step), np.array([float(step)]))
+    archive.close()
+
+    assert [chunk.sequence for chunk in archive.chunks()] == [3, 4]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"chunk-{sequence:06d}.{suffix}" for sequence in (3, 4) for suffix in ("json", "times", "values")
+    ]
+    assert archive.read(["A"], 0.0, 20.0)["A"][0].tolist() == [float(step) for step in range(8, 14)]
@@ -0,0 +1,106 @@
+from itertools import count
+
+from core.plc_sim_bridge import PlcSimBridge, WriteDeadband
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bridge_writes_slow_sources_on_their_rate_group() -> None:
+    writes: list[str] = []
+    fast, slow = count(), count()
+    bridge = PlcSimBridge(lambda tag, value: writes.append(tag) or True)
+    bridge.register_source("FAST", lambda: float(next(fast)))
+    bridge.register_source("SLOW", lambda: float(next(slow)), divisor=4)
+    bridge.start()
+    for _ in range(5):
+        bridge.tick()
+    assert writes.count("FAST") == 5
+    assert writes.count("SLOW") == 2
+
+
+def test_bridge_follows_the_callers_due_level() -> None:
+    writes: list[str] = []
+    fast, slow = count(), count()
+    bridge = PlcSimBridge(lambda tag, value: writes.append(tag) or True)
+    bridge.register_source("FAST", lambda: float(next(fast)))
+    bridge.register_source("SLOW", lambda: float(next(slow)), level=2)
+    bridge.start()
+    for level in (1, 0, 2, -1):
+        bridge.tick(level)
+    assert writes == ["FAST", "FAST", "FAST", "SLOW"]
+
+
+def test_bridge_skips_values_inside_deadband_until_heartbeat() -> None:
+    writes: list[tuple[str, float]] = []
+    clock = _Clock()
+    value = {"PV": 50.0}
+    bridge = PlcSimBridge(
+        lambda tag, item: writes.append((tag, item)) or True,
+        deadband=WriteDeadband(absolute=0.5),
+        max_age_s=5.0,
+        clock=clock,
+    )
+    bridge.register_source("PV", lambda: value["PV"])
+    bridge.start()
+
+    assert bridge.tick() == {"PV": True}
+    value["PV"] = 50.4
+    assert bridge.tick() == {}
+    value["PV"] = 50.6
+    assert bridge.tick() == {"PV": True}
+    clock.now = 5.0
+    assert bridge.tick() == {"PV": True}
+    assert writes == [("PV", 50.0), ("PV", 50.6), ("PV", 50.6)]
+
+
+def test_failed_write_is_retried_on_next_tick() -> None:
+    outcomes = iter([False, True])
+    bridge = PlcSimBridge(lambda tag, value: next(outcomes))
+    bridge.register_source("PV", lambda: 1.0, deadband=WriteDeadband(percent=10.0))
+    bridge.start()
+    assert bridge.tick() == {"PV": False}
+    assert bridge.tick() == {"PV": True}
+    assert bridge.tick() == {}
+
+
+def test_bridge_flushes_a_tick_through_one_batch_write() -> None:
+    batches: list[dict[str, float]] = []
+
+    def write_many(values: dict[str, float]) -> dict[str, bool]:
+        batches.append(dict(values))
+        return {tag: tag != "BAD" for tag in values}
+
+    bridge = PlcSimBridge(batch_write_fn=write_many)
+    for tag in ("A", "B", "BAD"):
+        bridge.register_source(tag, lambda: 1.0)
+    bridge.start()
+    assert bridge.tick() == {"A": True, "B": True, "BAD": False}
+    assert bridge.tick() == {"BAD": False}
+    assert batches == [{"A": 1.0, "B": 1.0, "BAD": 1.0}, {"BAD": 1.0}]
+
+
+def test_connection_manager_writes_many_tags_in_one_driver_call() -> None:
+    from types import SimpleNamespace
+
+    from core.plc_conn_mgr import PLCConnectionManager
+
+    class _Driver:
+        connected = True
+
+        def __init__(self) -> None:
+            self.calls: list[tuple] = []
+
+        def write(self, *items):
+            self.calls.append(items)
+            return [SimpleNamespace(tag=tag, error=None if tag != "B" else "bad") for tag, _ in items]
+
+    manager = PLCConnectionManager("127.0.0.1")
+    manager.driver = _Driver()
+    assert manager.write_tags({"A": 1.0, "B": 2.0}) == {"A": True, "B": False}
+    assert manager.driver.calls == [(("A", 1.0), ("B", 2.0))]
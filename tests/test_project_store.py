@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from domain.models import ConfiguredModel
+from domain.models import ConfiguredModel, DeviceRecord, PlantPaxModule
 from persistence.project_store import PROJECT_EXTENSION, ProjectStore
 
 
@@ -48,3 +48,55 @@ def test_invalid_project_shape_is_rejected(tmp_path: Path) -> None:
         assert "models" in str(exc)
     else:
         raise AssertionError("Expected invalid project structure to fail")
+
+
+def test_store_indexes_typed_records_and_hands_out_copies(tmp_path: Path) -> None:
+    store = ProjectStore()
+    store.set_models([ConfiguredModel(name="FIT_101", tag="Plant.FIT_101", params={"tau": 1})])
+    store.upsert_model(ConfiguredModel(name="fit_101", tag="Plant.FIT_101", params={"tau": 2}))
+    store.upsert_model(ConfiguredModel(name="LIT_101"))
+
+    assert [item.name for item in store.get_models()] == ["fit_101", "LIT_101"]
+    assert store.find_model_by_tag("plant.fit_101").params == {"tau": 2}
+
+    model = store.get_model("FIT_101")
+    model.params["tau"] = 99
+    assert store.get_model("FIT_101").params == {"tau": 2}
+
+    assert store.remove_model("lit_101")
+    assert store.get_model("LIT_101") is None
+
+    path = store.save_as(tmp_path / "plant")
+    reopened = ProjectStore()
+    reopened.open(path)
+    assert reopened.document()["models"] == store.document()["models"]
+
+
+def test_discovery_sync_merges_devices_and_keeps_manual_ownership() -> None:
+    store = ProjectStore()
+    store.set_models([ConfiguredModel(name="Flow 1", tag="FIT_101", type="Flow", active=True)])
+    store.set_devices(
+        [
+            DeviceRecord(name="XV101", data_type="P_D4SD", category="valve", controller_path="XV101", source="manual"),
+            DeviceRecord(name="XV900", data_type="P_D4SD", category="valve", controller_path="XV900", source="plc_discovery"),
+        ]
+    )
+    result = store.sync_discovered_modules(
+        [
+            PlantPaxModule(name="FIT_101", data_type="P_ANALOG_INPUT", path="FIT_101", module_type="process_variable"),
+            PlantPaxModule(name="XV101", data_type="P_VALVE_DISCRETE", path="XV101", module_type="valve"),
+        ]
+    )
+
+    assert result == {"added": ["XV101"], "matched": ["FIT_101"], "removed": ["XV900"]}
+    assert store.get_model("Flow 1").discovered_data_type == "P_ANALOG_INPUT"
+    devices = {item.name: item for item in store.get_devices()}
+    assert set(devices) == {"XV101", "FIT_101"}
+    assert devices["XV101"].source == "manual"
+    assert devices["XV101"].data_type == "P_VALVE_DISCRETE"
+    assert devices["FIT_101"].source == "plc_discovery"
+
+
+def test_update_period_accepts_decimal_strings() -> None:
+    assert ConfiguredModel.from_dict({"name": "A", "update_period_ms": "200.0"}).update_period_ms == 200
+    assert ConfiguredModel.from_dict({"name": "A", "update_period_ms": "fast"}).update_period_ms == 0
@@ -0,0 +1,26 @@
+from PyQt6.QtCore import QCoreApplication
+
+from domain.models import ConfiguredModel
+from gui.pv_table_model import ProcessVariableTableModel
+
+
+_app = QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_flush_emits_changes_only_for_reformatted_value_cells() -> None:
+    table = ProcessVariableTableModel(display_interval_ms=1000)
+    table.set_models([ConfiguredModel(name=name) for name in ("A", "B", "C", "D")], lambda model: "Ready")
+    changes: list[tuple[int, int, int]] = []
+    table.dataChanged.connect(lambda top, bottom, roles: changes.append((top.row(), bottom.row(), top.column())))
+
+    table.update_values({"A": 1.0, "B": 2.0, "D": 4.0})
+    table.update_values({"A": 1.5})
+    assert changes == []
+    table.flush()
+    assert changes == [(0, 1, 4), (3, 3, 4)]
+    assert table.data(table.index(0, 4)) == "1.500"
+
+    changes.clear()
+    table.update_values({"A": 1.5001, "B": 2.0, "C": 3.0})
+    table.flush()
+    assert changes == [(2, 2, 4)]
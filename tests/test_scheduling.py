@@ -0,0 +1,54 @@
+from core.scheduling import CatchUpPolicy, RateGroups, TickScheduler, harmonic_divisor
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_harmonic_divisor_snaps_down_to_power_of_two() -> None:
+    assert harmonic_divisor(0.0, 0.2) == 1
+    assert harmonic_divisor(0.4, 0.2) == 2
+    assert harmonic_divisor(2.0, 0.2) == 8
+
+
+def test_rate_groups_report_elapsed_time_per_due_level() -> None:
+    groups = RateGroups(max_level=1)
+    assert groups.advance(0.1) == (1, [0.1, 0.1])
+    assert groups.advance(0.1) == (0, [0.1])
+    assert groups.advance(0.3) == (1, [0.3, 0.4])
+
+
+def test_fixed_step_scheduler_absorbs_jitter_and_bursts_after_stall() -> None:
+    clock = _Clock()
+    scheduler = TickScheduler(0.2, clock=clock)
+    clock.now += 0.199
+    assert scheduler.poll() == [0.2]
+    clock.now += 0.202
+    assert scheduler.poll() == [0.2]
+    clock.now += 0.6
+    assert scheduler.poll() == [0.2, 0.2, 0.2]
+    assert scheduler.overruns == 1
+    assert scheduler.skipped_steps == 0
+
+
+def test_skip_and_slow_down_policies_run_a_single_step() -> None:
+    for policy in (CatchUpPolicy.SKIP, CatchUpPolicy.SLOW_DOWN):
+        clock = _Clock()
+        scheduler = TickScheduler(0.2, policy=policy, clock=clock)
+        clock.now += 1.0
+        assert scheduler.poll() == [0.2]
+        assert scheduler.skipped_steps == 4
+
+
+def test_variable_step_scheduler_feeds_real_elapsed_time() -> None:
+    clock = _Clock()
+    scheduler = TickScheduler(0.2, fixed_step=False, max_catch_up=2, clock=clock)
+    clock.now += 0.25
+    assert scheduler.poll() == [0.25]
+    clock.now += 3.0
+    assert scheduler.poll() == [0.4]
+    assert scheduler.overruns == 1
@@ -125,3 +125,213 @@ def test_temperature_paths_gate_heating_and_cooling_independently() -> None:
     assert result.orchestrator is not None
     result.orchestrator.update(1.0, is_path_open=lambda name: name == "Steam")
     assert result.components["Temperature"].current_value() == 100.0
+
+
+def test_sensor_lag_is_wired_once_and_delays_source() -> None:
+    models = [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+        ConfiguredModel(
+            name="Flow",
+            type="Flow",
+            inputs={"control": "CV"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0},
+        ),
+        ConfiguredModel(name="FT", type="Sensor", inputs={"source": "Flow"}, params={"lag_samples": 1}),
+    ]
+    result = build_simulation(models)
+    assert result.orchestrator is not None
+    result.orchestrator.update(0.5)
+    assert result.components["FT"].current_value() == 0.0
+    result.orchestrator.update(0.5)
+    assert result.components["FT"].current_value() == 5.0
+
+
+def test_first_order_bank_matches_unbanked_component() -> None:
+    from core.component_bank import FirstOrderBank
+    from core.simulator import FlowComponent, TemperatureComponent
+
+    banked = [FlowComponent("F", tau=2.0, initial=0.0), TemperatureComponent("T", tau=4.0, initial=20.0)]
+    plain = [FlowComponent("F", tau=2.0, initial=0.0), TemperatureComponent("T", tau=4.0, initial=20.0)]
+    bank = FirstOrderBank(banked)
+    for component, target in zip(banked + plain, (10.0, 80.0, 10.0, 80.0)):
+        component.set_target(target)
+    for _ in range(5):
+        bank.step(0.5)
+        for component in plain:
+            component.update(0.5)
+    assert [item.current_value() for item in banked] == [item.current_value() for item in plain]
+    bank.release()
+    assert not banked[0].is_banked
+    assert banked[0].current_value() == plain[0].current_value()
+
+
+def _tank_models(outflow: float) -> list[ConfiguredModel]:
+    return [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+        ConfiguredModel(
+            name="Feed",
+            type="Flow",
+            inputs={"control": "CV"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 0.5, "tau": 2, "initial": 0},
+        ),
+        ConfiguredModel(
+            name="Tank",
+            type="Level",
+            inputs={"inlet_paths": ["Feed"], "outlet_paths": ["Drain"]},
+            params={
+                "geom_mode": "Area + Height",
+                "area": 1,
+                "height": 2,
+                "level_unit": "m",
+                "initial": 0,
+                "outlet_sources": [{"mode": "static", "value": outflow, "unit": "m3/s"}],
+            },
+        ),
+    ]
+
+
+def _run_exact(dt: float, duration: float, *, outflow: float = 0.0) -> dict[str, float]:
+    from core.simulator import IntegrationMode
+
+    result = build_simulation(_tank_models(outflow), integration=IntegrationMode.EXACT)
+    assert result.orchestrator is not None
+    for _ in range(round(duration / dt)):
+        result.orchestrator.update(dt)
+    return {name: item.current_value() for name, item in result.components.items()}
+
+
+def test_exact_integration_is_independent_of_tick_size() -> None:
+    fine = _run_exact(0.05, 3.0)
+    coarse = _run_exact(1.0, 3.0)
+    assert abs(fine["Feed"] - coarse["Feed"]) < 1e-9
+    assert abs(fine["Tank"] - coarse["Tank"]) < 1e-9
+
+
+def test_exact_level_substeps_when_draining_against_empty_clamp() -> None:
+    fine = _run_exact(0.05, 6.0, outflow=0.25)
+    coarse = _run_exact(1.0, 6.0, outflow=0.25)
+    assert fine["Tank"] > 0.0
+    assert abs(fine["Tank"] - coarse["Tank"]) < 1e-6
+
+
+def test_exact_level_integrates_slower_rate_group_sources_analytically() -> None:
+    import math
+
+    from core.simulator import IntegrationMode
+
+    models = _tank_models(0.0)
+    models[1].update_period_ms = 800
+    models[2].params["height"] = 20
+    result = build_simulation(models, integration=IntegrationMode.EXACT, base_period=0.2)
+    assert result.orchestrator is not None
+    for _ in range(40):
+        result.orchestrator.update(0.2)
+    # Feed is 0.5 * (1 - exp(-t / 2)) m3/s, so the tank holds its integral over 8 s.
+    expected = 0.5 * (8.0 - 2.0 * (1.0 - math.exp(-4.0)))
+    assert abs(result.components["Tank"].current_value() - expected) < 1e-9
+
+
+def test_slow_rate_group_steps_with_elapsed_time() -> None:
+    models = [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+        ConfiguredModel(
+            name="Fast",
+            type="Flow",
+            inputs={"control": "CV"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 10, "initial": 0},
+        ),
+        ConfiguredModel(
+            name="Slow",
+            type="Flow",
+            update_period_ms=1000,
+            inputs={"control": "CV"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 10, "initial": 0},
+        ),
+    ]
+    result = build_simulation(models, base_period=0.25)
+    assert result.orchestrator is not None
+    result.orchestrator.update(0.25)
+    assert result.components["Slow"].current_value() == 0.25
+    for _ in range(3):
+        result.orchestrator.update(0.25)
+    assert result.components["Slow"].current_value() == 0.25
+    assert result.components["Fast"].current_value() > 0.9
+    result.orchestrator.update(0.25)
+    assert abs(result.components["Slow"].current_value() - 1.225) < 1e-12
+
+
+def test_incremental_rebuild_keeps_unchanged_state_and_seeds_edits() -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    models = [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+        ConfiguredModel(name="Flow", type="Flow", inputs={"control": "CV"}, params=dict(flow_params)),
+        ConfiguredModel(name="Other", type="Flow", inputs={"control": "CV"}, params=dict(flow_params)),
+        ConfiguredModel(name="Mirror", type="Sensor", inputs={"source": "Flow"}),
+    ]
+    first = build_simulation(models)
+    first.orchestrator.update(0.5)
+    other = first.components["Other"]
+
+    models[1] = ConfiguredModel(name="Flow", type="Flow", inputs={"control": "CV"}, params={**flow_params, "tau": 2})
+    second = build_simulation(models, previous=first)
+
+    assert second.components["Other"] is other
+    assert second.components["Flow"] is not first.components["Flow"]
+    assert second.components["Flow"].current_value() == 5.0
+    assert set(second.orchestrator.rewired) == {"Flow", "Mirror"}
+    assert other.current_value() == 5.0
+    second.orchestrator.update(0.5)
+    assert other.current_value() == 7.5
+    assert second.components["Flow"].current_value() == 6.25
+    assert second.components["Mirror"].current_value() == 6.25
+
+
+def test_value_store_mirrors_components_and_shares_bank_arrays() -> None:
+    import numpy as np
+
+    models = [
+        ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+        ConfiguredModel(
+            name="Flow",
+            type="Flow",
+            inputs={"control": "CV"},
+            params={"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0},
+        ),
+    ]
+    result = build_simulation(models)
+    store = result.orchestrator.values
+    assert store.names == ("Flow", "CV")
+    assert np.shares_memory(result.orchestrator.banks[0].value, store.values)
+
+    published = store.values.copy()
+    result.orchestrator.update(0.5)
+    assert store.snapshot() == {name: component.current_value() for name, component in result.components.items()}
+    assert store.changed_since(published, 0.01) == {"Flow": 5.0}
+    assert store.changed_since(published, 0.01) == {}
+
+
+def test_update_reads_externals_and_path_flags_by_symbol_id() -> None:
+    from core.symbols import SymbolTable
+
+    symbols = SymbolTable(["Unrelated"])
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    models = [
+        ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV", "flow_path": "Feed"}, params=flow_params),
+        ConfiguredModel(name="F2", type="Flow", inputs={"control": "pic_1.cv"}, params=flow_params),
+    ]
+    result = build_simulation(models, symbols=symbols)
+    orchestrator = result.orchestrator
+    tag, feed = symbols.id_of("PIC_1.CV"), symbols.id_of("feed")
+    assert orchestrator.external_refs == ((tag, "PIC_1.CV"),)
+
+    external = [None] * len(symbols)
+    external[tag] = 100.0
+    flags = [True] * len(symbols)
+    flags[feed] = False
+    orchestrator.update(0.5, external_values=external, path_flags=flags)
+    assert result.components["F1"].current_value() == 0.0
+    assert result.components["F2"].current_value() == 5.0
+
+    rebuilt = build_simulation(models, previous=result)
+    assert rebuilt.orchestrator.symbols is symbols
+    assert rebuilt.orchestrator.rewired == ()
@@ -5,7 +5,7 @@ from pathlib import Path
 from PyQt6.QtCore import QCoreApplication
 
 from core.simulation_manager import RuntimeState, SimulationManager
-from domain.models import ConfiguredModel, FlowPath, PlantPaxModule
+from domain.models import ConfiguredModel, DeviceRecord, FlowPath, PlantPaxModule
 from persistence.project_store import ProjectStore
 
 
@@ -74,3 +74,264 @@ def test_discovery_sync_is_testable_without_plc(tmp_path: Path) -> None:
     )
     assert result["added"] == ["FIT_101"]
     assert store.get_models()[0].source == "plc_discovery"
+
+
+class _FakePlc:
+    def __init__(self, values: dict[str, float]) -> None:
+        self.values = values
+        self.batches: list[list[str]] = []
+        self.single_reads: list[str] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    def read_tags(self, tags: list[str]) -> dict[str, float]:
+        self.batches.append(list(tags))
+        return {tag: self.values[tag] for tag in tags if tag in self.values}
+
+    def read_tag(self, tag: str) -> float | None:
+        self.single_reads.append(tag)
+        return self.values.get(tag)
+
+    def write_tag(self, tag: str, value: float) -> bool:
+        return True
+
+
+def test_external_controls_are_read_in_one_batch_per_tick(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(
+        tmp_path,
+        [
+            ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params),
+            ConfiguredModel(name="F2", type="Flow", inputs={"control": "PIC_2.CV"}, params=flow_params),
+        ],
+    )
+    plc = _FakePlc({"PIC_1.CV": 100.0, "PIC_2.CV": 50.0})
+    runtime = SimulationManager(store, plc=plc)
+    assert runtime.start()
+    runtime.tick()
+    assert plc.batches == [["PIC_1.CV", "PIC_2.CV"]]
+    assert plc.single_reads == []
+    assert runtime.current_values() == {"F1": 2.0, "F2": 1.0}
+    assert runtime.historian.latest("F1") == 2.0
+    runtime.stop()
+
+
+def test_eu_ranges_are_read_on_connect_and_on_demand_only(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params)])
+    store.set_devices([DeviceRecord(name="PIC_1", data_type="P_PID", category="control_variable", controller_path="PIC_1")])
+    plc = _FakePlc({"PIC_1.CV": 40.0, "PIC_1.Cfg_CVEUMin": 0.0, "PIC_1.Cfg_CVEUMax": 80.0})
+    runtime = SimulationManager(store, plc=plc)
+    assert runtime.start()
+    runtime.tick()
+    runtime.tick()
+    runtime.refresh_device_config()
+    runtime.tick()
+    runtime.stop()
+
+    ranges = ["PIC_1.Cfg_CVEUMin", "PIC_1.Cfg_CVEUMax"]
+    assert plc.batches == [["PIC_1.CV", *ranges], ["PIC_1.CV"], ["PIC_1.CV", *ranges]]
+    assert runtime.device_registry.eu_range("PIC_1") == (0.0, 80.0)
+    assert runtime.device_registry.value("PIC_1") == 40.0
+
+
+def test_tick_phases_are_timed_into_rolling_statistics(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params)])
+    runtime = SimulationManager(store, plc=_FakePlc({"PIC_1.CV": 100.0}))
+    timings = []
+    runtime.tick_timed.connect(timings.append)
+    assert runtime.start()
+    for _ in range(3):
+        runtime.tick()
+    runtime.stop()
+
+    assert len(timings) == 3
+    assert set(timings[-1].phases) == {"scan", "flow_paths", "update", "write", "publish"}
+    stats = runtime.tick_statistics()
+    assert stats["total"].count == 3
+    assert 0.0 <= stats["update"].p50 <= stats["update"].p95 <= stats["update"].max
+    assert runtime.tick_overrun is False
+
+
+def test_values_delta_carries_only_moved_values_between_snapshots(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(
+        tmp_path,
+        [
+            ConfiguredModel(name="CV", type="Sensor", params={"initial": 100.0}),
+            ConfiguredModel(name="Flow", type="Flow", inputs={"control": "CV"}, params=flow_params),
+        ],
+    )
+    runtime = SimulationManager(store, delta_epsilon=0.01, snapshot_interval_s=3600.0)
+    deltas: list[dict] = []
+    snapshots: list[dict] = []
+    runtime.values_delta.connect(deltas.append)
+    runtime.values_changed.connect(snapshots.append)
+    assert runtime.start()
+    snapshots.clear()
+    runtime.tick(dt=0.5)
+    runtime.tick(dt=20.0)
+    runtime.tick(dt=1.0)
+    runtime.stop()
+
+    assert deltas == [{"Flow": 5.0}, {"Flow": 10.0}]
+    assert snapshots == []
+    runtime.publish_snapshot()
+    assert snapshots == [{"CV": 100.0, "Flow": 10.0}]
+
+
+def test_threaded_runtime_ticks_off_the_caller_thread(tmp_path: Path) -> None:
+    import threading
+    import time
+
+    tick_threads: set[int] = set()
+    received: list[dict] = []
+
+    class _Recording(SimulationManager):
+        def _run_steps(self, steps) -> None:
+            tick_threads.add(threading.get_ident())
+            super()._run_steps(steps)
+
+    store = _store(tmp_path, [ConfiguredModel(name="CV", type="Sensor", params={"initial": 5.0})])
+    runtime = _Recording(store, interval_ms=10, threaded=True, snapshot_interval_s=0.0)
+    runtime.values_changed.connect(received.append)
+    assert runtime.is_threaded
+    assert runtime.start()
+    deadline = time.monotonic() + 2.0
+    while not tick_threads and time.monotonic() < deadline:
+        _app.processEvents()
+        time.sleep(0.01)
+    runtime.close()
+    _app.processEvents()
+    assert tick_threads and threading.get_ident() not in tick_threads
+    assert received and received[-1] == {"CV": 5.0}
+
+
+def test_ticks_are_archived_off_the_tick_thread(tmp_path: Path) -> None:
+    store = _store(tmp_path, [ConfiguredModel(name="CV", type="Sensor", params={"initial": 5.0})])
+    runtime = SimulationManager(store, archive_dir=tmp_path / "history")
+    assert runtime.archive.is_running
+    assert runtime.start()
+    for _ in range(3):
+        runtime.tick()
+    runtime.close()
+
+    times, values = runtime.archive.read(["CV"], 0.0, float("inf"))["CV"]
+    assert len(times) == 3
+    assert values.tolist() == [5.0, 5.0, 5.0]
+
+
+def test_slow_plc_io_does_not_hold_the_runtime_lock(tmp_path: Path) -> None:
+    import threading
+
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params)])
+    reading, release = threading.Event(), threading.Event()
+
+    class _SlowPlc(_FakePlc):
+        def read_tags(self, tags: list[str]) -> dict[str, float]:
+            reading.set()
+            release.wait(5.0)
+            return super().read_tags(tags)
+
+    runtime = SimulationManager(store, plc=_SlowPlc({"PIC_1.CV": 100.0}))
+    assert runtime.start()
+    ticking = threading.Thread(target=runtime.tick)
+    ticking.start()
+    assert reading.wait(5.0)
+
+    finished = threading.Event()
+
+    def _gui_calls() -> None:
+        runtime.current_values()
+        runtime.tick_statistics()
+        runtime.validate()
+        finished.set()
+
+    threading.Thread(target=_gui_calls).start()
+    assert finished.wait(1.0)
+    release.set()
+    ticking.join(5.0)
+    assert runtime.current_values() == {"F1": 2.0}
+    runtime.stop()
+
+
+def test_close_waits_for_a_tick_in_plc_io_before_closing_the_driver(tmp_path: Path) -> None:
+    import threading
+
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params)])
+    reading, release = threading.Event(), threading.Event()
+    events: list[str] = []
+
+    class _BlockingPlc(_FakePlc):
+        def read_tags(self, tags: list[str]) -> dict[str, float]:
+            events.append("read-start")
+            reading.set()
+            release.wait(5.0)
+            events.append("read-end")
+            return super().read_tags(tags)
+
+        def close(self) -> None:
+            events.append("close")
+
+    runtime = SimulationManager(store, plc=_BlockingPlc({"PIC_1.CV": 100.0}))
+    assert runtime.start()
+    ticking = threading.Thread(target=runtime.tick)
+    ticking.start()
+    assert reading.wait(5.0)
+
+    closing = threading.Thread(target=runtime.close)
+    closing.start()
+    closing.join(0.2)
+    assert closing.is_alive()
+    release.set()
+    closing.join(5.0)
+    ticking.join(5.0)
+    assert events == ["read-start", "read-end", "close"]
+
+
+def test_eu_ranges_are_retried_after_an_empty_read_and_reread_on_reconnect(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [ConfiguredModel(name="F1", type="Flow", inputs={"control": "PIC_1.CV"}, params=flow_params)])
+    store.set_devices([DeviceRecord(name="PIC_1", data_type="P_PID", category="control_variable", controller_path="PIC_1")])
+    plc = _FakePlc({})
+    connected = [True]
+    plc.is_connected = lambda: connected[0]
+    runtime = SimulationManager(store, plc=plc)
+    assert runtime.start()
+    runtime.tick()
+    plc.values.update({"PIC_1.CV": 40.0, "PIC_1.Cfg_CVEUMin": 0.0, "PIC_1.Cfg_CVEUMax": 80.0})
+    runtime.tick()
+    runtime.tick()
+    connected[0] = False
+    runtime.tick()
+    connected[0] = True
+    runtime.tick()
+    runtime.stop()
+
+    full = ["PIC_1.CV", "PIC_1.Cfg_CVEUMin", "PIC_1.Cfg_CVEUMax"]
+    assert plc.batches == [full, full, ["PIC_1.CV"], full]
+    assert runtime.device_registry.eu_range("PIC_1") == (0.0, 80.0)
+
+
+def test_reset_after_renames_reads_only_live_tags(tmp_path: Path) -> None:
+    flow_params = {"cv_min": 0, "cv_max": 100, "pv_min": 0, "pv_max": 10, "tau": 1, "initial": 0}
+    store = _store(tmp_path, [])
+    plc = _FakePlc({"PIC_9.CV": 100.0})
+    runtime = SimulationManager(store, plc=plc)
+    for index in range(10):
+        store.set_models(
+            [ConfiguredModel(name="F1", type="Flow", inputs={"control": f"PIC_{index}.CV"}, params=flow_params)]
+        )
+        runtime.build()
+
+    runtime.reset()
+    assert runtime.value_store.names == ("F1",)
+    assert runtime.start()
+    runtime.tick()
+    assert plc.batches[-1] == ["PIC_9.CV"]
+    assert runtime.current_values() == {"F1": 2.0}
+    runtime.stop()
@@ -3,6 +3,7 @@ from core.simulation_validation import (
     ValidationSeverity,
 )
 from domain.models import ConfiguredModel
+from persistence.project_store import ProjectStore
 
 
 def test_active_offline_model_is_warning_not_error() -> None:
@@ -24,3 +25,56 @@ def test_duplicate_names_are_errors() -> None:
     )
     assert not report.is_valid
     assert "Model names must be unique." in report.by_model()["PV"]
+
+
+def test_revalidation_only_checks_changed_models_and_referrers() -> None:
+    class _Counting(SimulationValidator):
+        def __init__(self) -> None:
+            super().__init__()
+            self.checked: list[str] = []
+
+        def validate_model(self, model):
+            self.checked.append(model.name)
+            return super().validate_model(model)
+
+    validator = _Counting()
+    models = [
+        ConfiguredModel(name="Flow", type="Sensor"),
+        ConfiguredModel(name="Mirror", type="Sensor", inputs={"source": "Flow"}),
+        ConfiguredModel(name="Other", type="Sensor"),
+    ]
+    assert validator.validate(models).warnings == []
+    assert validator.checked == ["Flow", "Mirror", "Other"]
+
+    validator.checked.clear()
+    models[0] = ConfiguredModel(name="Renamed", type="Sensor")
+    report = validator.validate(models)
+    assert validator.checked == ["Renamed"]
+    assert [issue.model_name for issue in report.warnings] == ["Mirror"]
+    assert report.errors_for("Mirror") == []
+
+
+def test_warm_validate_does_not_rehash_unchanged_stored_models(monkeypatch) -> None:
+    hashed: list[str] = []
+    fingerprint = ConfiguredModel.fingerprint
+
+    def _counting(model):
+        hashed.append(model.name)
+        return fingerprint(model)
+
+    monkeypatch.setattr(ConfiguredModel, "fingerprint", _counting)
+    store = ProjectStore()
+    store.set_models(ConfiguredModel(name=f"PV_{index}", type="Sensor") for index in range(50))
+    validator = SimulationValidator()
+    validator.validate(store.get_models(), store.model_fingerprints())
+    assert len(hashed) == 50
+
+    hashed.clear()
+    for _ in range(3):
+        validator.validate(store.get_models(), store.model_fingerprints())
+    assert hashed == []
+
+    store.upsert_model(ConfiguredModel(name="PV_7", type="Sensor", tag="Edited"))
+    report = validator.validate(store.get_models(), store.model_fingerprints())
+    assert hashed == ["PV_7"]
+    assert report.is_valid
@@ -0,0 +1,29 @@
+"""Tests for the trend plot geometry helpers."""
+
+import numpy as np
+from PyQt6.QtCore import QRectF
+
+from core.historian import TrendSeries
+from gui.trend_widget import envelope_polylines, value_range
+
+
+def _series(minimum: list[float], maximum: list[float]) -> TrendSeries:
+    times = np.arange(len(minimum), dtype=np.float64)
+    return TrendSeries("A", times, np.array(minimum), np.array(maximum), level=1)
+
+
+def test_envelope_draws_one_stroke_per_column_and_splits_at_gaps() -> None:
+    series = _series([0.0, 2.0, np.nan, 5.0], [1.0, 2.0, np.nan, 10.0])
+    polylines = envelope_polylines(series, QRectF(0.0, 0.0, 40.0, 100.0), 0.0, 4.0, 0.0, 10.0)
+
+    assert [polyline.size() for polyline in polylines] == [3, 2]
+    first = [(point.x(), point.y()) for point in polylines[0]]
+    assert first == [(0.0, 90.0), (0.0, 100.0), (10.0, 80.0)]
+    assert [(point.x(), point.y()) for point in polylines[1]] == [(30.0, 0.0), (30.0, 50.0)]
+
+
+def test_value_range_pads_and_widens_flat_traces() -> None:
+    assert value_range([]) == (0.0, 1.0)
+    assert value_range([_series([0.0, 5.0], [5.0, 10.0])]) == (-0.5, 10.5)
+    low, high = value_range([_series([4.0], [4.0])])
+    assert low < 4.0 < high